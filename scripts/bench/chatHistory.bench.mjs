@@ -0,0 +1,43 @@
+/**
+ * Chat history micro-benchmark
+ * Copy-on-append arrays (the previous chatStore.addMessage) vs the chunked list:
+ * time per append, and how many references each append copies, as the history grows.
+ *
+ *   node scripts/bench/chatHistory.bench.mjs [messages=20000] [batch=500]
+ */
+import { performance } from 'node:perf_hooks';
+import { EMPTY_LIST, append } from '../../src/lib/chunkedList.js';
+
+const MESSAGES = Number(process.argv[2]) || 20000;
+const BATCH = Number(process.argv[3]) || 500;
+const CHUNK_SIZE = 64;
+
+const message = (i) => ({ id: i, role: i % 2 ? 'ai' : 'user', text: `Message ${i}` });
+
+const strategies = {
+    array: { empty: [], add: (list, item) => [...list, item], copied: (n) => n },
+    chunked: { empty: EMPTY_LIST, add: append, copied: (n) => (n % CHUNK_SIZE) + Math.ceil(n / CHUNK_SIZE) }
+};
+
+const timings = {};
+for (const [name, { empty, add }] of Object.entries(strategies)) {
+    let list = empty;
+    timings[name] = [];
+    for (let done = 0; done < MESSAGES; done += BATCH) {
+        const start = performance.now();
+        for (let i = done; i < done + BATCH; i++) list = add(list, message(i));
+        timings[name].push(((performance.now() - start) * 1000) / BATCH);
+    }
+}
+
+const rows = Math.min(5, timings.array.length);
+const step = Math.floor(timings.array.length / rows);
+console.log(`${MESSAGES} appends, timed in batches of ${BATCH}\n`);
+console.log(`${'history'.padEnd(10)}${'array µs'.padStart(10)}${'copied'.padStart(8)}${'chunked µs'.padStart(12)}${'copied'.padStart(8)}`);
+for (let r = 1; r <= rows; r++) {
+    const batch = r * step - 1;
+    const size = (batch + 1) * BATCH;
+    console.log(`${String(size).padEnd(10)}`
+        + `${timings.array[batch].toFixed(2).padStart(10)}${String(strategies.array.copied(size)).padStart(8)}`
+        + `${timings.chunked[batch].toFixed(2).padStart(12)}${String(strategies.chunked.copied(size)).padStart(8)}`);
+}
@@ -0,0 +1,76 @@
+/**
+ * Operator store micro-benchmark
+ * Array scans (the previous operatorApi implementation) vs KeyedCollection for the
+ * lookups admin pages hit after a bulk import.
+ *
+ *   node scripts/bench/operatorStore.bench.mjs [records=10000] [lookups=2000]
+ */
+import { performance } from 'node:perf_hooks';
+import { KeyedCollection } from '../../src/services/keyedCollection.js';
+
+const RECORDS = Number(process.argv[2]) || 10000;
+const LOOKUPS = Number(process.argv[3]) || 2000;
+const REGIONS = ['GLOBAL', 'NA', 'LATAM', 'APAC', 'EMEA'];
+
+const materials = Array.from({ length: RECORDS }, (_, i) => ({
+    materialId: `mat_${i}`, title: `Material ${i}`, status: i % 3 ? 'published' : 'draft'
+}));
+const quizzes = Array.from({ length: RECORDS }, (_, i) => ({
+    quizId: `quiz_${i}`, materialId: `mat_${i % (RECORDS / 2)}`, title: `Quiz ${i}`
+}));
+const users = Array.from({ length: RECORDS }, (_, i) => ({
+    id: `u_${i}`, name: `User ${i}`, scope: { regionId: REGIONS[i % REGIONS.length] }
+}));
+
+const pick = (i) => (i * 7919) % RECORDS;
+
+const time = (fn, arg) => {
+    const start = performance.now();
+    fn(arg);
+    return performance.now() - start;
+};
+
+const scenarios = [
+    ['material by id', {
+        array: (db) => { for (let i = 0; i < LOOKUPS; i++) db.materials.find(m => m.materialId === `mat_${pick(i)}`); },
+        keyed: (db) => { for (let i = 0; i < LOOKUPS; i++) db.materials.get(`mat_${pick(i)}`); }
+    }],
+    ['update quiz', {
+        array: (db) => {
+            for (let i = 0; i < LOOKUPS; i++) {
+                const idx = db.quizzes.findIndex(q => q.quizId === `quiz_${pick(i)}`);
+                db.quizzes[idx] = { ...db.quizzes[idx], version: 2 };
+            }
+        },
+        keyed: (db) => { for (let i = 0; i < LOOKUPS; i++) db.quizzes.update(`quiz_${pick(i)}`, { version: 2 }); }
+    }],
+    ['quizzes by materialId', {
+        array: (db) => { for (let i = 0; i < LOOKUPS; i++) db.quizzes.filter(q => q.materialId === `mat_${pick(i) % (RECORDS / 2)}`); },
+        keyed: (db) => { for (let i = 0; i < LOOKUPS; i++) db.quizzes.where('materialId', `mat_${pick(i) % (RECORDS / 2)}`); }
+    }],
+    ['users by regionId', {
+        array: (db) => { for (let i = 0; i < LOOKUPS; i++) db.users.filter(u => u.scope?.regionId === REGIONS[i % REGIONS.length]); },
+        keyed: (db) => { for (let i = 0; i < LOOKUPS; i++) db.users.where('regionId', REGIONS[i % REGIONS.length]); }
+    }],
+    ['delete user', {
+        array: (db) => { for (let i = 0; i < LOOKUPS; i++) db.users = db.users.filter(u => u.id !== `u_${i}`); },
+        keyed: (db) => { for (let i = 0; i < LOOKUPS; i++) db.users.remove(`u_${i}`); }
+    }]
+];
+
+const arrayDb = () => ({ materials: [...materials], quizzes: [...quizzes], users: [...users] });
+const keyedDb = () => ({
+    materials: new KeyedCollection('materialId', { status: m => m.status }, materials),
+    quizzes: new KeyedCollection('quizId', { materialId: q => q.materialId }, quizzes),
+    users: new KeyedCollection('id', { regionId: u => u.scope?.regionId }, users)
+});
+
+const buildMs = time(keyedDb);
+console.log(`${RECORDS} records per collection, ${LOOKUPS} operations per scenario`);
+console.log(`index build: ${buildMs.toFixed(1)} ms (3 collections)\n`);
+console.log(`${'scenario'.padEnd(24)}${'array (ms)'.padStart(12)}${'keyed (ms)'.padStart(12)}${'speedup'.padStart(10)}`);
+for (const [name, { array, keyed }] of scenarios) {
+    const a = time(array, arrayDb());
+    const k = time(keyed, keyedDb());
+    console.log(`${name.padEnd(24)}${a.toFixed(1).padStart(12)}${k.toFixed(1).padStart(12)}${`x${(a / Math.max(k, 0.01)).toFixed(0)}`.padStart(10)}`);
+}
@@ -0,0 +1,123 @@
+/**
+ * StorageAdapter benchmark
+ * Save and load latency of the previous adapter (whole DB -> JSON.stringify ->
+ * one LocalStorage key per write) vs the IndexedDB adapter (dirty collections,
+ * batched writes, lazy per-collection loads). Runs in Chromium against the Vite
+ * dev server, in a throwaway profile, so the app's own data is never touched.
+ *
+ *   npm run dev
+ *   node scripts/bench/storageAdapter.bench.mjs [records=10000] [edits=50] [url=http://localhost:5173]
+ */
+import { chromium } from 'playwright';
+
+const RECORDS = Number(process.argv[2]) || 10000;
+const EDITS = Number(process.argv[3]) || 50;
+const APP_URL = process.argv[4] || 'http://localhost:5173';
+
+const runInPage = async ({ records, edits }) => {
+    const { StorageAdapter } = await import('/src/services/storageAdapter.js');
+    const LEGACY_KEY = 'AG_BENCH_LEGACY_DB';
+
+    const state = {
+        catalog: Array.from({ length: 200 }, (_, i) => ({ id: `tv_${i}`, name: `Model ${i}`, specs: { size: 55 + (i % 4) * 10 } })),
+        personas: Array.from({ length: 100 }, (_, i) => ({ id: `p_${i}`, description: 'x'.repeat(200), regions: ['GLOBAL'] })),
+        materials: Array.from({ length: records }, (_, i) => ({
+            materialId: `mat_${i}`, title: `Material ${i}`, description: 'd'.repeat(120), tags: ['tv', 'oled'], status: 'published'
+        })),
+        quizzes: Array.from({ length: records }, (_, i) => ({
+            quizId: `quiz_${i}`, materialId: `mat_${i}`, title: `Quiz ${i}`, version: 1,
+            questions: [{ questionId: 'q1', question: 'q'.repeat(80), options: ['a', 'b', 'c', 'd'], answer: 1 }]
+        })),
+        insights: Array.from({ length: records / 10 }, (_, i) => ({ insightId: `ins_${i}`, message: 'm'.repeat(100) }))
+    };
+    const names = Object.keys(state);
+
+    const stats = (samples) => {
+        const sorted = [...samples].sort((a, b) => a - b);
+        const at = (q) => sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))];
+        return { median: at(0.5), p95: at(0.95), total: samples.reduce((a, b) => a + b, 0) };
+    };
+    const edit = (i) => {
+        const idx = (i * 7919) % records;
+        state.quizzes[idx] = { ...state.quizzes[idx], version: state.quizzes[idx].version + 1 };
+    };
+
+    // --- Previous adapter: stringify everything, one key, every write ---
+    const legacy = { save: [], error: null };
+    for (let i = 0; i < edits; i++) {
+        edit(i);
+        const start = performance.now();
+        try {
+            localStorage.setItem(LEGACY_KEY, JSON.stringify(state));
+        } catch (e) {
+            legacy.error = e.name;
+            break;
+        }
+        legacy.save.push(performance.now() - start);
+    }
+    let legacyLoad = null;
+    if (!legacy.error) {
+        const start = performance.now();
+        JSON.parse(localStorage.getItem(LEGACY_KEY));
+        legacyLoad = performance.now() - start;
+    }
+    localStorage.removeItem(LEGACY_KEY);
+
+    // --- IndexedDB adapter ---
+    let start = performance.now();
+    names.forEach(name => StorageAdapter.markDirty(name, () => state[name]));
+    await StorageAdapter.flush();
+    const seed = performance.now() - start;
+
+    const markDirty = [];
+    const perEditFlush = [];
+    for (let i = 0; i < edits; i++) {
+        edit(i);
+        start = performance.now();
+        StorageAdapter.markDirty('quizzes', () => state.quizzes);
+        markDirty.push(performance.now() - start);
+        if (i % 2) {
+            // Every other edit also waits for its own write, the worst case for batching
+            start = performance.now();
+            await StorageAdapter.flush();
+            perEditFlush.push(performance.now() - start);
+        }
+    }
+    await StorageAdapter.flush();
+
+    start = performance.now();
+    await StorageAdapter.loadCollection('quizzes', []);
+    const lazyLoad = performance.now() - start;
+    start = performance.now();
+    await Promise.all(names.map(name => StorageAdapter.loadCollection(name, [])));
+    const fullLoad = performance.now() - start;
+
+    return {
+        bytes: JSON.stringify(state).length,
+        legacy: { writes: legacy.save.length, save: legacy.save.length ? stats(legacy.save) : null, load: legacyLoad, error: legacy.error },
+        indexedDb: { seed, markDirty: stats(markDirty), flush: stats(perEditFlush), lazyLoad, fullLoad }
+    };
+};
+
+const fmt = (ms) => (ms === null || ms === undefined ? '—' : `${ms.toFixed(2)} ms`);
+
+const browser = await chromium.launch();
+try {
+    const page = await (await browser.newContext()).newPage();
+    await page.goto(APP_URL, { waitUntil: 'domcontentloaded' });
+    const r = await page.evaluate(runInPage, { records: RECORDS, edits: EDITS });
+
+    console.log(`${RECORDS} materials + ${RECORDS} quizzes, ${(r.bytes / 1e6).toFixed(1)} MB serialised, ${EDITS} quiz edits\n`);
+    console.log('previous adapter (LocalStorage, whole DB per write)');
+    if (r.legacy.error) console.log(`  save failed after ${r.legacy.writes} write(s): ${r.legacy.error}`);
+    console.log(`  save per edit (main thread)  median ${fmt(r.legacy.save?.median)}  p95 ${fmt(r.legacy.save?.p95)}`);
+    console.log(`  load (whole DB)              ${fmt(r.legacy.load)}`);
+    console.log('IndexedDB adapter (dirty collections, batched idle writes)');
+    console.log(`  initial write, all colls.    ${fmt(r.indexedDb.seed)}`);
+    console.log(`  save per edit (main thread)  median ${fmt(r.indexedDb.markDirty.median)}  p95 ${fmt(r.indexedDb.markDirty.p95)}`);
+    console.log(`  flush of one collection      median ${fmt(r.indexedDb.flush.median)}  p95 ${fmt(r.indexedDb.flush.p95)} (async)`);
+    console.log(`  lazy load, one collection    ${fmt(r.indexedDb.lazyLoad)}`);
+    console.log(`  load, all collections        ${fmt(r.indexedDb.fullLoad)}`);
+} finally {
+    await browser.close();
+}
@@ -1,26 +1,48 @@
-import React from 'react';
+import React, { Suspense, useEffect } from 'react';
 import { createBrowserRouter, RouterProvider, createRoutesFromElements, Route, Navigate } from 'react-router-dom';
 import MainLayout from './components/layout/MainLayout';
-import HomeDashboard from './pages/HomeDashboard';
-import AIChatbot from './pages/AIChatbot';
-import SalesLab from './pages/SalesLab';
-import FeedbackReport from './pages/FeedbackReport';
-import AdminLayout from './components/layout/AdminLayout';
-import AdminDashboard from './pages/admin/AdminDashboard';
+import RouteFallback from './components/common/RouteFallback';
 import {
   UserManagement, ContentManagement, SalesLabManagement,
   AIQuality, Analytics, Campaigns, Settings,
   ProductCatalogManager, CustomerManager, GamificationManagement,
   QuizModification
 } from './pages/admin/AdminPages';
+import { appActivity } from './lib/appActivity';
+import { lazyRoute, registerRoutes } from './lib/lazyRoute';
 
-import MyPage from './pages/MyPage';
-import AdminConsole from './pages/AdminConsole';
+// Route screens are split into their own chunks and loaded on first visit (see lib/lazyRoute.js)
+const HomeDashboard = lazyRoute(() => import('./pages/HomeDashboard'));
+const AIChatbot = lazyRoute(() => import('./pages/AIChatbot'));
+const SalesLab = lazyRoute(() => import('./pages/SalesLab'));
+const FeedbackReport = lazyRoute(() => import('./pages/FeedbackReport'));
+const StudyRoom = lazyRoute(() => import('./pages/StudyRoom'));
+const MyPage = lazyRoute(() => import('./pages/MyPage'));
+const AdminConsole = lazyRoute(() => import('./pages/AdminConsole'));
+const NotFound = lazyRoute(() => import('./pages/NotFound'));
+const AdminLayout = lazyRoute(() => import('./components/layout/AdminLayout'));
+const AdminDashboard = lazyRoute(() => import('./pages/admin/AdminDashboard'));
 
-import StudyRoom from './pages/StudyRoom';
-import NotFound from './pages/NotFound';
-
-import Quiz from './pages/Quiz';
+registerRoutes({
+  '/': HomeDashboard,
+  '/feedback': FeedbackReport,
+  '/study': StudyRoom,
+  '/ai-trainer': AIChatbot,
+  '/sales-lab': SalesLab,
+  '/my': MyPage,
+  '/admin-console': AdminConsole,
+  '/admin': [AdminLayout, AdminDashboard],
+  '/admin/users': [AdminLayout, UserManagement],
+  '/admin/cms': [AdminLayout, ContentManagement],
+  '/admin/sales-lab': [AdminLayout, SalesLabManagement],
+  '/admin/ai-quality': [AdminLayout, AIQuality],
+  '/admin/analytics': [AdminLayout, Analytics],
+  '/admin/settings': [AdminLayout, Settings],
+  '/admin/products': [AdminLayout, ProductCatalogManager],
+  '/admin/customer': [AdminLayout, CustomerManager],
+  '/admin/gamification': [AdminLayout, GamificationManagement],
+  '/admin/cms/quiz': [AdminLayout, QuizModification],
+});
 
 const router = createBrowserRouter(
   createRoutesFromElements(
@@ -64,7 +86,15 @@ const router = createBrowserRouter(
 );
 
 function App() {
-  return <RouterProvider router={router} />;
+  useEffect(() => {
+    appActivity.markReady();
+  }, []);
+
+  return (
+    <Suspense fallback={<RouteFallback />}>
+      <RouterProvider router={router} />
+    </Suspense>
+  );
 }
 
 export default App;
@@ -0,0 +1,10 @@
+import React from 'react';
+
+// Shown by the Suspense boundaries while a lazy route screen is downloading
+export default function RouteFallback() {
+    return (
+        <div className="h-full min-h-[40vh] flex items-center justify-center" role="status" aria-label="Loading">
+            <div className="w-10 h-10 border-4 border-primary border-t-transparent rounded-full animate-spin" />
+        </div>
+    );
+}
@@ -0,0 +1,28 @@
+import React, { memo, useMemo, useRef } from 'react';
+import ReactMarkdown from 'react-markdown';
+import { createBlockSplitter } from '../../lib/markdownBlocks';
+
+// Pass module-level `components` / `remarkPlugins` so finished blocks are never re-parsed
+const MarkdownBlock = memo(function MarkdownBlock({ text, components, remarkPlugins }) {
+    return (
+        <ReactMarkdown components={components} remarkPlugins={remarkPlugins}>
+            {text}
+        </ReactMarkdown>
+    );
+});
+
+// Markdown that is still being streamed: only the unfinished last block re-renders per update
+export default function StreamingMarkdown({ text, components, remarkPlugins }) {
+    const splitter = useRef(null);
+    if (splitter.current === null) splitter.current = createBlockSplitter();
+    const { blocks, tail } = useMemo(() => splitter.current.push(text), [text]);
+
+    return (
+        <>
+            {blocks.map((block, index) => (
+                <MarkdownBlock key={index} text={block} components={components} remarkPlugins={remarkPlugins} />
+            ))}
+            {tail && <MarkdownBlock key="tail" text={tail} components={components} remarkPlugins={remarkPlugins} />}
+        </>
+    );
+}
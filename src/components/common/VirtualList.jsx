@@ -0,0 +1,171 @@
+import React, { useCallback, useEffect, useLayoutEffect, useMemo, useRef, useState } from 'react';
+
+const BOTTOM_SLACK_PX = 8;
+
+// Largest index whose row starts at or above `y`
+const indexAt = (offsets, y) => {
+    let low = 0;
+    let high = offsets.length - 2;
+    while (low < high) {
+        const mid = (low + high + 1) >> 1;
+        if (offsets[mid] <= y) low = mid;
+        else high = mid - 1;
+    }
+    return Math.max(0, low);
+};
+
+const Row = ({ index, itemKey, observer, gap, children }) => {
+    const ref = useRef(null);
+    useLayoutEffect(() => {
+        const element = ref.current;
+        observer.observe(element);
+        return () => observer.unobserve(element);
+    }, [observer]);
+    // flow-root keeps the children's margins inside the measured box
+    return (
+        <div ref={ref} data-vkey={itemKey} data-vindex={index} style={{ display: 'flow-root', paddingBottom: gap }}>
+            {children}
+        </div>
+    );
+};
+
+/**
+ * Windowed list inside an existing scroll container (`scrollRef`): only the rows
+ * in view plus `overscan` pixels either side are mounted. Rows are measured with
+ * a ResizeObserver as they render and their heights are remembered by key;
+ * unmeasured rows count as `estimateSize`. When a row above the viewport changes
+ * height the scroll position is corrected, and with `followOutput` the list stays
+ * pinned to the bottom while it is scrolled there (chat transcripts).
+ * Rows prepended above the first one keep the visible rows in place, and
+ * `onStartReached` is called when the user scrolls within `overscan` of the top
+ * (to load an older page).
+ */
+export default function VirtualList({
+    count,
+    getKey,
+    renderItem,
+    scrollRef,
+    estimateSize = 120,
+    overscan = 800,
+    gap = 0,
+    followOutput = false,
+    onStartReached
+}) {
+    const listRef = useRef(null);
+    const sizes = useRef(new Map()); // row key -> measured height
+    const atBottom = useRef(followOutput);
+    const scrollAdjust = useRef(0);
+    const firstRow = useRef({ key: null, count: 0 });
+    const onStartReachedRef = useRef(onStartReached);
+    const [measured, setMeasured] = useState(0);
+    const [viewport, setViewport] = useState({ top: 0, height: typeof window === 'undefined' ? 800 : window.innerHeight });
+
+    const offsets = useMemo(() => {
+        const result = new Float64Array(count + 1);
+        for (let i = 0; i < count; i++) {
+            result[i + 1] = result[i] + (sizes.current.get(String(getKey(i))) ?? estimateSize);
+        }
+        return result;
+    }, [count, getKey, estimateSize, measured]); // `measured` changes whenever sizes.current does
+
+    // Read by the ResizeObserver callback
+    const offsetsRef = useRef(offsets);
+    const viewportRef = useRef(viewport);
+    useLayoutEffect(() => {
+        offsetsRef.current = offsets;
+        viewportRef.current = viewport;
+        onStartReachedRef.current = onStartReached;
+    }, [offsets, viewport, onStartReached]);
+
+    const updateViewport = useCallback(() => {
+        const scroller = scrollRef.current;
+        const list = listRef.current;
+        if (!scroller || !list) return;
+        const listTop = list.getBoundingClientRect().top - scroller.getBoundingClientRect().top + scroller.scrollTop;
+        atBottom.current = scroller.scrollHeight - scroller.scrollTop - scroller.clientHeight <= BOTTOM_SLACK_PX;
+        setViewport(prev => {
+            const top = scroller.scrollTop - listTop;
+            return prev.top === top && prev.height === scroller.clientHeight ? prev : { top, height: scroller.clientHeight };
+        });
+    }, [scrollRef]);
+
+    // One observer for every mounted row; a batch of resizes costs one re-render
+    const [observer] = useState(() => typeof ResizeObserver === 'undefined' ? { observe() {}, unobserve() {} } : new ResizeObserver(entries => {
+        let changed = false;
+        for (const entry of entries) {
+            const key = entry.target.dataset.vkey;
+            const height = entry.borderBoxSize?.[0]?.blockSize ?? entry.target.offsetHeight;
+            const previous = sizes.current.get(key);
+            if (previous === height) continue;
+            const rowTop = offsetsRef.current[Number(entry.target.dataset.vindex)] ?? 0;
+            if (rowTop < viewportRef.current.top) scrollAdjust.current += height - (previous ?? estimateSize);
+            sizes.current.set(key, height);
+            changed = true;
+        }
+        if (changed) setMeasured(n => n + 1);
+    }));
+
+    useEffect(() => () => observer.disconnect?.(), [observer]);
+
+    useEffect(() => {
+        const scroller = scrollRef.current;
+        if (!scroller) return undefined;
+        let frame = null;
+        const onScroll = () => {
+            if (frame !== null) return;
+            frame = requestAnimationFrame(() => {
+                frame = null;
+                updateViewport();
+                if (viewportRef.current.top < overscan) onStartReachedRef.current?.();
+            });
+        };
+        scroller.addEventListener('scroll', onScroll, { passive: true });
+        const resize = typeof ResizeObserver === 'undefined' ? null : new ResizeObserver(onScroll);
+        resize?.observe(scroller);
+        updateViewport();
+        return () => {
+            scroller.removeEventListener('scroll', onScroll);
+            resize?.disconnect();
+            if (frame !== null) cancelAnimationFrame(frame);
+        };
+    }, [scrollRef, updateViewport, overscan]);
+
+    // Keep the visible rows in place as rows above them are measured or prepended, or stay at the bottom
+    useLayoutEffect(() => {
+        const scroller = scrollRef.current;
+        const previous = firstRow.current;
+        firstRow.current = { key: count ? String(getKey(0)) : null, count };
+        const prepended = count - previous.count;
+        if (previous.key !== null && prepended > 0 && String(getKey(prepended)) === previous.key) {
+            scrollAdjust.current += offsets[prepended];
+        }
+        if (!scroller) return;
+        if (followOutput && atBottom.current) {
+            scroller.scrollTop = scroller.scrollHeight;
+        } else if (scrollAdjust.current) {
+            scroller.scrollTop += scrollAdjust.current;
+        }
+        scrollAdjust.current = 0;
+    }, [scrollRef, followOutput, offsets, count, getKey]);
+
+    const start = count ? indexAt(offsets, viewport.top - overscan) : 0;
+    const end = count ? Math.min(count, indexAt(offsets, viewport.top + viewport.height + overscan) + 1) : 0;
+
+    const rows = [];
+    for (let i = start; i < end; i++) {
+        const key = String(getKey(i));
+        rows.push(
+            <Row key={key} index={i} itemKey={key} observer={observer} gap={gap}>
+                {renderItem(i)}
+            </Row>
+        );
+    }
+
+    return (
+        <div ref={listRef} style={{ position: 'relative', height: offsets[count] }}>
+            <div style={{ position: 'absolute', top: 0, left: 0, right: 0, transform: `translateY(${offsets[start]}px)` }}>
+                {rows}
+            </div>
+        </div>
+    );
+}
@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { Suspense, useState } from 'react';
 import { Outlet, Link, useLocation, useNavigate } from 'react-router-dom';
 import {
     LayoutDashboard, Box, Users, GitBranch, MessageSquare,
@@ -10,6 +10,11 @@ import { useUserStore } from '../../store/userStore';
 import { useAppStore } from '../../store/appStore';
 import { translations } from '../../constants/translations';
 import { AdminProvider } from '../../context/AdminContext';
+import RouteFallback from '../common/RouteFallback';
+import { prefetchProps } from '../../lib/lazyRoute';
+
+// Stable E2E hooks: /admin -> admin-nav-dashboard, /admin/users -> admin-nav-users
+const adminTestId = (path) => `admin-nav-${path.replace(/^\/admin\/?/, '') || 'dashboard'}`;
 
 export default function AdminLayout() {
     const location = useLocation();
@@ -72,6 +77,8 @@ export default function AdminLayout() {
                                 <Link
                                     key={item.path}
                                     to={item.path}
+                                    data-testid={adminTestId(item.path)}
+                                    {...prefetchProps(item.path)}
                                     className={clsx(
                                         "flex items-center gap-3 px-3 py-2.5 rounded-lg transition-colors text-sm font-medium",
                                         isActive
@@ -88,6 +95,7 @@ export default function AdminLayout() {
 
                     <div className="p-4 border-t border-slate-100">
                         <button
+                            data-testid="admin-exit"
                             onClick={handleLogout}
                             className="flex items-center gap-3 px-3 py-2 w-full text-red-600 hover:bg-red-50 rounded-lg transition-colors text-sm font-medium"
                         >
@@ -112,7 +120,9 @@ export default function AdminLayout() {
                 {/* --- MAIN CONTENT AREA --- */}
                 {/* --- MAIN CONTENT AREA --- */}
                 <main className="flex-1 w-full max-w-7xl mx-auto p-4 md:p-8 pb-24 md:pb-8 overflow-x-hidden">
-                    <Outlet />
+                    <Suspense fallback={<RouteFallback />}>
+                        <Outlet />
+                    </Suspense>
                 </main>
 
                 {/* --- MOBILE: Bottom Navigation --- */}
@@ -124,6 +134,7 @@ export default function AdminLayout() {
                         return (
                             <button
                                 key={idx}
+                                data-testid={item.path ? `mobile-${adminTestId(item.path)}` : 'admin-mobile-more'}
                                 onClick={item.action ? item.action : () => navigate(item.path)}
                                 className="flex flex-col items-center justify-center w-full h-full gap-1"
                             >
@@ -1,15 +1,24 @@
-import React, { useState } from 'react';
+import React, { Suspense, useEffect, useState } from 'react';
 import { Outlet, useLocation } from 'react-router-dom';
 import { AnimatePresence, motion } from 'framer-motion';
 import { Sidebar } from './modern/Sidebar';
 import { MobileDock } from './modern/MobileDock';
 import { MobileMenu } from './modern/MobileMenu'; // New Component
 import { Menu } from 'lucide-react'; // Icon
+import RouteFallback from '../common/RouteFallback';
+import { prefetchOnIdle } from '../../lib/lazyRoute';
+
+// Trainee screens worth having ready before they are clicked; the admin console is left out
+const LIKELY_NEXT_ROUTES = ['/sales-lab', '/ai-trainer', '/study', '/my'];
 
 export default function MainLayout() {
     const location = useLocation();
     const [isMenuOpen, setIsMenuOpen] = useState(false);
 
+    useEffect(() => {
+        prefetchOnIdle(LIKELY_NEXT_ROUTES);
+    }, []);
+
     return (
         <div className="min-h-screen bg-slate-50 font-sans flex flex-col md:flex-row overflow-hidden selection:bg-indigo-100 selection:text-indigo-900">
             {/* Desktop Sidebar */}
@@ -42,7 +51,9 @@ export default function MainLayout() {
                                 transition={{ duration: 0.3, ease: "circOut" }}
                                 className="h-full flex flex-col"
                             >
-                                <Outlet />
+                                <Suspense fallback={<RouteFallback />}>
+                                    <Outlet />
+                                </Suspense>
                             </motion.div>
                         </AnimatePresence>
                     </div>
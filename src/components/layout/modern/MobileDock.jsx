@@ -5,6 +5,7 @@ import { LayoutDashboard, FlaskConical, Bot, BookOpen, User } from 'lucide-react
 import { clsx } from 'clsx';
 import { translations } from '../../../constants/translations';
 import { useAppStore } from '../../../store/appStore';
+import { prefetchProps } from '../../../lib/lazyRoute';
 
 export function MobileDock() {
     const location = useLocation();
@@ -30,6 +31,7 @@ export function MobileDock() {
                         <Link
                             key={item.path}
                             to={item.path}
+                            {...prefetchProps(item.path)}
                             className="relative flex-1 flex flex-col items-center justify-center py-2"
                         >
                             {isActive && (
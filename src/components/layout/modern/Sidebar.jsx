@@ -6,6 +6,7 @@ import { clsx } from 'clsx';
 import { translations } from '../../../constants/translations';
 import { useAppStore } from '../../../store/appStore';
 import { useUserStore } from '../../../store/userStore';
+import { prefetchProps } from '../../../lib/lazyRoute';
 
 export function Sidebar() {
     const location = useLocation();
@@ -49,6 +50,8 @@ export function Sidebar() {
                             <Link
                                 key={item.path}
                                 to={item.path}
+                                data-testid={`nav-${item.path.slice(1) || 'home'}`}
+                                {...prefetchProps(item.path)}
                                 className="relative block"
                             >
                                 {isActive && (
@@ -84,6 +87,7 @@ export function Sidebar() {
                             <span className="text-xs font-bold">Language</span>
                         </div>
                         <select
+                            data-testid="language-select"
                             value={language}
                             onChange={(e) => useAppStore.getState().setLanguage(e.target.value)}
                             className="bg-transparent text-xs font-bold text-slate-700 outline-none cursor-pointer text-right"
@@ -102,6 +106,7 @@ export function Sidebar() {
                             <span className="text-xs font-bold">Demo Mode</span>
                         </div>
                         <button
+                            data-testid="demo-mode-toggle"
                             onClick={toggleDemoMode}
                             className={clsx(
                                 "relative w-8 h-4 rounded-full transition-colors",
@@ -125,7 +130,7 @@ export function Sidebar() {
                         className="w-full flex items-center gap-3 px-4 py-3 rounded-xl text-slate-500 hover:text-slate-800 hover:bg-white/50 transition-all border border-dashed border-slate-300 hover:border-slate-400 group"
                     >
                         <Settings size={20} className="group-hover:rotate-45 transition-transform" />
-                        <Link to="/admin" className="flex-1 text-left text-sm font-medium">Admin Console</Link>
+                        <Link to="/admin" data-testid="nav-admin-console" {...prefetchProps('/admin')} className="flex-1 text-left text-sm font-medium">Admin Console</Link>
                     </button>
 
                     <div className="flex items-center justify-between px-2 text-xs text-slate-400 font-medium">
@@ -1,36 +1,55 @@
-import React, { useState } from 'react';
+import React, { memo, useMemo, useState } from 'react';
 import { User, Bot, Sparkles, ChevronDown } from 'lucide-react';
 import ReactMarkdown from 'react-markdown';
 import clsx from 'clsx';
 import { motion } from 'framer-motion';
+import StreamingMarkdown from '../common/StreamingMarkdown';
 
-const ChatMessage = ({ message, isStreaming = false }) => {
-    const isUser = message.role === 'user';
-    const [showDetails, setShowDetails] = useState(false);
+// Module-level so memoized messages and streamed blocks see the same objects on every render
+const SUMMARY_COMPONENTS = {
+    user: {
+        p: ({ node, ...props }) => <p className="mb-2 last:mb-0" {...props} />,
+        strong: ({ node, ...props }) => <span className="font-bold" {...props} />
+    },
+    ai: {
+        p: ({ node, ...props }) => <p className="mb-2 last:mb-0" {...props} />,
+        strong: ({ node, ...props }) => <span className="font-bold bg-yellow-50 text-slate-900 px-1 rounded" {...props} />
+    }
+};
 
-    // Parse AI response to separate core summary and details
-    const parseAIResponse = (text) => {
-        if (isUser) return { summary: text, details: null };
+const DETAILS_COMPONENTS = {
+    p: ({ node, ...props }) => <p className="mb-3 last:mb-0 text-slate-600" {...props} />,
+    li: ({ node, ...props }) => <li className="marker:text-secondary" {...props} />
+};
 
-        const summaryMatch = text.match(/### 📌 핵심 요약.*?(?=###|---SPEECH---|$)/s);
-        const tipsMatch = text.match(/### 🔧 실전 팁.*?(?=###|---SPEECH---|$)/s);
-        const scriptMatch = text.match(/\[실전 스크립트.*?(?=###|---SPEECH---|$)/s);
-        const detailsMatch = text.match(/### 📚 상세 정보.*?(?=---SPEECH---|$)/s);
+// Parse AI response to separate core summary and details
+const parseAIResponse = (text, isUser) => {
+    if (isUser) return { summary: text, details: null };
 
-        let summary = text;
-        let details = null;
+    const summaryMatch = text.match(/### 📌 핵심 요약.*?(?=###|---SPEECH---|$)/s);
+    const tipsMatch = text.match(/### 🔧 실전 팁.*?(?=###|---SPEECH---|$)/s);
+    const scriptMatch = text.match(/\[실전 스크립트.*?(?=###|---SPEECH---|$)/s);
+    const detailsMatch = text.match(/### 📚 상세 정보.*?(?=---SPEECH---|$)/s);
 
-        if (summaryMatch) {
-            summary = summaryMatch[0];
-            if (tipsMatch) summary += '\n' + tipsMatch[0];
-            if (scriptMatch) summary += '\n' + scriptMatch[0];
-            if (detailsMatch) details = detailsMatch[0];
-        }
+    let summary = text;
+    let details = null;
 
-        return { summary, details };
-    };
+    if (summaryMatch) {
+        summary = summaryMatch[0];
+        if (tipsMatch) summary += '\n' + tipsMatch[0];
+        if (scriptMatch) summary += '\n' + scriptMatch[0];
+        if (detailsMatch) details = detailsMatch[0];
+    }
 
-    const { summary, details } = parseAIResponse(message.text);
+    return { summary, details };
+};
+
+const ChatMessage = ({ message, isStreaming = false }) => {
+    const isUser = message.role === 'user';
+    const [showDetails, setShowDetails] = useState(false);
+
+    const { summary, details } = useMemo(() => parseAIResponse(message.text, isUser), [message.text, isUser]);
+    const summaryComponents = isUser ? SUMMARY_COMPONENTS.user : SUMMARY_COMPONENTS.ai;
 
     return (
         <motion.div
@@ -73,14 +92,13 @@ const ChatMessage = ({ message, isStreaming = false }) => {
                     )}
 
                     <div className={clsx("prose prose-sm max-w-none", isUser ? "prose-invert" : "prose-slate")}>
-                        <ReactMarkdown
-                            components={{
-                                p: ({ node, ...props }) => <p className="mb-2 last:mb-0" {...props} />,
-                                strong: ({ node, ...props }) => <span className={isUser ? "font-bold" : "font-bold bg-yellow-50 text-slate-900 px-1 rounded"} {...props} />
-                            }}
-                        >
-                            {summary}
-                        </ReactMarkdown>
+                        {isStreaming ? (
+                            <StreamingMarkdown text={summary} components={summaryComponents} />
+                        ) : (
+                            <ReactMarkdown components={summaryComponents}>
+                                {summary}
+                            </ReactMarkdown>
+                        )}
                         {isStreaming && (
                             <span className="inline-flex gap-1 ml-2 align-middle">
                                 <span className="w-1.5 h-1.5 bg-current rounded-full animate-bounce" style={{ animationDelay: '0s' }} />
@@ -119,12 +137,7 @@ const ChatMessage = ({ message, isStreaming = false }) => {
                     animate={{ opacity: 1, height: 'auto', scale: 1 }}
                     className="mt-3 ml-[3.5rem] md:ml-[4rem] p-5 bg-slate-50 border border-slate-200 border-l-4 border-l-secondary rounded-r-2xl text-sm prose prose-sm max-w-[85%] md:max-w-[75%] shadow-inner"
                 >
-                    <ReactMarkdown
-                        components={{
-                            p: ({ node, ...props }) => <p className="mb-3 last:mb-0 text-slate-600" {...props} />,
-                            li: ({ node, ...props }) => <li className="marker:text-secondary" {...props} />
-                        }}
-                    >
+                    <ReactMarkdown components={DETAILS_COMPONENTS}>
                         {details}
                     </ReactMarkdown>
                 </motion.div>
@@ -133,4 +146,5 @@ const ChatMessage = ({ message, isStreaming = false }) => {
     );
 };
 
-export default ChatMessage;
+// Finished messages keep their props, so new chunks and turns never re-render them
+export default memo(ChatMessage);
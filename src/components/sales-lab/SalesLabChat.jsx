@@ -3,7 +3,11 @@ import { motion, AnimatePresence } from 'framer-motion';
 import { useBlocker, useNavigate } from 'react-router-dom';
 import { Send, Mic, MicOff, ArrowLeft, Sparkles, X, Lightbulb, ChevronRight, CheckCircle2, Circle, PlayCircle, StopCircle, Save, LogOut, Target, ShieldAlert, Award, Zap, Brain, MessageSquare, ThumbsUp } from 'lucide-react';
 import { aiService } from '../../lib/gemini';
+import { createAnalysisScheduler, shouldSkipAnalysis } from '../../lib/analysisScheduler';
+import { conversationContext } from '../../lib/conversationContext';
 import ChatMessage from './ChatMessage';
+import VirtualList from '../common/VirtualList';
+import { useStreamingText } from '../../hooks/useStreamingText';
 import clsx from 'clsx';
 import { useAppStore } from '../../store/appStore';
 import { MotionCard } from '../ui/modern/MotionCard';
@@ -29,7 +33,8 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
     const [objectionHint, setObjectionHint] = useState(initialState?.objectionHint || null);
     const [solvedObjections, setSolvedObjections] = useState(initialState?.solvedObjections || []);
     const [showGuide, setShowGuide] = useState(true);
-    const [streamingText, setStreamingText] = useState('');
+    // Chunks are coalesced per animation frame; only the streaming bubble re-renders
+    const { text: streamingText, append: appendStreamingText, reset: resetStreamingText } = useStreamingText();
     const [isAutoMode, setIsAutoMode] = useState(isDemoMode);
     const [isSessionEnded, setIsSessionEnded] = useState(false);
     const [showResultButton, setShowResultButton] = useState(false);
@@ -60,6 +65,10 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
     const recognitionRef = useRef(null);
     const silenceTimerRef = useRef(null);
     const chatContainerRef = useRef(null); // For auto-scroll
+    const analysisSchedulerRef = useRef(null);
+    if (!analysisSchedulerRef.current) {
+        analysisSchedulerRef.current = createAnalysisScheduler({ analyze: aiService.analyzeInteraction });
+    }
 
     // Translations
     const t = {
@@ -239,7 +248,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
         setInput('');
         inputRef.current = '';
         setIsProcessing(true);
-        setStreamingText('');
+        resetStreamingText();
 
         // Logic for Objection Resolution (Simulated/Heuristic)
         if (objectionHint && textToSend.length > 10) {
@@ -255,16 +264,23 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
 
         try {
             // Check Demo Mode
-            const analysisPromise = aiService.analyzeInteraction(textToSend, messages, config, language);
+            // Debounced, cancellable analysis: resolves null when skipped or superseded by a newer turn
+            const skipAnalysis = shouldSkipAnalysis({
+                text: textToSend, currentStep, traits: config.customer.traits, discoveredTraits
+            });
+            const analysisPromise = analysisSchedulerRef.current.schedule(
+                [textToSend, messages, config, language], { skip: skipAnalysis }
+            );
 
             analysisPromise.then(analysis => {
-                if (analysis.error === 'QUOTA_EXCEEDED') return;
-                if (analysis.nextStep && SALES_STEPS.findIndex(s => s.id === analysis.nextStep) > SALES_STEPS.findIndex(s => s.id === currentStep)) {
-                    setCurrentStep(analysis.nextStep);
+                if (!analysis || analysis.aborted || analysis.error === 'QUOTA_EXCEEDED') return;
+                const stepIndex = (id) => SALES_STEPS.findIndex(s => s.id === id);
+                if (analysis.nextStep) {
+                    setCurrentStep(prev => stepIndex(analysis.nextStep) > stepIndex(prev) ? analysis.nextStep : prev);
                 }
                 if (analysis.discoveredTrait) {
                     const trait = config.customer.traits.find(t => t.id === analysis.discoveredTrait);
-                    if (trait && !discoveredTraits.includes(trait.id)) setDiscoveredTraits(prev => [...prev, trait.id]);
+                    if (trait) setDiscoveredTraits(prev => prev.includes(trait.id) ? prev : [...prev, trait.id]);
                 }
                 if (analysis.objectionDetected) setObjectionHint(analysis.objectionHint);
             });
@@ -273,7 +289,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                 textToSend,
                 language,
                 !isDemoMode, // Use steam only if not demo
-                (chunk) => setStreamingText(prev => prev + chunk),
+                appendStreamingText,
                 messages
             );
 
@@ -283,7 +299,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                 speakText(response.text);
             } else {
                 setMessages(prev => [...prev, { role: 'ai', text: response.text }]);
-                setStreamingText('');
+                resetStreamingText();
                 speakText(response.speech);
             }
 
@@ -342,13 +358,18 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
 
     const handleEndSession = async () => {
         setIsProcessing(true);
+        // Read after generateFeedback so its own context savings are included
+        const sessionStats = () => ({
+            analysisStats: analysisSchedulerRef.current.getStats(),
+            contextStats: conversationContext.getStats()
+        });
         try {
             const feedback = await aiService.generateFeedback(messages, language);
             if (!feedback) throw new Error("Empty feedback received");
-            onEnd(feedback);
+            onEnd({ ...feedback, ...sessionStats() });
         } catch (error) {
             console.error("Failed to generate feedback:", error);
-            onEnd({ totalScore: 75, summary: "Feedback generation failed.", scores: [] });
+            onEnd({ totalScore: 75, summary: "Feedback generation failed.", scores: [], ...sessionStats() });
         } finally {
             setIsProcessing(false);
         }
@@ -389,6 +410,9 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
 
     useEffect(() => { inputRef.current = input; }, [input]);
 
+    // Drop any queued or in-flight analysis when leaving the chat
+    useEffect(() => () => analysisSchedulerRef.current.cancel(), []);
+
     useEffect(() => {
         if (isAutoMode && !isProcessing && !isListening && !isSessionEnded) startListening();
         else if ((!isAutoMode || isSessionEnded) && isListening) stopListening();
@@ -461,6 +485,10 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
         setShowSavePrompt(false);
     };
 
+    // Only the turns in view are mounted (see VirtualList)
+    const getMessageKey = useCallback((index) => index, []);
+    const renderMessage = useCallback((index) => <ChatMessage message={messages[index]} />, [messages]);
+
     // Auto-scroll logic
     useEffect(() => {
         if (chatContainerRef.current) {
@@ -477,7 +505,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
             <div className="flex-none bg-white border-b border-slate-100 z-20">
                 <div className="flex items-center justify-between p-4 pb-2">
                     <div className="flex items-center gap-3">
-                        <button onClick={handleExitAttempt} className="p-2 -ml-2 hover:bg-slate-100 rounded-lg text-slate-400 hover:text-slate-900 transition-colors">
+                        <button data-testid="chat-exit" onClick={handleExitAttempt} className="p-2 -ml-2 hover:bg-slate-100 rounded-lg text-slate-400 hover:text-slate-900 transition-colors">
                             <ArrowLeft size={20} />
                         </button>
                         <div>
@@ -487,7 +515,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                             </h2>
                         </div>
                     </div>
-                    <button onClick={() => setShowGuide(!showGuide)} className={clsx("p-2 rounded-lg transition-all md:hidden", showGuide ? "bg-indigo-50 text-priority" : "text-slate-400")}>
+                    <button data-testid="chat-guide-toggle" onClick={() => setShowGuide(!showGuide)} className={clsx("p-2 rounded-lg transition-all md:hidden", showGuide ? "bg-indigo-50 text-priority" : "text-slate-400")}>
                         <Brain size={20} />
                     </button>
                 </div>
@@ -521,10 +549,16 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                 <div className="flex-1 flex flex-col relative min-w-0 bg-slate-50/50">
 
                     {/* Chat Stream (Flex Grow) */}
-                    <div ref={chatContainerRef} className="flex-1 overflow-y-auto p-4 md:p-6 space-y-6">
-                        {messages.map((msg, index) => (
-                            <ChatMessage key={index} message={msg} />
-                        ))}
+                    <div ref={chatContainerRef} data-testid="chat-messages" className="flex-1 overflow-y-auto p-4 md:p-6 space-y-6">
+                        <VirtualList
+                            count={messages.length}
+                            getKey={getMessageKey}
+                            renderItem={renderMessage}
+                            scrollRef={chatContainerRef}
+                            estimateSize={96}
+                            gap={24}
+                            followOutput
+                        />
                         {streamingText && <ChatMessage message={{ role: 'ai', text: streamingText }} isStreaming />}
                         {/* Spacer for bottom */}
                         <div className="h-4" />
@@ -535,7 +569,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                         <div className="max-w-3xl mx-auto flex items-end gap-3">
                             {/* Actions Menu (End) */}
                             {messages.length > 2 && !isSessionEnded && (
-                                <button onClick={handleEndSession} disabled={isProcessing} className="p-3 bg-slate-100 hover:bg-slate-200 text-slate-500 hover:text-red-500 rounded-xl transition-colors" title="End Session">
+                                <button data-testid="chat-end-session" onClick={handleEndSession} disabled={isProcessing} className="p-3 bg-slate-100 hover:bg-slate-200 text-slate-500 hover:text-red-500 rounded-xl transition-colors" title="End Session">
                                     <LogOut size={20} />
                                 </button>
                             )}
@@ -544,6 +578,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                             <div className="flex-1 bg-slate-50 border border-slate-200 focus-within:border-primary focus-within:ring-1 focus-within:ring-primary/20 hover:border-slate-300 transition-all rounded-2xl p-2 flex items-center gap-3 relative">
                                 {/* Mic Toggle */}
                                 <button
+                                    data-testid="chat-mic"
                                     onClick={toggleListening}
                                     className={clsx(
                                         "w-10 h-10 rounded-xl flex items-center justify-center transition-all flex-shrink-0",
@@ -573,6 +608,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                                         ) : (
                                             <input
                                                 key="text-input"
+                                                data-testid="chat-input"
                                                 type="text"
                                                 ref={inputRef}
                                                 value={input}
@@ -594,6 +630,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
 
                                 {/* Send Button */}
                                 <PulseButton
+                                    data-testid="chat-send"
                                     onClick={() => handleSend()}
                                     disabled={!input.trim() || isProcessing || isSessionEnded}
                                     className="w-10 h-10 !p-0 !rounded-xl flex-shrink-0 shadow-sm"
@@ -736,9 +773,9 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                             <h3 className="text-lg font-bold text-slate-900 mb-2">Exit Roleplay?</h3>
                             <p className="text-slate-500 mb-6 text-sm">Progress will be lost. Save?</p>
                             <div className="flex flex-col gap-3">
-                                <button onClick={handleSaveAndExit} className="w-full px-4 py-3 bg-primary text-white font-bold rounded-xl flex items-center justify-center gap-2"><Save size={18} /> Save & Exit</button>
-                                <button onClick={confirmExit} className="w-full px-4 py-3 bg-red-50 text-red-600 font-bold rounded-xl flex items-center justify-center gap-2"><LogOut size={18} /> Exit without Saving</button>
-                                <button onClick={cancelExit} className="w-full px-4 py-3 text-slate-500 font-medium">Cancel</button>
+                                <button data-testid="exit-save" onClick={handleSaveAndExit} className="w-full px-4 py-3 bg-primary text-white font-bold rounded-xl flex items-center justify-center gap-2"><Save size={18} /> Save & Exit</button>
+                                <button data-testid="exit-discard" onClick={confirmExit} className="w-full px-4 py-3 bg-red-50 text-red-600 font-bold rounded-xl flex items-center justify-center gap-2"><LogOut size={18} /> Exit without Saving</button>
+                                <button data-testid="exit-cancel" onClick={cancelExit} className="w-full px-4 py-3 text-slate-500 font-medium">Cancel</button>
                             </div>
                         </motion.div>
                     </div>
@@ -748,8 +785,8 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                         <motion.div initial={{ opacity: 0, scale: 0.9 }} animate={{ opacity: 1, scale: 1 }} className="bg-white border border-slate-200 rounded-2xl shadow-2xl max-w-sm w-full p-6 text-center">
                             <div className="w-12 h-12 bg-blue-50 rounded-full flex items-center justify-center mx-auto mb-4 text-blue-500"><Save size={24} /></div>
                             <h3 className="text-lg font-bold text-slate-900 mb-2">Save Progress?</h3>
-                            <button onClick={handleSaveAndExit} className="w-full px-4 py-3 bg-primary text-white font-bold rounded-xl mt-4">Save & Exit</button>
-                            <button onClick={handleExitWithoutSave} className="w-full px-4 py-3 text-red-500 font-bold mt-2">Exit without Saving</button>
+                            <button data-testid="save-prompt-save" onClick={handleSaveAndExit} className="w-full px-4 py-3 bg-primary text-white font-bold rounded-xl mt-4">Save & Exit</button>
+                            <button data-testid="save-prompt-discard" onClick={handleExitWithoutSave} className="w-full px-4 py-3 text-red-500 font-bold mt-2">Exit without Saving</button>
                         </motion.div>
                     </div>
                 )}
@@ -760,7 +797,7 @@ const SalesLabChat = ({ config, onEnd, initialState }) => {
                         <motion.div initial={{ opacity: 0, scale: 0.9, y: 20 }} animate={{ opacity: 1, scale: 1, y: 0 }} className="bg-white border border-slate-200 rounded-3xl shadow-2xl w-full max-w-sm p-8 text-center relative overflow-hidden">
                             <div className="w-20 h-20 bg-green-50 rounded-full flex items-center justify-center mx-auto mb-6 text-green-500"><CheckCircle2 size={40} /></div>
                             <h2 className="text-2xl font-black text-slate-900 mb-2">Roleplay Complete!</h2>
-                            <PulseButton onClick={handleEndSession} className="w-full py-4 text-lg font-bold mt-6 shadow-xl shadow-primary/25">View Analysis</PulseButton>
+                            <PulseButton data-testid="chat-view-analysis" onClick={handleEndSession} className="w-full py-4 text-lg font-bold mt-6 shadow-xl shadow-primary/25">View Analysis</PulseButton>
                         </motion.div>
                     </div>
                 )}
@@ -1,13 +1,56 @@
-import React from 'react';
+import React, { useCallback, useRef } from 'react';
 import { Calendar, User, Monitor, ChevronRight } from 'lucide-react';
 import { useChatStore } from '../../store/chatStore';
+import { at } from '../../lib/chunkedList';
+import VirtualList from '../common/VirtualList';
 import clsx from 'clsx';
 
 export default function SalesLabHistory({ onBack, onSelectSession }) {
-    const { sessions } = useChatStore();
+    const { sessions, clearSessions } = useChatStore();
+    const scrollRef = useRef(null);
+
+    // Newest first; only the cards in view are mounted
+    const sessionAt = useCallback((index) => at(sessions, sessions.length - 1 - index), [sessions]);
+    const getSessionKey = useCallback((index) => sessionAt(index).id, [sessionAt]);
+    const renderSession = useCallback((index) => {
+        const session = sessionAt(index);
+        return (
+            <div
+                onClick={() => onSelectSession && onSelectSession(session.id)}
+                className="bg-white p-4 md:p-5 rounded-2xl border border-slate-200 shadow-sm flex justify-between items-center hover:border-indigo-300 hover:shadow-md transition-all cursor-pointer group"
+            >
+                <div className="flex items-center gap-4 md:gap-6">
+                    <div className={clsx(
+                        "w-10 h-10 md:w-14 md:h-14 rounded-xl md:rounded-2xl flex items-center justify-center font-black text-sm md:text-xl shadow-sm border",
+                        (session.totalScore || 0) >= 80 ? "bg-emerald-50 text-emerald-600 border-emerald-100" :
+                            (session.totalScore || 0) >= 60 ? "bg-amber-50 text-amber-600 border-amber-100" :
+                                "bg-red-50 text-red-600 border-red-100"
+                    )}>
+                        {session.totalScore || 0}
+                    </div>
+                    <div>
+                        <h3 className="font-bold text-slate-900 flex items-center gap-2 group-hover:text-indigo-600 transition-colors text-lg">
+                            {session.product?.name || 'Unknown Product'}
+                        </h3>
+                        <div className="text-sm text-slate-500 flex items-center gap-4 mt-1.5 font-medium">
+                            <span className="flex items-center gap-1.5"><Calendar size={14} /> {new Date(session.date).toLocaleDateString()}</span>
+                            <span className="w-1 h-1 rounded-full bg-slate-300" />
+                            <span className="flex items-center gap-1.5">
+                                <User size={14} />
+                                {session.customer?.traits?.map(t => t.label).join(', ') || 'Unknown Customer'}
+                            </span>
+                        </div>
+                    </div>
+                </div>
+                <div className="p-2 rounded-full text-slate-300 group-hover:text-indigo-600 group-hover:bg-indigo-50 transition-all">
+                    <ChevronRight size={20} />
+                </div>
+            </div>
+        );
+    }, [sessionAt, onSelectSession]);
 
     return (
-        <div className="max-w-5xl mx-auto p-4 md:p-8 space-y-6 md:space-y-8 h-full overflow-y-auto custom-scrollbar">
+        <div ref={scrollRef} className="max-w-5xl mx-auto p-4 md:p-8 space-y-6 md:space-y-8 h-full overflow-y-auto custom-scrollbar">
             <div className="flex items-center justify-between mb-4 md:mb-8">
                 <div className="flex items-center gap-3 md:gap-4">
                     <button
@@ -25,7 +68,7 @@ export default function SalesLabHistory({ onBack, onSelectSession }) {
                     <button
                         onClick={() => {
                             if (window.confirm("Are you sure you want to clear all history? This cannot be undone.")) {
-                                useChatStore.setState({ sessions: [] });
+                                clearSessions();
                             }
                         }}
                         className="text-xs md:text-sm font-bold text-red-500 hover:bg-red-50 px-3 py-1.5 md:px-4 md:py-2 rounded-lg transition-colors border border-transparent hover:border-red-100"
@@ -45,40 +88,14 @@ export default function SalesLabHistory({ onBack, onSelectSession }) {
                         <p className="text-slate-400 text-xs md:text-sm mt-1">Complete your first simulation to see results here.</p>
                     </div>
                 ) : (
-                    sessions.map((session) => (
-                        <div
-                            key={session.id}
-                            onClick={() => onSelectSession && onSelectSession(session.id)}
-                            className="bg-white p-4 md:p-5 rounded-2xl border border-slate-200 shadow-sm flex justify-between items-center hover:border-indigo-300 hover:shadow-md transition-all cursor-pointer group"
-                        >
-                            <div className="flex items-center gap-4 md:gap-6">
-                                <div className={clsx(
-                                    "w-10 h-10 md:w-14 md:h-14 rounded-xl md:rounded-2xl flex items-center justify-center font-black text-sm md:text-xl shadow-sm border",
-                                    (session.totalScore || 0) >= 80 ? "bg-emerald-50 text-emerald-600 border-emerald-100" :
-                                        (session.totalScore || 0) >= 60 ? "bg-amber-50 text-amber-600 border-amber-100" :
-                                            "bg-red-50 text-red-600 border-red-100"
-                                )}>
-                                    {session.totalScore || 0}
-                                </div>
-                                <div>
-                                    <h3 className="font-bold text-slate-900 flex items-center gap-2 group-hover:text-indigo-600 transition-colors text-lg">
-                                        {session.product?.name || 'Unknown Product'}
-                                    </h3>
-                                    <div className="text-sm text-slate-500 flex items-center gap-4 mt-1.5 font-medium">
-                                        <span className="flex items-center gap-1.5"><Calendar size={14} /> {new Date(session.date).toLocaleDateString()}</span>
-                                        <span className="w-1 h-1 rounded-full bg-slate-300" />
-                                        <span className="flex items-center gap-1.5">
-                                            <User size={14} />
-                                            {session.customer?.traits?.map(t => t.label).join(', ') || 'Unknown Customer'}
-                                        </span>
-                                    </div>
-                                </div>
-                            </div>
-                            <div className="p-2 rounded-full text-slate-300 group-hover:text-indigo-600 group-hover:bg-indigo-50 transition-all">
-                                <ChevronRight size={20} />
-                            </div>
-                        </div>
-                    ))
+                    <VirtualList
+                        count={sessions.length}
+                        getKey={getSessionKey}
+                        renderItem={renderSession}
+                        scrollRef={scrollRef}
+                        estimateSize={104}
+                        gap={16}
+                    />
                 )}
             </div>
         </div>
@@ -1,26 +1,32 @@
-import React, { useState, useMemo, useEffect } from 'react';
+import React, { useState, useMemo, useEffect, useRef } from 'react';
+import { useQuery } from '@tanstack/react-query';
 import { Play, User, Monitor, Shuffle, History, Info, List, X, Star, ArrowLeft, Settings, Check, Sparkles, Target, Database, CheckCircle2, Zap } from 'lucide-react';
 import { clsx } from 'clsx';
 import { motion, AnimatePresence } from 'framer-motion';
 import { useAppStore } from '../../store/appStore';
 import { translations } from '../../constants/translations';
-import { operatorApi } from '../../services/operatorApi';
+import { salesLabBootstrapQuery } from '../../lib/queryClient';
 import { recommendationEngine } from '../../lib/recommendationEngine';
 import { AGES, GENDERS } from '../../constants/salesLabData';
 import { MotionCard } from '../ui/modern/MotionCard';
 import { PulseButton } from '../ui/modern/PulseButton';
 
+// Stable fallback so memoised lookups don't recompute while loading
+const EMPTY = [];
+
 export default function SalesLabSetup({ onStart, onViewHistory }) {
     const { language, isDemoMode, toggleDemoMode } = useAppStore();
     const t = translations[language] || translations['en'];
 
     // --- Loading State ---
-    const [isLoading, setIsLoading] = useState(true);
-    const [catalog, setCatalog] = useState(null);
-    const [personas, setPersonas] = useState([]);
-    const [traits, setTraits] = useState([]);
-    const [difficulties, setDifficulties] = useState([]);
-    const [upsellRules, setUpsellRules] = useState([]);
+    // One batched read for all operator data (see getSalesLabBootstrap)
+    const { data: bootstrap, isPending: isLoading, error } = useQuery(salesLabBootstrapQuery);
+    const catalog = bootstrap?.catalog ?? null;
+    const personas = bootstrap?.personas ?? EMPTY;
+    const traits = bootstrap?.traits ?? EMPTY;
+    const difficulties = bootstrap?.levels ?? EMPTY;
+    const upsellRules = bootstrap?.rules ?? EMPTY;
+    const defaultsApplied = useRef(false);
 
     // --- Selection State ---
     const [selectedType, setSelectedType] = useState('');
@@ -36,61 +42,43 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
     const [isPresetModalOpen, setIsPresetModalOpen] = useState(false);
     const [hasSavedSession, setHasSavedSession] = useState(false);
 
-    // --- Data Fetching ---
     useEffect(() => {
-        const loadData = async () => {
-            setIsLoading(true);
-            try {
-                const [catRes, perRes, traitRes, diffRes, ruleRes] = await Promise.all([
-                    operatorApi.getProductCatalog(),
-                    operatorApi.getPersonas(),
-                    operatorApi.getTraits(),
-                    operatorApi.getDifficulties(),
-                    operatorApi.getUpsellRules()
-                ]);
-
-                if (catRes.success) setCatalog(catRes.data.catalog);
-                if (perRes.success) setPersonas(perRes.data.personas);
-                if (traitRes.success) setTraits(traitRes.data.traits);
-                if (diffRes.success) setDifficulties(diffRes.data.levels);
-                if (ruleRes.success) setUpsellRules(ruleRes.data.rules);
-
-                // Initialize defaults
-                if (catRes.success && catRes.data.catalog) {
-                    const c = catRes.data.catalog;
-                    const type = c.types[0];
-                    const cat = c.categories[type]?.[0];
-                    const model = c.models[cat]?.[0];
-                    if (model) {
-                        setSelectedType(type);
-                        setSelectedCategory(cat);
-                        setSelectedModel(model);
-                        setSelectedSize(model.sizes[0]);
-                    }
-                }
-
-                if (diffRes.success && diffRes.data.levels.length > 0) {
-                    setDifficulty(diffRes.data.levels[1] || diffRes.data.levels[0]);
-                }
-
-                // FIX: Select Random Persona initially instead of fixed traits
-                if (perRes.success && perRes.data.personas.length > 0) {
-                    const rndPersona = perRes.data.personas[Math.floor(Math.random() * perRes.data.personas.length)];
-                    setSelectedTraits(rndPersona.mainTraits);
-                    setAge(rndPersona.ageGroup);
-                    setGender(rndPersona.gender);
-                } else if (traitRes.success && traitRes.data.traits.length >= 2) {
-                    setSelectedTraits([traitRes.data.traits[0].id, traitRes.data.traits[1].id]);
-                }
-            } catch (e) {
-                console.error("Failed to load Operator Data", e);
-            } finally {
-                setIsLoading(false);
+        if (error) console.error("Failed to load Operator Data", error);
+    }, [error]);
+
+    // --- Defaults from the first loaded snapshot ---
+    useEffect(() => {
+        if (!bootstrap || defaultsApplied.current) return;
+        defaultsApplied.current = true;
+        performance.mark('saleslab-setup-ready');
+
+        if (bootstrap.catalog) {
+            const c = bootstrap.catalog;
+            const type = c.types[0];
+            const cat = c.categories[type]?.[0];
+            const model = c.models[cat]?.[0];
+            if (model) {
+                setSelectedType(type);
+                setSelectedCategory(cat);
+                setSelectedModel(model);
+                setSelectedSize(model.sizes[0]);
             }
-        };
+        }
 
-        loadData();
-    }, []);
+        if (bootstrap.levels.length > 0) {
+            setDifficulty(bootstrap.levels[1] || bootstrap.levels[0]);
+        }
+
+        // FIX: Select Random Persona initially instead of fixed traits
+        if (bootstrap.personas.length > 0) {
+            const rndPersona = bootstrap.personas[Math.floor(Math.random() * bootstrap.personas.length)];
+            setSelectedTraits(rndPersona.mainTraits);
+            setAge(rndPersona.ageGroup);
+            setGender(rndPersona.gender);
+        } else if (bootstrap.traits.length >= 2) {
+            setSelectedTraits([bootstrap.traits[0].id, bootstrap.traits[1].id]);
+        }
+    }, [bootstrap]);
 
     useEffect(() => {
         const saved = localStorage.getItem('salesLab_savedSession');
@@ -221,7 +209,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
             <div className="space-y-6">
                 <div className="flex p-1 bg-slate-100 rounded-lg border border-slate-200">
                     {catalog.types.map(type => (
-                        <button key={type} onClick={() => setSelectedType(type)} className={clsx("flex-1 py-2 text-xs font-bold rounded-md transition-all", selectedType === type ? "bg-white text-primary shadow-sm border border-slate-200" : "text-slate-500 hover:text-slate-900")}>{type}</button>
+                        <button key={type} data-testid={`product-type-${type}`} onClick={() => setSelectedType(type)} className={clsx("flex-1 py-2 text-xs font-bold rounded-md transition-all", selectedType === type ? "bg-white text-primary shadow-sm border border-slate-200" : "text-slate-500 hover:text-slate-900")}>{type}</button>
                     ))}
                 </div>
                 <div className="flex flex-wrap gap-2">
@@ -229,7 +217,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                         const isBest = productScores?.bestMatch === cat;
                         const isAlt = productScores?.alternative === cat;
                         return (
-                            <button key={cat} onClick={() => { setSelectedCategory(cat); setSelectedModel(catalog.models[cat][0]); }} className={clsx("px-4 py-2 rounded-full text-xs font-bold border transition-all relative", selectedCategory === cat ? "bg-primary text-white border-primary shadow-sm" : "bg-white text-slate-500 border-slate-200 hover:border-slate-300 hover:text-slate-900", (isBest || isAlt) && "pr-3")}>
+                            <button key={cat} data-testid={`product-category-${cat}`} onClick={() => { setSelectedCategory(cat); setSelectedModel(catalog.models[cat][0]); }} className={clsx("px-4 py-2 rounded-full text-xs font-bold border transition-all relative", selectedCategory === cat ? "bg-primary text-white border-primary shadow-sm" : "bg-white text-slate-500 border-slate-200 hover:border-slate-300 hover:text-slate-900", (isBest || isAlt) && "pr-3")}>
                                 {cat}
                                 {isBest && <span className="absolute -top-1 -right-1 w-2.5 h-2.5 bg-yellow-400 rounded-full border border-white" />}
                                 {isAlt && <span className="absolute -top-1 -right-1 w-2.5 h-2.5 bg-slate-400 rounded-full border border-white" />}
@@ -239,7 +227,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                 </div>
                 <div className="space-y-2 max-h-[200px] overflow-y-auto custom-scrollbar pr-1">
                     {catalog.models[selectedCategory]?.map(model => (
-                        <button key={model.id} onClick={() => { setSelectedModel(model); setSelectedSize(model.sizes[0]); }} className={clsx("w-full p-4 rounded-xl border text-left transition-all", selectedModel.id === model.id ? "bg-indigo-50 border-primary/50 text-indigo-900" : "border-slate-200 bg-white text-slate-500 hover:border-slate-300 hover:text-slate-700")}>
+                        <button key={model.id} data-testid={`product-model-${model.id}`} onClick={() => { setSelectedModel(model); setSelectedSize(model.sizes[0]); }} className={clsx("w-full p-4 rounded-xl border text-left transition-all", selectedModel.id === model.id ? "bg-indigo-50 border-primary/50 text-indigo-900" : "border-slate-200 bg-white text-slate-500 hover:border-slate-300 hover:text-slate-700")}>
                             <div className="font-bold text-sm flex justify-between">{model.name} {selectedModel.id === model.id && <Check size={16} className="text-primary" />}</div>
                             <div className="text-xs opacity-70 flex justify-between mt-1"><span>{model.line || model.type}</span><span>${model.basePrice}</span></div>
                         </button>
@@ -250,7 +238,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                     <div className="flex flex-wrap gap-2">
                         {selectedModel.sizes.map(size => {
                             const isRecommended = upsellInfo?.recommendedSizes?.includes(size) || (upsellScore?.recommendation === 'Strong' && size >= 75);
-                            return <button key={size} onClick={() => setSelectedSize(size)} className={clsx("px-4 py-2 rounded-lg border text-xs font-bold transition-all relative", selectedSize === size ? "border-primary bg-indigo-50 text-primary" : "border-slate-200 bg-white text-slate-500 hover:border-slate-300", isRecommended && "ring-1 ring-yellow-500/50 border-yellow-500/50")}>{size}" {isRecommended && <Star size={10} className="absolute -top-1.5 -right-1.5 fill-yellow-400 text-yellow-400" />}</button>
+                            return <button key={size} data-testid={`product-size-${size}`} onClick={() => setSelectedSize(size)} className={clsx("px-4 py-2 rounded-lg border text-xs font-bold transition-all relative", selectedSize === size ? "border-primary bg-indigo-50 text-primary" : "border-slate-200 bg-white text-slate-500 hover:border-slate-300", isRecommended && "ring-1 ring-yellow-500/50 border-yellow-500/50")}>{size}" {isRecommended && <Star size={10} className="absolute -top-1.5 -right-1.5 fill-yellow-400 text-yellow-400" />}</button>
                         })}
                     </div>
                 </div>
@@ -272,7 +260,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                     <label className="text-xs font-bold text-slate-500 uppercase tracking-widest">Simulation Level</label>
                     <div className="flex gap-2 overflow-x-auto pb-2 custom-scrollbar">
                         {difficulties.map((diff) => (
-                            <button key={diff.level} onClick={() => setDifficulty(diff)} className={clsx("flex-shrink-0 px-4 py-2 rounded-xl border transition-all whitespace-nowrap text-xs font-bold", difficulty.level === diff.level ? "border-red-500 bg-red-50 text-red-600" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>Lv.{diff.level}</button>
+                            <button key={diff.level} data-testid={`difficulty-${diff.level}`} onClick={() => setDifficulty(diff)} className={clsx("flex-shrink-0 px-4 py-2 rounded-xl border transition-all whitespace-nowrap text-xs font-bold", difficulty.level === diff.level ? "border-red-500 bg-red-50 text-red-600" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>Lv.{diff.level}</button>
                         ))}
                     </div>
                     <p className="text-xs text-slate-500 italic bg-slate-50 p-2 rounded-lg border border-slate-200">{difficulty.description}</p>
@@ -281,13 +269,13 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                     <div className="space-y-2">
                         <label className="text-xs font-bold text-slate-500 uppercase tracking-widest">Age Group</label>
                         <div className="flex flex-wrap gap-2">
-                            {AGES.map((a) => <button key={a} onClick={() => setAge(a)} className={clsx("px-3 py-1.5 rounded-lg border text-xs transition-all", age === a ? "border-indigo-500 bg-indigo-50 text-indigo-700 font-bold" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>{a}</button>)}
+                            {AGES.map((a) => <button key={a} data-testid={`age-${a}`} onClick={() => setAge(a)} className={clsx("px-3 py-1.5 rounded-lg border text-xs transition-all", age === a ? "border-indigo-500 bg-indigo-50 text-indigo-700 font-bold" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>{a}</button>)}
                         </div>
                     </div>
                     <div className="space-y-2">
                         <label className="text-xs font-bold text-slate-500 uppercase tracking-widest">Gender</label>
                         <div className="flex gap-2">
-                            {GENDERS.map((g) => <button key={g} onClick={() => setGender(g)} className={clsx("flex-1 px-3 py-1.5 rounded-lg border text-xs transition-all", gender === g ? "border-indigo-500 bg-indigo-50 text-indigo-700 font-bold" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>{g}</button>)}
+                            {GENDERS.map((g) => <button key={g} data-testid={`gender-${g}`} onClick={() => setGender(g)} className={clsx("flex-1 px-3 py-1.5 rounded-lg border text-xs transition-all", gender === g ? "border-indigo-500 bg-indigo-50 text-indigo-700 font-bold" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>{g}</button>)}
                         </div>
                     </div>
                 </div>
@@ -302,7 +290,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                     </div>
                     <div className="flex flex-wrap gap-2">
                         {traits.map((trait) => (
-                            <button key={trait.id} onClick={() => toggleTrait(trait.id)} className={clsx("px-3 py-1.5 rounded-full border text-xs transition-all flex items-center gap-1.5 hover:scale-105 active:scale-95", selectedTraits.includes(trait.id) ? "border-secondary bg-secondary text-white shadow-lg shadow-secondary/30" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>{trait.label}</button>
+                            <button key={trait.id} data-testid={`trait-${trait.id}`} onClick={() => toggleTrait(trait.id)} className={clsx("px-3 py-1.5 rounded-full border text-xs transition-all flex items-center gap-1.5 hover:scale-105 active:scale-95", selectedTraits.includes(trait.id) ? "border-secondary bg-secondary text-white shadow-lg shadow-secondary/30" : "border-slate-200 hover:border-slate-300 text-slate-500 bg-white")}>{trait.label}</button>
                         ))}
                     </div>
                 </div>
@@ -336,6 +324,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                     </div>
                     <div className="flex items-center gap-2 md:gap-3">
                         <button
+                            data-testid="setup-api-mode"
                             onClick={toggleDemoMode}
                             className={clsx(
                                 "flex items-center gap-2 px-2 md:px-3 py-1.5 md:py-2 rounded-lg transition-all border",
@@ -353,14 +342,14 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                             </span>
                         </button>
                         <div className="h-6 w-px bg-slate-200 mx-1"></div>
-                        <button onClick={randomizeConfig} className="btn-secondary text-xs px-2 md:px-3"><Shuffle size={14} /> <span className="hidden sm:inline">Randomize</span></button>
-                        <button onClick={onViewHistory} className="btn-secondary text-xs px-2 md:px-3"><History size={14} /> <span className="hidden sm:inline">Records</span></button>
+                        <button data-testid="setup-randomize" onClick={randomizeConfig} className="btn-secondary text-xs px-2 md:px-3"><Shuffle size={14} /> <span className="hidden sm:inline">Randomize</span></button>
+                        <button data-testid="setup-history" onClick={onViewHistory} className="btn-secondary text-xs px-2 md:px-3"><History size={14} /> <span className="hidden sm:inline">Records</span></button>
                     </div>
                 </div>
 
                 <div className="flex flex-col md:grid md:grid-cols-12 gap-4 md:gap-6 flex-1 overflow-visible md:overflow-hidden pb-24 md:pb-0">
                     <div className="md:col-span-4 h-auto md:h-full flex flex-col">
-                        <Section title="Product" icon={Monitor} headerAction={<button onClick={(e) => { e.stopPropagation(); randomizeProduct(); }} className="text-[10px] uppercase font-bold bg-slate-100 hover:bg-slate-200 px-2 py-1 rounded-md flex items-center gap-1 text-slate-500 transition-colors"><Shuffle size={10} /> Auto</button>}>
+                        <Section title="Product" icon={Monitor} headerAction={<button data-testid="setup-randomize-product" onClick={(e) => { e.stopPropagation(); randomizeProduct(); }} className="text-[10px] uppercase font-bold bg-slate-100 hover:bg-slate-200 px-2 py-1 rounded-md flex items-center gap-1 text-slate-500 transition-colors"><Shuffle size={10} /> Auto</button>}>
                             {renderProductContent()}
                         </Section>
                     </div>
@@ -370,6 +359,7 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
                             icon={Target}
                             headerAction={
                                 <button
+                                    data-testid="setup-load-preset"
                                     onClick={() => setIsPresetModalOpen(true)}
                                     className="text-[10px] uppercase font-bold bg-slate-100 hover:bg-slate-200 px-2 py-1 rounded-md flex items-center gap-1 text-slate-500 transition-colors"
                                 >
@@ -384,9 +374,9 @@ export default function SalesLabSetup({ onStart, onViewHistory }) {
 
                 <div className="fixed bottom-20 md:bottom-8 left-4 right-4 md:left-auto md:right-8 lg:static pt-4 lg:pt-6 z-20 flex gap-4 bg-white/80 backdrop-blur-md lg:bg-transparent p-4 lg:p-0 border-t border-slate-200 lg:border-none rounded-t-2xl lg:rounded-none shadow-[0_-5px_20px_rgba(0,0,0,0.05)] lg:shadow-none">
                     {hasSavedSession && (
-                        <button onClick={() => { const saved = JSON.parse(localStorage.getItem('salesLab_savedSession')); if (saved) onStart(saved.config, saved); }} className="flex-1 py-4 text-sm md:text-lg font-bold flex items-center justify-center gap-2 md:gap-3 rounded-xl md:rounded-2xl border border-primary/30 bg-indigo-50 text-primary hover:bg-indigo-100 hover:scale-[1.01] transition-all"><History size={20} /> <span className="hidden sm:inline">Resume</span></button>
+                        <button data-testid="setup-resume" onClick={() => { const saved = JSON.parse(localStorage.getItem('salesLab_savedSession')); if (saved) onStart(saved.config, saved); }} className="flex-1 py-4 text-sm md:text-lg font-bold flex items-center justify-center gap-2 md:gap-3 rounded-xl md:rounded-2xl border border-primary/30 bg-indigo-50 text-primary hover:bg-indigo-100 hover:scale-[1.01] transition-all"><History size={20} /> <span className="hidden sm:inline">Resume</span></button>
                     )}
-                    <PulseButton onClick={handleStart} className="flex-[2] py-4 md:py-5 text-base md:text-xl font-bold tracking-wide flex items-center justify-center gap-3 !rounded-xl md:!rounded-2xl !bg-primary shadow-lg shadow-primary/30">
+                    <PulseButton data-testid="setup-start" onClick={handleStart} className="flex-[2] py-4 md:py-5 text-base md:text-xl font-bold tracking-wide flex items-center justify-center gap-3 !rounded-xl md:!rounded-2xl !bg-primary shadow-lg shadow-primary/30">
                         <Play size={20} fill="currentColor" /> START SIMULATION
                     </PulseButton>
                 </div>
@@ -415,11 +405,11 @@ const PresetModal = ({ onClose, onSelect, personas }) => (
         <div className="bg-white border border-slate-200 rounded-2xl w-full max-w-2xl max-h-[80vh] flex flex-col shadow-2xl overflow-hidden animate-in zoom-in-95 duration-200">
             <div className="p-5 border-b border-slate-100 flex justify-between items-center bg-white z-10">
                 <h2 className="text-xl font-bold text-slate-900 flex items-center gap-3"><Database className="text-primary" /> Load Target Preset</h2>
-                <button onClick={onClose} className="p-2 hover:bg-slate-100 rounded-full transition-colors text-slate-400 hover:text-slate-900"><X size={20} /></button>
+                <button data-testid="preset-close" onClick={onClose} className="p-2 hover:bg-slate-100 rounded-full transition-colors text-slate-400 hover:text-slate-900"><X size={20} /></button>
             </div>
             <div className="flex-1 overflow-y-auto p-5 bg-slate-50 grid grid-cols-1 sm:grid-cols-2 gap-3 custom-scrollbar">
                 {personas.map((persona) => (
-                    <button key={persona.id} onClick={() => onSelect(persona)} className="p-4 rounded-xl border border-slate-200 bg-white hover:border-primary/50 hover:shadow-md transition-all text-left group">
+                    <button key={persona.id} data-testid={`preset-${persona.id}`} onClick={() => onSelect(persona)} className="p-4 rounded-xl border border-slate-200 bg-white hover:border-primary/50 hover:shadow-md transition-all text-left group">
                         <div className="flex justify-between items-start mb-1"><div className="font-bold text-slate-900 group-hover:text-primary transition-colors">{persona.name}</div><div className="text-[10px] font-bold text-slate-500 border border-slate-200 px-1.5 py-0.5 rounded">{persona.ageGroup}</div></div>
                         <div className="text-xs text-slate-500 mb-3 leading-relaxed">{persona.shortDescription}</div>
                         <div className="flex flex-wrap gap-1">{persona.mainTraits.map(t => <span key={t} className="text-[10px] px-2 py-0.5 bg-slate-100 rounded text-slate-600 border border-slate-200">{t}</span>)}</div>
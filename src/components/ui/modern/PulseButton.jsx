@@ -10,7 +10,8 @@ export function PulseButton({
     variant = 'primary', // primary, neon, ghost
     icon: Icon,
     disabled = false,
-    pulse = false
+    pulse = false,
+    ...props
 }) {
     const variants = {
         primary: "bg-primary text-white shadow-lg shadow-primary/30 hover:bg-primary-hover",
@@ -24,6 +25,7 @@ export function PulseButton({
             whileTap={{ scale: 0.95 }}
             onClick={onClick}
             disabled={disabled}
+            {...props}
             className={twMerge(
                 "relative flex items-center justify-center gap-2 font-bold py-3 px-6 rounded-xl transition-all duration-200 disabled:opacity-50 disabled:cursor-not-allowed",
                 variants[variant],
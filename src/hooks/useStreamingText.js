@@ -0,0 +1,35 @@
+import { useCallback, useEffect, useRef, useState } from 'react';
+
+/**
+ * Text of a streamed reply, committed at most once per animation frame.
+ * `append` is cheap enough to pass straight to aiService.sendMessageStream as
+ * `onChunk`: chunks are buffered and a single render per frame shows them all.
+ */
+export function useStreamingText() {
+    const [text, setText] = useState('');
+    const buffer = useRef('');
+    const frame = useRef(null);
+
+    const flush = useCallback(() => {
+        frame.current = null;
+        setText(buffer.current);
+    }, []);
+
+    const append = useCallback((chunk) => {
+        buffer.current += chunk;
+        if (frame.current === null) frame.current = requestAnimationFrame(flush);
+    }, [flush]);
+
+    const reset = useCallback(() => {
+        if (frame.current !== null) cancelAnimationFrame(frame.current);
+        frame.current = null;
+        buffer.current = '';
+        setText('');
+    }, []);
+
+    useEffect(() => () => {
+        if (frame.current !== null) cancelAnimationFrame(frame.current);
+    }, []);
+
+    return { text, append, reset };
+}
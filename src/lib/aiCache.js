@@ -0,0 +1,120 @@
+/**
+ * AI Response Cache
+ * Content-addressed cache for deterministic Gemini calls (course generation,
+ * daily missions, interaction analysis). Entries are keyed on
+ * SHA-256(model + prompt + generationConfig), stored in IndexedDB via localDB,
+ * expire after a per-call TTL and are evicted least-recently-used first.
+ * The cache only ever speeds calls up: if it cannot work (no SubtleCrypto on a
+ * plain-HTTP origin, IndexedDB errors) the call goes straight to Gemini.
+ */
+
+import { localDB } from './storage';
+
+const MAX_ENTRIES = 200;
+
+const stats = { hits: 0, misses: 0, writes: 0, evictions: 0, errors: 0 };
+
+// Concurrent requests for the same key share one Gemini call (only those without an AbortSignal)
+const inFlight = new Map();
+
+const toHex = (buffer) => Array.from(new Uint8Array(buffer), b => b.toString(16).padStart(2, '0')).join('');
+
+// 64-bit FNV-1a (two 32-bit lanes) for insecure origins, where crypto.subtle is undefined
+const fallbackDigest = (material) => {
+    let low = 0x811c9dc5;
+    let high = 0xcbf29ce4;
+    for (let i = 0; i < material.length; i++) {
+        const code = material.charCodeAt(i);
+        low = Math.imul(low ^ code, 0x01000193);
+        high = Math.imul(high ^ code ^ (low >>> 16), 0x01000193);
+    }
+    return `fnv-${(high >>> 0).toString(16).padStart(8, '0')}${(low >>> 0).toString(16).padStart(8, '0')}`;
+};
+
+export const aiCache = {
+    async keyFor(model, prompt, generationConfig = {}) {
+        const material = JSON.stringify({ model, prompt, generationConfig });
+        if (!globalThis.crypto?.subtle) return fallbackDigest(material);
+        const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(material));
+        return toHex(digest);
+    },
+
+    async get(key) {
+        try {
+            const entry = await localDB.getCacheEntry(key);
+            if (!entry) return undefined;
+            if (entry.expiresAt <= Date.now()) {
+                await localDB.deleteCacheEntry(key);
+                return undefined;
+            }
+            // Touch for LRU ordering; no need to wait for the write
+            localDB.putCacheEntry({ ...entry, lastAccess: Date.now() }).catch(() => { });
+            return entry.value;
+        } catch (e) {
+            stats.errors += 1;
+            console.warn("[aiCache] Read failed", e);
+            return undefined;
+        }
+    },
+
+    async set(key, value, ttlMs) {
+        try {
+            const now = Date.now();
+            await localDB.putCacheEntry({ key, value, createdAt: now, lastAccess: now, expiresAt: now + ttlMs });
+            stats.writes += 1;
+            stats.evictions += await localDB.pruneCache(MAX_ENTRIES);
+        } catch (e) {
+            stats.errors += 1;
+            console.warn("[aiCache] Write failed", e);
+        }
+    },
+
+    /**
+     * Returns the cached value for this request or runs `produce()` and caches its result.
+     * Results for which `shouldCache(value)` is false (errors, quota) are returned but not stored.
+     * Pass the call's `signal`, if any: a cancellable call never shares another caller's
+     * request, whose abort would otherwise reject it too.
+     */
+    async getOrCreate({ model, prompt, generationConfig, ttlMs, shouldCache = Boolean, signal }, produce) {
+        let key;
+        try {
+            key = await aiCache.keyFor(model, prompt, generationConfig);
+        } catch (e) {
+            stats.errors += 1;
+            console.warn("[aiCache] Key failed", e);
+            return produce();
+        }
+        const cached = await aiCache.get(key);
+        if (cached !== undefined) {
+            stats.hits += 1;
+            return cached;
+        }
+        if (!signal && inFlight.has(key)) {
+            stats.hits += 1;
+            return inFlight.get(key);
+        }
+
+        stats.misses += 1;
+        const pending = (async () => {
+            const value = await produce();
+            if (shouldCache(value)) await aiCache.set(key, value, ttlMs);
+            return value;
+        })();
+        if (signal) return pending;
+        inFlight.set(key, pending);
+        try {
+            return await pending;
+        } finally {
+            inFlight.delete(key);
+        }
+    },
+
+    getStats() {
+        const lookups = stats.hits + stats.misses;
+        return { ...stats, hitRate: lookups ? stats.hits / lookups : 0 };
+    },
+
+    async clear() {
+        await localDB.clearCache();
+    }
+};
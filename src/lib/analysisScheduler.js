@@ -0,0 +1,95 @@
+/**
+ * Analysis Scheduler for Sales Lab roleplay
+ * Runs aiService.analyzeInteraction off the critical path of a turn:
+ * - skips turns that cannot move the sales stage (see shouldSkipAnalysis); a
+ *   skipped turn leaves the analysis of the previous turn running;
+ * - aborts an in-flight analysis (AbortController) once a newer turn is scheduled,
+ *   and never delivers a stale result;
+ * - optionally debounces (`debounceMs`), so a turn superseded before the timer
+ *   fires never hits Gemini. Off by default: SalesLabChat sends one turn at a
+ *   time, so turns never arrive close enough for a debounce to save a call.
+ */
+
+const STAGE_ORDER = ['greeting', 'needs', 'proposal', 'objection', 'closing'];
+
+const ACKNOWLEDGEMENT = /^(ok(ay)?|yes|yeah|yep|sure|right|i see|got it|thanks?( you)?|네|예|응|아하|그렇군요|좋아요|감사합니다)[\s.!~]*$/i;
+
+/**
+ * True when analysing this turn cannot change anything the HUD shows:
+ * a bare acknowledgement, or the final stage is reached with every trait discovered.
+ */
+export const shouldSkipAnalysis = ({ text, currentStep, traits = [], discoveredTraits = [] }) => {
+    if (ACKNOWLEDGEMENT.test(text.trim())) return true;
+    const atFinalStage = currentStep === STAGE_ORDER[STAGE_ORDER.length - 1];
+    const allTraitsFound = traits.every(t => discoveredTraits.includes(t.id));
+    return atFinalStage && allTraitsFound;
+};
+
+export const createAnalysisScheduler = ({ analyze, debounceMs = 0 }) => {
+    let generation = 0;
+    let timer = null;
+    let resolveQueued = null;
+    let controller = null;
+    const stats = { requested: 0, executed: 0, skipped: 0, debounced: 0, aborted: 0 };
+
+    const supersede = () => {
+        if (timer) {
+            clearTimeout(timer);
+            timer = null;
+            stats.debounced += 1;
+            resolveQueued?.(null);
+            resolveQueued = null;
+        }
+        if (controller) {
+            controller.abort();
+            controller = null;
+            stats.aborted += 1;
+        }
+    };
+
+    return {
+        /**
+         * Schedules analyze(...args, { signal }). Resolves with the analysis, or null
+         * when the turn was skipped, superseded or failed.
+         */
+        schedule(args, { skip = false } = {}) {
+            stats.requested += 1;
+            if (skip) {
+                stats.skipped += 1;
+                return Promise.resolve(null);
+            }
+
+            supersede();
+            const id = ++generation;
+
+            return new Promise((resolve) => {
+                resolveQueued = resolve;
+                timer = setTimeout(async () => {
+                    timer = null;
+                    resolveQueued = null;
+                    const ctrl = new AbortController();
+                    controller = ctrl;
+                    stats.executed += 1;
+                    try {
+                        const result = await analyze(...args, { signal: ctrl.signal });
+                        resolve(id === generation && !ctrl.signal.aborted ? result : null);
+                    } catch {
+                        resolve(null);
+                    } finally {
+                        if (controller === ctrl) controller = null;
+                    }
+                }, debounceMs);
+            });
+        },
+
+        cancel() {
+            supersede();
+            generation += 1;
+        },
+
+        // `saved` counts Gemini calls that were never sent
+        getStats() {
+            return { ...stats, saved: stats.skipped + stats.debounced };
+        }
+    };
+};
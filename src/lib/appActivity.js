@@ -0,0 +1,71 @@
+/**
+ * App Activity Marker
+ * Counts in-flight async work (AI calls, operator API calls, boot) and mirrors it
+ * on <html data-app-busy="n">. The attribute is removed one frame after the last
+ * task finishes, so "no attribute" means the UI has committed the result.
+ * index.html ships with the attribute set; the first commit of <App /> calls
+ * markReady() to release that initial boot task.
+ * Writes batched for an idle callback (StorageAdapter, chatHistory) are counted
+ * separately on <html data-app-saving="n">, from when they are queued until the
+ * transaction settles; they do not make the UI busy.
+ * The E2E waits in testsprite_tests/harness/waits.py key off this marker.
+ */
+
+let pending = 1; // boot, released by markReady()
+let ready = false;
+let saving = 0;
+
+const publish = () => {
+    if (typeof document === 'undefined') return;
+    const root = document.documentElement;
+    if (pending > 0) {
+        root.dataset.appBusy = String(pending);
+        return;
+    }
+    requestAnimationFrame(() => {
+        if (pending === 0) delete root.dataset.appBusy;
+    });
+};
+
+const publishSaving = () => {
+    if (typeof document === 'undefined') return;
+    const root = document.documentElement;
+    if (saving > 0) root.dataset.appSaving = String(saving);
+    else delete root.dataset.appSaving;
+};
+
+export const appActivity = {
+    begin: () => {
+        pending += 1;
+        publish();
+    },
+
+    end: () => {
+        pending = Math.max(0, pending - 1);
+        publish();
+    },
+
+    // Marks the app busy until `promise` settles and passes it through untouched
+    track: (promise) => {
+        appActivity.begin();
+        return Promise.resolve(promise).finally(appActivity.end);
+    },
+
+    beginSave: () => {
+        saving += 1;
+        publishSaving();
+    },
+
+    endSave: () => {
+        saving = Math.max(0, saving - 1);
+        publishSaving();
+    },
+
+    markReady: () => {
+        if (ready) return;
+        ready = true;
+        appActivity.end();
+    },
+
+    isBusy: () => pending > 0
+};
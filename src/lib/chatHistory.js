@@ -0,0 +1,179 @@
+/**
+ * Chat History
+ * Persists chat transcripts to IndexedDB (the chatMessages / chatSessions stores
+ * in storage.js) without touching the render path:
+ * - append() only queues the message; queued messages are written together in
+ *   one transaction when the browser is idle, and on pagehide;
+ * - a session is reopened one page at a time: latestPage() reads the newest
+ *   PAGE_SIZE messages with a backwards cursor, olderPage() the page before;
+ * - compact() runs once per load when the browser is idle. Ended sessions beyond
+ *   the KEEP_FULL_SESSIONS most recent are reduced to a short summary stored on
+ *   the session record and their messages are deleted; ended sessions beyond
+ *   MAX_SESSIONS are deleted altogether.
+ */
+
+import { localDB } from './storage';
+import { appActivity } from './appActivity';
+
+export const PAGE_SIZE = 50;
+const KEEP_FULL_SESSIONS = 5;
+const MAX_SESSIONS = 50;
+const SUMMARY_QUESTIONS = 5;
+const SUMMARY_TEXT_LENGTH = 120;
+const IDLE_TIMEOUT_MS = 1000;
+
+const queue = []; // messages waiting to be written
+const dirtySessions = new Map(); // session id -> session record to write
+let scheduled = false;
+let flushing = Promise.resolve();
+let compaction = null;
+
+const whenIdle = (callback) => {
+    if (typeof requestIdleCallback === 'function') requestIdleCallback(callback, { timeout: IDLE_TIMEOUT_MS });
+    else setTimeout(callback, 50);
+};
+
+const schedule = () => {
+    if (scheduled) return;
+    scheduled = true;
+    appActivity.beginSave();
+    whenIdle(() => {
+        scheduled = false;
+        chatHistory.flush().finally(appActivity.endSave);
+    });
+};
+
+const touch = (session, changes) => {
+    Object.assign(session, changes, { updatedAt: Date.now() });
+    dirtySessions.set(session.id, { ...session });
+};
+
+const clip = (text) => (text.length > SUMMARY_TEXT_LENGTH ? `${text.slice(0, SUMMARY_TEXT_LENGTH - 1)}…` : text);
+
+// A local digest, no model call: size, time span and the first questions asked
+const summarize = (messages) => ({
+    messageCount: messages.length,
+    firstAt: messages[0]?.createdAt ?? null,
+    lastAt: messages[messages.length - 1]?.createdAt ?? null,
+    questions: messages
+        .filter(m => m.role === 'user' && m.text)
+        .slice(0, SUMMARY_QUESTIONS)
+        .map(m => clip(m.text.trim()))
+});
+
+export const chatHistory = {
+    /** A new, not yet written session record; it is saved with its first message. */
+    newSession(kind) {
+        const now = Date.now();
+        return { id: `${kind}-${now}`, kind, startedAt: now, updatedAt: now, messageCount: 0, endedAt: null };
+    },
+
+    /** Queues one message of `session` (a record from newSession/latestPage, updated in place). */
+    append(session, message) {
+        queue.push({
+            sessionId: session.id,
+            seq: message.seq,
+            id: message.id,
+            role: message.role,
+            text: message.text,
+            createdAt: Date.now()
+        });
+        touch(session, { messageCount: session.messageCount + 1 });
+        schedule();
+    },
+
+    /** Marks a session finished so compaction may summarise it; resolves once written. */
+    endSession(session) {
+        touch(session, { endedAt: Date.now() });
+        return chatHistory.flush();
+    },
+
+    /** Writes all queued messages in one transaction; resolves once it is committed. */
+    flush() {
+        if (queue.length === 0 && dirtySessions.size === 0) return flushing;
+        const messages = queue.splice(0);
+        const sessions = Array.from(dirtySessions.values());
+        dirtySessions.clear();
+        flushing = flushing
+            .then(() => localDB.appendChatMessages(sessions, messages))
+            .catch(e => console.error("[chatHistory] Save failed", e));
+        return flushing;
+    },
+
+    /**
+     * The most recent unfinished session of `kind` with its newest page of messages
+     * (oldest first), or a new session if there is none. Schedules compaction.
+     */
+    async latestPage(kind) {
+        await chatHistory.flush();
+        try {
+            const sessions = await localDB.getChatSessions(); // oldest update first
+            const session = sessions.reverse().find(s => s.kind === kind && !s.endedAt);
+            if (session) {
+                const page = await localDB.getChatPage(session.id, { limit: PAGE_SIZE });
+                return { session, ...page };
+            }
+        } catch (e) {
+            console.error("[chatHistory] Load failed", e);
+        } finally {
+            compaction ??= new Promise(resolve => whenIdle(() => chatHistory.compact().then(resolve)));
+        }
+        return { session: chatHistory.newSession(kind), messages: [], hasOlder: false };
+    },
+
+    /** The page of messages before `beforeSeq`, oldest first. */
+    async olderPage(sessionId, beforeSeq) {
+        try {
+            return await localDB.getChatPage(sessionId, { beforeSeq, limit: PAGE_SIZE });
+        } catch (e) {
+            console.error("[chatHistory] Load failed", e);
+            return { messages: [], hasOlder: false };
+        }
+    },
+
+    /** Summarises and prunes old ended sessions; resolves with what it did. */
+    async compact() {
+        const result = { compacted: 0, deleted: 0 };
+        try {
+            const sessions = await localDB.getChatSessions();
+            const ended = sessions.filter(s => s.endedAt).reverse(); // newest first
+            for (const [index, session] of ended.entries()) {
+                if (index >= MAX_SESSIONS) {
+                    await localDB.deleteChatSession(session.id);
+                    result.deleted += 1;
+                } else if (index >= KEEP_FULL_SESSIONS && !session.compactedAt) {
+                    const messages = await localDB.getChatMessages(session.id);
+                    await localDB.compactChatSession({ ...session, summary: summarize(messages), compactedAt: Date.now() });
+                    result.compacted += 1;
+                }
+            }
+        } catch (e) {
+            console.error("[chatHistory] Compaction failed", e);
+        }
+        return result;
+    },
+
+    // --- Sales Lab sessions: few and small, written straight away ---
+    async loadLabSessions() {
+        try {
+            const sessions = await localDB.getLabSessions();
+            return sessions.sort((a, b) => a.id - b.id);
+        } catch (e) {
+            console.error("[chatHistory] Load of Sales Lab sessions failed", e);
+            return [];
+        }
+    },
+
+    saveLabSession(session) {
+        localDB.saveLabSession(session).catch(e => console.error("[chatHistory] Save of Sales Lab session failed", e));
+    },
+
+    clearLabSessions() {
+        localDB.clearLabSessions().catch(e => console.error("[chatHistory] Clear of Sales Lab sessions failed", e));
+    }
+};
+
+// Best effort: write a pending batch before the page goes away
+if (typeof window !== 'undefined') {
+    window.addEventListener('pagehide', () => chatHistory.flush());
+}
@@ -0,0 +1,52 @@
+/**
+ * Chunked List
+ * An immutable, append-optimised list for long histories kept in zustand.
+ * Items live in fixed-size frozen chunks: appending copies only the last chunk
+ * and the short array of chunk references, never the items already stored, and
+ * every full chunk is shared with the previous version. The cost (and garbage)
+ * of an append stays flat however long the history grows.
+ *
+ * Readers use `list.length` and at(list, i), which is all a virtual list needs;
+ * toArray(list) builds (and caches) a plain array for callers that need one.
+ */
+
+const CHUNK_SIZE = 64;
+
+export const EMPTY_LIST = Object.freeze({ chunks: Object.freeze([]), length: 0 });
+
+const arrays = new WeakMap(); // list -> toArray() result
+
+export const append = (list, item) => {
+    const { chunks, length } = list;
+    const last = chunks[chunks.length - 1];
+    const nextChunks = !last || last.length === CHUNK_SIZE
+        ? [...chunks, Object.freeze([item])]
+        : [...chunks.slice(0, -1), Object.freeze([...last, item])];
+    return Object.freeze({ chunks: Object.freeze(nextChunks), length: length + 1 });
+};
+
+export const fromArray = (items) => items.reduce(append, EMPTY_LIST);
+
+export const at = (list, index) => {
+    if (index < 0 || index >= list.length) return undefined;
+    return list.chunks[Math.floor(index / CHUNK_SIZE)][index % CHUNK_SIZE];
+};
+
+export const last = (list) => at(list, list.length - 1);
+
+export const toArray = (list) => {
+    let items = arrays.get(list);
+    if (!items) {
+        items = Object.freeze(list.chunks.flat());
+        arrays.set(list, items);
+    }
+    return items;
+};
+
+export const find = (list, predicate) => {
+    for (const chunk of list.chunks) {
+        const found = chunk.find(predicate);
+        if (found !== undefined) return found;
+    }
+    return undefined;
+};
@@ -0,0 +1,113 @@
+/**
+ * Conversation Context Manager
+ * Bounds the conversation history sent with Gemini prompts: the last K turns go
+ * verbatim, older turns are folded into a rolling extractive summary, and both
+ * are capped by a token budget chosen per call site. Condensed lines are memoised
+ * per message, so each turn only condenses the messages that just left the window.
+ */
+
+export const CONTEXT_BUDGETS = {
+    analysis: { recentTurns: 6, summaryTokens: 150, maxTokens: 600 },
+    roleplay: { recentTurns: 12, summaryTokens: 300, maxTokens: 1500 },
+    feedback: { recentTurns: 24, summaryTokens: 800, maxTokens: 4000 }
+};
+
+const SUMMARY_LINE_CHARS = 120;
+// Opening turns usually carry the customer's situation; keep them in the summary
+const SUMMARY_HEAD_LINES = 2;
+
+const condensed = new WeakMap();
+const stats = {};
+
+const defaultTextOf = (message) => message.text || '';
+const defaultLabelOf = (message) => message.role;
+
+const condense = (message, textOf) => {
+    if (condensed.has(message)) return condensed.get(message);
+    const text = textOf(message).replace(/\s+/g, ' ').trim();
+    const firstSentence = text.match(/^.+?[.!?。？！](\s|$)/)?.[0].trim() ?? text;
+    const line = firstSentence.length > SUMMARY_LINE_CHARS
+        ? `${firstSentence.slice(0, SUMMARY_LINE_CHARS - 1)}…`
+        : firstSentence;
+    condensed.set(message, line);
+    return line;
+};
+
+const record = (callSite, fullTokens, promptTokens) => {
+    const entry = stats[callSite] ??= { calls: 0, fullTokens: 0, promptTokens: 0, savedTokens: 0, lastSavedTokens: 0 };
+    entry.calls += 1;
+    entry.fullTokens += fullTokens;
+    entry.promptTokens += promptTokens;
+    entry.lastSavedTokens = fullTokens - promptTokens;
+    entry.savedTokens += entry.lastSavedTokens;
+};
+
+export const conversationContext = {
+    /** Rough token count: ~4 chars per token for Latin text, ~1 per CJK character. */
+    estimateTokens(text = '') {
+        const cjk = (text.match(/[\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af]/g) || []).length;
+        return cjk + Math.ceil((text.length - cjk) / 4);
+    },
+
+    /**
+     * Builds the bounded context for `history` under the budget of `callSite`.
+     * Returns { text, summary, recent, summarized, fullTokens, promptTokens, savedTokens },
+     * where `recent` holds the original message objects kept verbatim and `summarized`
+     * counts the messages folded into `summary`.
+     */
+    build(history = [], callSite, { textOf = defaultTextOf, labelOf = defaultLabelOf } = {}) {
+        const budget = CONTEXT_BUDGETS[callSite];
+        const tokens = (text) => conversationContext.estimateTokens(text);
+        const lineOf = (m) => `${labelOf(m)}: ${textOf(m)}`;
+
+        const lines = history.map(lineOf);
+        const fullTokens = tokens(lines.join('\n'));
+
+        let split = Math.max(0, history.length - budget.recentTurns);
+        let recentTokens = tokens(lines.slice(split).join('\n'));
+        const recentBudget = budget.maxTokens - budget.summaryTokens;
+        while (split < history.length - 1 && recentTokens > recentBudget) {
+            recentTokens -= tokens(lines[split]) + 1;
+            split += 1;
+        }
+
+        const older = history.slice(0, split);
+        const summaryLines = older.map(m => `${labelOf(m)}: ${condense(m, textOf)}`);
+        const head = summaryLines.slice(0, SUMMARY_HEAD_LINES);
+        let used = tokens(head.join('\n'));
+        const tail = [];
+        for (let i = summaryLines.length - 1; i >= head.length; i--) {
+            const cost = tokens(summaryLines[i]) + 1;
+            if (used + cost > budget.summaryTokens) break;
+            tail.unshift(summaryLines[i]);
+            used += cost;
+        }
+        const omitted = summaryLines.length - head.length - tail.length;
+        const summary = [
+            ...head,
+            ...(omitted > 0 ? [`(${omitted} turns omitted)`] : []),
+            ...tail
+        ].join('\n');
+
+        const recentText = lines.slice(split).join('\n');
+        const windowed = `[Summary of earlier turns]\n${summary}\n\n[Most recent turns]\n${recentText}`;
+
+        // Short histories (or ones the summary can't shrink) go out in full
+        const result = split > 0 && tokens(windowed) < fullTokens
+            ? { text: windowed, summary, recent: history.slice(split), summarized: split }
+            : { text: lines.join('\n'), summary: '', recent: history, summarized: 0 };
+
+        const promptTokens = result.summarized ? tokens(result.text) : fullTokens;
+        record(callSite, fullTokens, promptTokens);
+        return { ...result, fullTokens, promptTokens, savedTokens: fullTokens - promptTokens };
+    },
+
+    /** Per call site: calls, fullTokens, promptTokens, savedTokens, lastSavedTokens. */
+    getStats() {
+        return Object.fromEntries(Object.entries(stats).map(([site, entry]) => [site, { ...entry }]));
+    },
+
+    resetStats() {
+        Object.keys(stats).forEach(site => delete stats[site]);
+    }
+};
@@ -1,18 +1,15 @@
-import * as pdfjsLib from 'pdfjs-dist';
+// PDF pages are read in a bundled worker (pdfText.worker.js), not on the main thread
+const PAGE_CONCURRENCY = 4;
+// Bounds the text kept from one file, in place of a page limit
+export const MAX_PDF_TEXT_CHARS = 2_000_000;
 
-// Set worker source
-try {
-    if (pdfjsLib && pdfjsLib.GlobalWorkerOptions) {
-        pdfjsLib.GlobalWorkerOptions.workerSrc = `https://unpkg.com/pdfjs-dist@${pdfjsLib.version}/build/pdf.worker.min.js`;
-    }
-} catch (e) {
-    console.warn("Failed to set PDF worker source", e);
-}
+const abortError = () => new DOMException("PDF extraction was cancelled", "AbortError");
 
 export const fileProcessor = {
-    async extractText(file) {
+    // `options` ({ signal, maxChars, onPage }) apply to PDFs, see extractPdfText
+    async extractText(file, options = {}) {
         if (file.type === 'application/pdf') {
-            return this.extractPdfText(file);
+            return this.extractPdfText(file, options);
         } else if (file.type.startsWith('text/') || file.name.endsWith('.md')) {
             return this.extractPlainText(file);
         } else {
@@ -31,24 +28,79 @@ export const fileProcessor = {
         });
     },
 
-    async extractPdfText(file) {
-        try {
-            const arrayBuffer = await file.arrayBuffer();
-            const pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
-            let fullText = '';
+    /**
+     * Yields { pageNumber, numPages, text } for each page in order, as soon as the
+     * worker has it; pages after it may already be in progress. Stops after about
+     * `maxChars` characters. Aborting `signal` or leaving the loop early stops the worker.
+     */
+    async *streamPdfPages(file, { signal, concurrency = PAGE_CONCURRENCY, maxChars = MAX_PDF_TEXT_CHARS } = {}) {
+        const data = await file.arrayBuffer();
+        if (signal?.aborted) throw abortError();
 
-            // Limit to first 10 pages to avoid huge payloads
-            const maxPages = Math.min(pdf.numPages, 10);
+        const worker = new Worker(new URL('./pdfText.worker.js', import.meta.url), { type: 'module' });
+        const ready = new Map(); // page number -> text, until its turn comes
+        let numPages = null;
+        let done = false;
+        let failure = null;
+        let wake = null;
+        const notify = () => {
+            wake?.();
+            wake = null;
+        };
+        worker.onmessage = ({ data: message }) => {
+            if (message.type === 'meta') numPages = message.numPages;
+            else if (message.type === 'page') ready.set(message.pageNumber, message.text);
+            else if (message.type === 'done') done = true;
+            else if (message.type === 'error') failure = new Error(message.message);
+            notify();
+        };
+        worker.onerror = (event) => {
+            failure = new Error(event.message || "PDF worker failed");
+            notify();
+        };
+        const onAbort = () => {
+            failure = abortError();
+            notify();
+        };
+        signal?.addEventListener('abort', onAbort);
 
-            for (let i = 1; i <= maxPages; i++) {
-                const page = await pdf.getPage(i);
-                const textContent = await page.getTextContent();
-                const pageText = textContent.items.map(item => item.str).join(' ');
-                fullText += `--- Page ${i} ---\n${pageText}\n\n`;
+        try {
+            worker.postMessage({ type: 'extract', data, concurrency, maxChars }, [data]);
+            let pageNumber = 1;
+            while (true) {
+                if (failure) throw failure;
+                if (ready.has(pageNumber)) {
+                    const text = ready.get(pageNumber);
+                    ready.delete(pageNumber);
+                    yield { pageNumber, numPages, text };
+                    pageNumber += 1;
+                } else if (done) {
+                    return;
+                } else {
+                    await new Promise(resolve => { wake = resolve; });
+                }
             }
+        } finally {
+            signal?.removeEventListener('abort', onAbort);
+            worker.terminate();
+        }
+    },
 
-            return fullText;
+    // Whole-document text, built up page by page; `onPage` sees each page as it arrives
+    async extractPdfText(file, { signal, maxChars = MAX_PDF_TEXT_CHARS, onPage } = {}) {
+        try {
+            const parts = [];
+            let length = 0;
+            for await (const page of this.streamPdfPages(file, { signal, maxChars })) {
+                const part = `--- Page ${page.pageNumber} ---\n${page.text}\n\n`;
+                parts.push(part);
+                length += part.length;
+                onPage?.(page);
+                if (length >= maxChars) break;
+            }
+            return parts.join('');
         } catch (error) {
+            if (error.name === 'AbortError') throw error;
             console.error("PDF Extraction Failed", error);
             throw new Error("Failed to read PDF");
         }
@@ -1,8 +1,25 @@
 import { GoogleGenerativeAI } from "@google/generative-ai";
-import { operatorApi } from '../services/operatorApi';
+import { queryClient, salesLabBootstrapQuery } from './queryClient';
 import { useAppStore } from '../store/appStore';
+import { appActivity } from './appActivity';
+import { aiCache } from './aiCache';
+import { conversationContext } from './conversationContext';
 
 const API_KEY = import.meta.env.VITE_GEMINI_API_KEY;
+// Optional endpoint override, e.g. the offline stand-in in testsprite_tests/harness/gemini_stub.py
+const BASE_URL = import.meta.env.VITE_GEMINI_BASE_URL;
+const REQUEST_OPTIONS = BASE_URL ? { baseUrl: BASE_URL } : undefined;
+
+// How much of an uploaded file generateCourse puts in its prompt
+export const COURSE_CONTEXT_CHARS = 1000;
+
+// Deterministic JSON calls are served from aiCache for this long
+const JSON_GENERATION_CONFIG = { responseMimeType: "application/json" };
+const CACHE_TTL = {
+    analysis: 10 * 60 * 1000,
+    dailyMission: 6 * 60 * 60 * 1000,
+    course: 7 * 24 * 60 * 60 * 1000
+};
 
 const getGenAI = () => {
     if (!API_KEY) {
@@ -59,6 +76,42 @@ const TRAINER_INSTRUCTION = `
 let tutorSession = null;
 let roleplaySession = null;
 
+// Roleplay chat history is bounded by conversationContext: the full transcript is kept
+// here and the chat is restarted from summary + recent turns once it outgrows its budget.
+const ROLEPLAY_GENERATION_CONFIG = { maxOutputTokens: 2000, temperature: 0.9 };
+let roleplayModel = null;
+let roleplayTranscript = [];
+let roleplaySeedLength = 0;
+
+const contentText = (content) => content.parts.map(p => p.text || '').join('');
+const ROLEPLAY_CONTEXT = {
+    textOf: contentText,
+    labelOf: (content) => content.role === 'model' ? 'Customer (you)' : 'Salesperson'
+};
+
+const windowRoleplaySession = async () => {
+    const history = await roleplaySession.getHistory();
+    roleplayTranscript.push(...history.slice(roleplaySeedLength));
+
+    const context = conversationContext.build(roleplayTranscript, 'roleplay', ROLEPLAY_CONTEXT);
+    if (!context.summarized) {
+        roleplaySeedLength = history.length;
+        return roleplaySession;
+    }
+
+    // Chat history must open with a user turn and alternate from there
+    const firstUser = context.recent.findIndex(c => c.role === 'user');
+    const recent = firstUser === -1 ? [] : context.recent.slice(firstUser);
+    const seed = [
+        { role: 'user', parts: [{ text: `(Summary of our conversation so far)\n${context.summary}` }] },
+        { role: 'model', parts: [{ text: 'OK.' }] },
+        ...recent
+    ];
+    roleplaySession = roleplayModel.startChat({ history: seed, generationConfig: ROLEPLAY_GENERATION_CONFIG });
+    roleplaySeedLength = seed.length;
+    return roleplaySession;
+};
+
 // --- MOCK DATA FOR DEMO MODE ---
 const MOCK_SCRIPTS = {
     start: (name) => `안녕하세요! 매장 디스플레이를 보고 들어왔는데, 새로 나온 TV 모델들 좀 볼 수 있을까요? 제가 요즘 넷플릭스를 많이 봐서 화질 좋은 걸로 찾고 있어요.`,
@@ -132,7 +185,7 @@ export const aiService = {
         const model = genAI.getGenerativeModel({
             model: "gemini-2.0-flash",
             systemInstruction: systemInstruction
-        });
+        }, REQUEST_OPTIONS);
 
         tutorSession = model.startChat({
             history: [],
@@ -178,13 +231,8 @@ export const aiService = {
             const description = persona.description || `A customer interested in buying a TV. Age: ${customer.age}, Gender: ${customer.gender}.`;
 
             // --- FETCH OPERATOR LOGIC (The "Brain" Connection) ---
-            const [rulesRes, stagesRes] = await Promise.all([
-                operatorApi.getUpsellRules(),
-                operatorApi.getStages()
-            ]);
-
-            const allRules = rulesRes.success ? rulesRes.data.rules : [];
-            const stages = stagesRes.success ? stagesRes.data.stages : [];
+            // Usually already cached by the Sales Lab setup screen (one batched read)
+            const { rules: allRules = [], stages = [] } = await queryClient.ensureQueryData(salesLabBootstrapQuery);
 
             // Filter Applicable Rules based on Context
             const relevantRules = allRules.filter(rule => {
@@ -265,14 +313,15 @@ export const aiService = {
             const model = genAI.getGenerativeModel({
                 model: "gemini-2.0-flash",
                 systemInstruction: prompt
-            });
+            }, REQUEST_OPTIONS);
 
+            roleplayModel = model;
+            roleplayTranscript = [];
+            roleplaySeedLength = 0;
+            conversationContext.resetStats();
             roleplaySession = model.startChat({
                 history: [],
-                generationConfig: {
-                    maxOutputTokens: 2000,
-                    temperature: 0.9,
-                },
+                generationConfig: ROLEPLAY_GENERATION_CONFIG,
             });
 
             // Generate first message
@@ -289,7 +338,7 @@ export const aiService = {
         }
     },
 
-    analyzeInteraction: async (lastUserMessage, conversationHistory, config, language = 'en') => {
+    analyzeInteraction: async (lastUserMessage, conversationHistory, config, language = 'en', { signal } = {}) => {
         const isDemo = useAppStore.getState().isDemoMode;
 
         if (isDemo) {
@@ -309,7 +358,7 @@ export const aiService = {
         }
 
         const genAI = getGenAI();
-        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash", generationConfig: { responseMimeType: "application/json" } });
+        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash", generationConfig: JSON_GENERATION_CONFIG }, REQUEST_OPTIONS);
 
         const langMap = {
             'ko': 'Korean',
@@ -328,7 +377,7 @@ export const aiService = {
         - Current Language: ${targetLang}
 
         **Conversation History:**
-        ${conversationHistory.map(m => `${m.role}: ${m.text}`).join('\n')}
+        ${conversationContext.build(conversationHistory, 'analysis').text}
         User: ${lastUserMessage}
 
         **Task:**
@@ -356,10 +405,18 @@ export const aiService = {
         `;
 
         try {
-            const result = await model.generateContent(prompt);
-            const response = await result.response;
-            return JSON.parse(response.text());
+            return await aiCache.getOrCreate({
+                model: "gemini-2.0-flash", prompt, generationConfig: JSON_GENERATION_CONFIG, ttlMs: CACHE_TTL.analysis, signal
+            }, async () => {
+                const result = await model.generateContent(prompt, { signal });
+                const response = await result.response;
+                return JSON.parse(response.text());
+            });
         } catch (error) {
+            // Superseded by a newer turn (see analysisScheduler)
+            if (signal?.aborted) {
+                return { nextStep: null, discoveredTrait: null, objectionDetected: false, objectionHint: null, aborted: true };
+            }
             console.error("Analysis failed:", error);
             if (error.message.includes('429') || error.message.toLowerCase().includes('quota')) {
                 return { nextStep: null, discoveredTrait: null, objectionDetected: false, objectionHint: null, error: 'QUOTA_EXCEEDED' };
@@ -408,6 +465,8 @@ export const aiService = {
             }
             // For Tutor, auto-recover
             activeSession = await aiService.initTutor(TRAINER_INSTRUCTION);
+        } else if (isRoleplay) {
+            activeSession = await windowRoleplaySession();
         }
 
         let langInstruction = "";
@@ -523,6 +582,8 @@ export const aiService = {
                 return { text: msg, speech: "" };
             }
             activeSession = await aiService.initTutor(TRAINER_INSTRUCTION);
+        } else if (isRoleplay) {
+            activeSession = await windowRoleplaySession();
         }
 
         let langInstruction = "";
@@ -607,7 +668,7 @@ export const aiService = {
         const genAI = getGenAI();
         if (!genAI) return null;
 
-        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash", generationConfig: { responseMimeType: "application/json" } });
+        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash", generationConfig: JSON_GENERATION_CONFIG }, REQUEST_OPTIONS);
 
         const prompt = `
         Based on the user's training history, generate a personalized daily mission.
@@ -626,9 +687,13 @@ export const aiService = {
         `;
 
         try {
-            const result = await model.generateContent(prompt);
-            const response = await result.response;
-            return JSON.parse(response.text());
+            return await aiCache.getOrCreate({
+                model: "gemini-2.0-flash", prompt, generationConfig: JSON_GENERATION_CONFIG, ttlMs: CACHE_TTL.dailyMission
+            }, async () => {
+                const result = await model.generateContent(prompt);
+                const response = await result.response;
+                return JSON.parse(response.text());
+            });
         } catch (error) {
             console.error("Daily Mission Error:", error);
             if (error.message.includes('429') || error.message.toLowerCase().includes('quota')) {
@@ -673,11 +738,13 @@ export const aiService = {
         const genAI = getGenAI();
         if (!genAI) return null;
 
-        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash" });
+        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash" }, REQUEST_OPTIONS);
 
         // Convert message objects to readable format
         const conversationText = Array.isArray(history)
-            ? history.map(m => `${m.role === 'user' ? 'Salesperson' : 'Customer'}: ${m.text}`).join('\n')
+            ? conversationContext.build(history, 'feedback', {
+                labelOf: (m) => m.role === 'user' ? 'Salesperson' : 'Customer'
+            }).text
             : '';
 
         let prompt = "";
@@ -933,14 +1000,14 @@ export const aiService = {
         const genAI = getGenAI();
         if (!genAI) return null;
 
-        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash", generationConfig: { responseMimeType: "application/json" } });
+        const model = genAI.getGenerativeModel({ model: "gemini-2.0-flash", generationConfig: JSON_GENERATION_CONFIG }, REQUEST_OPTIONS);
 
         const prompt = `
         You are an expert instructional designer. 
         Create a structured learning course and a quiz based on the following topic and content.
 
         **Topic:** ${topic}
-        **Content Context:** ${fileContent ? fileContent.substring(0, 1000) : "No specific content provided, use general knowledge about the topic."}
+        **Content Context:** ${fileContent ? fileContent.substring(0, COURSE_CONTEXT_CHARS) : "No specific content provided, use general knowledge about the topic."}
         **Target Audience:** TV Sales Consultants
         **Language:** ${language === 'ko' ? 'Korean' : 'English'}
 
@@ -948,7 +1015,7 @@ export const aiService = {
         Return a JSON object containing THREE parts: "course", "quiz", and "faq".
 
         1. **course** (Object):
-           - id: "generated_${Date.now()}"
+           - id: "generated_course" (callers assign the real id)
            - title: "Course Title"
            - category: "Generated"
            - level: "Intermediate"
@@ -983,11 +1050,15 @@ export const aiService = {
         `;
 
         try {
-            const result = await model.generateContent(prompt);
-            const response = await result.response;
-            const text = response.text();
-            const jsonStr = text.replace(/```json/g, '').replace(/```/g, '').trim();
-            return JSON.parse(jsonStr);
+            return await aiCache.getOrCreate({
+                model: "gemini-2.0-flash", prompt, generationConfig: JSON_GENERATION_CONFIG, ttlMs: CACHE_TTL.course
+            }, async () => {
+                const result = await model.generateContent(prompt);
+                const response = await result.response;
+                const text = response.text();
+                const jsonStr = text.replace(/```json/g, '').replace(/```/g, '').trim();
+                return JSON.parse(jsonStr);
+            });
         } catch (error) {
             console.error("Course Generation Error:", error);
             if (error.message.includes('429') || error.message.toLowerCase().includes('quota')) {
@@ -997,3 +1068,9 @@ export const aiService = {
         }
     }
 };
+
+// Report every in-flight AI call to the render-settled marker
+Object.keys(aiService).forEach((name) => {
+    const call = aiService[name];
+    aiService[name] = (...args) => appActivity.track(call(...args));
+});
@@ -0,0 +1,87 @@
+/**
+ * Lazy Routes
+ * Route screens are loaded on demand so the first paint only downloads the
+ * shell and the screen being opened. lazyRoute() wraps React.lazy around a
+ * memoized import(): prefetching and rendering share one request, and a failed
+ * load is forgotten so the next attempt retries. Loads triggered by rendering
+ * are tracked by appActivity, so the app counts as busy until the screen shows.
+ *
+ * Likely-next screens are fetched ahead of time: prefetchRoute(path) on
+ * hover/focus/touch of a nav link, and prefetchOnIdle(paths) once the browser
+ * is idle (skipped when the user asked to save data or is on a 2G connection).
+ */
+
+import { lazy } from 'react';
+import { appActivity } from './appActivity';
+
+const IDLE_TIMEOUT_MS = 3000;
+
+const preloads = new Map(); // route path -> preload()
+
+export function lazyRoute(factory, exportName = 'default') {
+    let pending = null;
+    const preload = () => {
+        if (!pending) {
+            pending = factory()
+                .then(module => ({ default: module[exportName] }))
+                .catch(error => {
+                    pending = null;
+                    throw error;
+                });
+        }
+        return pending;
+    };
+    const Component = lazy(() => appActivity.track(preload()));
+    Component.preload = preload;
+    return Component;
+}
+
+/** Registers the lazy screens of each route path (`{ '/admin': [AdminLayout, AdminDashboard] }`) for prefetching. */
+export function registerRoutes(routes) {
+    Object.entries(routes).forEach(([path, screens]) => {
+        const lazyScreens = [].concat(screens).filter(Component => Component?.preload);
+        if (lazyScreens.length) preloads.set(path, () => Promise.all(lazyScreens.map(Component => Component.preload())));
+    });
+}
+
+const match = (path) => {
+    if (preloads.has(path)) return preloads.get(path);
+    // '/study/faq' -> '/study'
+    const parent = path.replace(/\/[^/]*$/, '') || '/';
+    return parent !== path ? match(parent) : null;
+};
+
+/** Starts loading the screen of `path`; safe to call repeatedly. */
+export function prefetchRoute(path) {
+    const preload = match(path);
+    if (preload) preload().catch(() => { /* retried when the route renders */ });
+}
+
+const constrained = () => {
+    const connection = typeof navigator !== 'undefined' ? navigator.connection : null;
+    return !!connection && (connection.saveData || /2g/.test(connection.effectiveType || ''));
+};
+
+/** Prefetches `paths` one at a time while the browser is idle. */
+export function prefetchOnIdle(paths) {
+    if (constrained()) return;
+    const queue = [...paths];
+    const whenIdle = (callback) => {
+        if (typeof requestIdleCallback === 'function') requestIdleCallback(callback, { timeout: IDLE_TIMEOUT_MS });
+        else setTimeout(callback, 200);
+    };
+    const next = () => {
+        const path = queue.shift();
+        if (!path) return;
+        const preload = match(path);
+        (preload ? preload() : Promise.resolve()).catch(() => {}).finally(() => whenIdle(next));
+    };
+    whenIdle(next);
+}
+
+/** Props for a nav link that prefetch its screen on hover, focus or touch. */
+export const prefetchProps = (path) => ({
+    onMouseEnter: () => prefetchRoute(path),
+    onFocus: () => prefetchRoute(path),
+    onTouchStart: () => prefetchRoute(path),
+});
@@ -0,0 +1,91 @@
+/**
+ * Incremental Markdown Blocks
+ * Splits a streamed markdown reply into finished top-level blocks and the one
+ * block still being written, so only that last block is re-parsed as chunks
+ * arrive. A block is finished once the next one has visibly started: a complete
+ * non-blank line after a blank line that does not continue it (indented text,
+ * or another item of the same list), or an ATX heading. Nothing inside a fenced
+ * code block is ever split.
+ *
+ * createBlockSplitter().push(text) only scans what follows the last finished
+ * block; if `text` no longer extends what was pushed before, it starts over.
+ */
+
+const FENCE = /^ {0,3}(`{3,}|~{3,})/;
+const LIST_ITEM = /^ {0,3}([-*+]|\d{1,9}[.)])\s/;
+const HEADING = /^ {0,3}#{1,6}(\s|$)/;
+const BLANK = /^\s*$/;
+const INDENTED = /^[ \t]/;
+
+const SPEECH_MARKER = '---SPEECH---';
+
+// Offset where the first finished block of `text` ends, or -1 while it is still open
+const nextBoundary = (text) => {
+    let started = false;
+    let isList = false;
+    let inFence = false;
+    let sawBlank = false;
+    let lineStart = 0;
+
+    for (let lineEnd = text.indexOf('\n'); lineEnd !== -1; lineStart = lineEnd + 1, lineEnd = text.indexOf('\n', lineStart)) {
+        const line = text.slice(lineStart, lineEnd);
+        if (inFence) {
+            if (FENCE.test(line)) inFence = false;
+            continue;
+        }
+        if (BLANK.test(line)) {
+            sawBlank = started;
+            continue;
+        }
+        if (!started) {
+            started = true;
+            isList = LIST_ITEM.test(line);
+            if (HEADING.test(line)) return lineEnd + 1; // a heading is a block of its own
+            inFence = FENCE.test(line);
+            continue;
+        }
+        if (HEADING.test(line)) return lineStart;
+        if (sawBlank && !INDENTED.test(line) && !(isList && LIST_ITEM.test(line))) return lineStart;
+        sawBlank = false;
+        inFence = FENCE.test(line);
+    }
+    return -1;
+};
+
+export const createBlockSplitter = () => {
+    let settled = ''; // text of the finished blocks, as received
+    let blocks = [];
+
+    return {
+        /** Returns `{ blocks, tail }`; `blocks` keeps its identity until a block is finished. */
+        push(text) {
+            if (!text.startsWith(settled)) {
+                settled = '';
+                blocks = [];
+            }
+            let tail = text.slice(settled.length);
+            let boundary = nextBoundary(tail);
+            while (boundary !== -1) {
+                const block = tail.slice(0, boundary).trim();
+                if (block) blocks = [...blocks, block];
+                settled = text.slice(0, settled.length + boundary);
+                tail = tail.slice(boundary);
+                boundary = nextBoundary(tail);
+            }
+            return { blocks, tail };
+        }
+    };
+};
+
+/**
+ * The on-screen part of a streamed tutor reply: everything before the
+ * ---SPEECH--- marker, hiding a marker that has only partly arrived.
+ */
+export const screenText = (text) => {
+    const marker = text.indexOf(SPEECH_MARKER);
+    if (marker !== -1) return text.slice(0, marker);
+    for (let n = SPEECH_MARKER.length - 1; n > 0; n--) {
+        if (text.endsWith(SPEECH_MARKER.slice(0, n))) return text.slice(0, -n);
+    }
+    return text;
+};
@@ -0,0 +1,56 @@
+/**
+ * PDF Text Worker
+ * Extracts the text of a PDF off the main thread (see fileProcessor.js). pdf.js
+ * is bundled with the app and its parser runs inside this worker, so nothing is
+ * fetched from a CDN. Up to `concurrency` pages are in flight at once; each page
+ * is posted back as soon as its text is ready (not necessarily in page order)
+ * and released straight away, so memory stays flat on long manuals. Extraction
+ * stops early once `maxChars` characters have been sent.
+ *
+ * In:  { type: 'extract', data: ArrayBuffer, concurrency, maxChars }
+ * Out: { type: 'meta', numPages } | { type: 'page', pageNumber, text }
+ *      | { type: 'done', truncated } | { type: 'error', message }
+ */
+
+import * as pdfjsLib from 'pdfjs-dist';
+import * as pdfjsWorker from 'pdfjs-dist/build/pdf.worker.min.mjs';
+
+// With the worker's message handler already loaded, pdf.js parses in this thread
+// instead of starting a nested worker
+globalThis.pdfjsWorker = pdfjsWorker;
+
+const pageText = async (pdf, pageNumber) => {
+    const page = await pdf.getPage(pageNumber);
+    try {
+        const content = await page.getTextContent();
+        return content.items.map(item => item.str ?? '').join(' ');
+    } finally {
+        page.cleanup();
+    }
+};
+
+const extract = async ({ data, concurrency, maxChars }) => {
+    const pdf = await pdfjsLib.getDocument({ data, isEvalSupported: false }).promise;
+    try {
+        self.postMessage({ type: 'meta', numPages: pdf.numPages });
+        let nextPage = 1;
+        let chars = 0;
+        const lane = async () => {
+            while (nextPage <= pdf.numPages && chars < maxChars) {
+                const pageNumber = nextPage++;
+                const text = await pageText(pdf, pageNumber);
+                chars += text.length;
+                self.postMessage({ type: 'page', pageNumber, text });
+            }
+        };
+        await Promise.all(Array.from({ length: Math.min(concurrency, pdf.numPages) }, lane));
+        self.postMessage({ type: 'done', truncated: nextPage <= pdf.numPages });
+    } finally {
+        await pdf.destroy();
+    }
+};
+
+self.onmessage = ({ data: message }) => {
+    if (message.type !== 'extract') return;
+    extract(message).catch(error => self.postMessage({ type: 'error', message: error?.message || String(error) }));
+};
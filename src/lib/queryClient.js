@@ -1,4 +1,5 @@
 import { QueryClient } from '@tanstack/react-query';
+import { operatorApi } from '../services/operatorApi';
 
 export const queryClient = new QueryClient({
     defaultOptions: {
@@ -10,3 +11,19 @@ export const queryClient = new QueryClient({
         },
     },
 });
+
+export const queryKeys = {
+    salesLabBootstrap: ['operator', 'salesLabBootstrap']
+};
+
+// Sales Lab setup data (catalog, personas, traits, levels, stages, rules) in one batched read.
+// Always revalidated in the background so admin edits show up; cached data renders immediately.
+export const salesLabBootstrapQuery = {
+    queryKey: queryKeys.salesLabBootstrap,
+    queryFn: async () => {
+        const res = await operatorApi.getSalesLabBootstrap();
+        if (!res.success) throw new Error(res.error?.message || "Failed to load Sales Lab data");
+        return res.data;
+    },
+    staleTime: 0
+};
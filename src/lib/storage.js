@@ -1,30 +1,79 @@
 import { openDB } from 'idb';
 
 const DB_NAME = 'gtm-manager-db';
-const DB_VERSION = 2;
+const DB_VERSION = 5;
+
+// Every message of one chat session, in order: [sessionId, -Infinity] .. [sessionId, Infinity]
+const sessionRange = (sessionId, beforeSeq = Infinity) =>
+    IDBKeyRange.bound([sessionId, -Infinity], [sessionId, beforeSeq], false, true);
+
+// Creates the stores missing from an older version of the database
+const upgrade = (db) => {
+    // Store for uploaded files
+    if (!db.objectStoreNames.contains('files')) {
+        db.createObjectStore('files', { keyPath: 'id' });
+    }
+    // Store for generated courses
+    if (!db.objectStoreNames.contains('courses')) {
+        db.createObjectStore('courses', { keyPath: 'id' });
+    }
+    // Store for generated quizzes
+    if (!db.objectStoreNames.contains('quizzes')) {
+        db.createObjectStore('quizzes', { keyPath: 'courseId' });
+    }
+    // Store for generated FAQs
+    if (!db.objectStoreNames.contains('faqs')) {
+        db.createObjectStore('faqs', { keyPath: 'id', autoIncrement: true });
+    }
+    // Store for cached Gemini responses (see aiCache.js)
+    if (!db.objectStoreNames.contains('aiCache')) {
+        const store = db.createObjectStore('aiCache', { keyPath: 'key' });
+        store.createIndex('lastAccess', 'lastAccess');
+    }
+    // Operator mock DB, one record per collection (see services/storageAdapter.js)
+    if (!db.objectStoreNames.contains('operatorDb')) {
+        db.createObjectStore('operatorDb', { keyPath: 'name' });
+    }
+    // Chat transcripts, append-only, one record per message (see chatHistory.js)
+    if (!db.objectStoreNames.contains('chatMessages')) {
+        db.createObjectStore('chatMessages', { keyPath: ['sessionId', 'seq'] });
+    }
+    // One record per chat session: timestamps, and the summary once compacted
+    if (!db.objectStoreNames.contains('chatSessions')) {
+        const store = db.createObjectStore('chatSessions', { keyPath: 'id' });
+        store.createIndex('updatedAt', 'updatedAt');
+    }
+    // Finished Sales Lab sessions (feedback reports)
+    if (!db.objectStoreNames.contains('labSessions')) {
+        db.createObjectStore('labSessions', { keyPath: 'id' });
+    }
+};
+
+// One connection per page, shared by every call (see localDB.getDB)
+let dbPromise = null;
+
+const connect = () => {
+    const connection = openDB(DB_NAME, DB_VERSION, {
+        upgrade,
+        // Another tab (after a deploy) wants to upgrade the database: close instead of blocking it
+        blocking() {
+            connection.then(db => db.close());
+            dbPromise = null;
+        },
+        terminated() {
+            dbPromise = null;
+        }
+    });
+    return connection;
+};
 
 export const localDB = {
-    async getDB() {
-        return openDB(DB_NAME, DB_VERSION, {
-            upgrade(db) {
-                // Store for uploaded files
-                if (!db.objectStoreNames.contains('files')) {
-                    db.createObjectStore('files', { keyPath: 'id' });
-                }
-                // Store for generated courses
-                if (!db.objectStoreNames.contains('courses')) {
-                    db.createObjectStore('courses', { keyPath: 'id' });
-                }
-                // Store for generated quizzes
-                if (!db.objectStoreNames.contains('quizzes')) {
-                    db.createObjectStore('quizzes', { keyPath: 'courseId' });
-                }
-                // Store for generated FAQs
-                if (!db.objectStoreNames.contains('faqs')) {
-                    db.createObjectStore('faqs', { keyPath: 'id', autoIncrement: true });
-                }
-            },
+    getDB() {
+        dbPromise ??= connect().catch(e => {
+            dbPromise = null;
+            throw e;
         });
+        return dbPromise;
     },
 
     // --- Files ---
@@ -87,6 +136,138 @@ export const localDB = {
         return db.delete('faqs', id);
     },
 
+    // --- AI Response Cache ---
+    async getCacheEntry(key) {
+        const db = await this.getDB();
+        return db.get('aiCache', key);
+    },
+
+    async putCacheEntry(entry) {
+        const db = await this.getDB();
+        return db.put('aiCache', entry);
+    },
+
+    async deleteCacheEntry(key) {
+        const db = await this.getDB();
+        return db.delete('aiCache', key);
+    },
+
+    // Deletes least-recently-used entries beyond maxEntries; returns how many were removed
+    async pruneCache(maxEntries) {
+        const db = await this.getDB();
+        const tx = db.transaction('aiCache', 'readwrite');
+        let excess = (await tx.store.count()) - maxEntries;
+        let removed = 0;
+        let cursor = excess > 0 ? await tx.store.index('lastAccess').openCursor() : null;
+        while (cursor && excess > 0) {
+            await cursor.delete();
+            removed += 1;
+            excess -= 1;
+            cursor = await cursor.continue();
+        }
+        await tx.done;
+        return removed;
+    },
+
+    async clearCache() {
+        const db = await this.getDB();
+        return db.clear('aiCache');
+    },
+
+    // --- Operator DB Collections ---
+    async getCollection(name) {
+        const db = await this.getDB();
+        return db.get('operatorDb', name);
+    },
+
+    // Writes all records in a single transaction
+    async putCollections(records) {
+        const db = await this.getDB();
+        const tx = db.transaction('operatorDb', 'readwrite');
+        await Promise.all([...records.map(record => tx.store.put(record)), tx.done]);
+    },
+
+    async clearCollections() {
+        const db = await this.getDB();
+        return db.clear('operatorDb');
+    },
+
+    // --- Chat History ---
+    // Writes a batch of messages and the sessions they belong to in one transaction
+    async appendChatMessages(sessions, messages) {
+        const db = await this.getDB();
+        const tx = db.transaction(['chatSessions', 'chatMessages'], 'readwrite');
+        const sessionStore = tx.objectStore('chatSessions');
+        const messageStore = tx.objectStore('chatMessages');
+        await Promise.all([
+            ...sessions.map(session => sessionStore.put(session)),
+            ...messages.map(message => messageStore.put(message)),
+            tx.done
+        ]);
+    },
+
+    async getChatSessions() {
+        const db = await this.getDB();
+        return db.getAllFromIndex('chatSessions', 'updatedAt');
+    },
+
+    // Up to `limit` messages before `beforeSeq`, oldest first, read backwards with a cursor
+    async getChatPage(sessionId, { beforeSeq = Infinity, limit }) {
+        const db = await this.getDB();
+        const tx = db.transaction('chatMessages');
+        const messages = [];
+        let cursor = await tx.store.openCursor(sessionRange(sessionId, beforeSeq), 'prev');
+        while (cursor && messages.length < limit) {
+            messages.push(cursor.value);
+            cursor = await cursor.continue();
+        }
+        const hasOlder = Boolean(cursor);
+        await tx.done;
+        return { messages: messages.reverse(), hasOlder };
+    },
+
+    async getChatMessages(sessionId) {
+        const db = await this.getDB();
+        return db.getAll('chatMessages', sessionRange(sessionId));
+    },
+
+    // Replaces a session's messages with its record (which carries the summary)
+    async compactChatSession(session) {
+        const db = await this.getDB();
+        const tx = db.transaction(['chatSessions', 'chatMessages'], 'readwrite');
+        await Promise.all([
+            tx.objectStore('chatMessages').delete(sessionRange(session.id)),
+            tx.objectStore('chatSessions').put(session),
+            tx.done
+        ]);
+    },
+
+    async deleteChatSession(id) {
+        const db = await this.getDB();
+        const tx = db.transaction(['chatSessions', 'chatMessages'], 'readwrite');
+        await Promise.all([
+            tx.objectStore('chatMessages').delete(sessionRange(id)),
+            tx.objectStore('chatSessions').delete(id),
+            tx.done
+        ]);
+    },
+
+    // --- Sales Lab Sessions ---
+    async saveLabSession(session) {
+        const db = await this.getDB();
+        return db.put('labSessions', session);
+    },
+
+    async getLabSessions() {
+        const db = await this.getDB();
+        return db.getAll('labSessions');
+    },
+
+    async clearLabSessions() {
+        const db = await this.getDB();
+        return db.clear('labSessions');
+    },
+
     async deleteCourse(id) {
         const db = await this.getDB();
         // Delete the course
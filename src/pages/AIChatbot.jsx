@@ -1,4 +1,4 @@
-import React, { useState, useRef, useEffect } from 'react';
+import React, { memo, useCallback, useMemo, useState, useRef, useEffect } from 'react';
 import { Send, Mic, Image as ImageIcon, Volume2, StopCircle, MicOff, Play, BookOpen, AlertCircle, ArrowRight, HelpCircle, FileText, Scale, ShieldCheck, Trash2, ChevronDown } from 'lucide-react';
 import { motion } from 'framer-motion';
 
@@ -9,6 +9,11 @@ import { useChatStore } from '../store/chatStore';
 import { useAppStore } from '../store/appStore';
 import { useUserStore } from '../store/userStore';
 import { aiService } from '../lib/gemini';
+import { screenText } from '../lib/markdownBlocks';
+import { useStreamingText } from '../hooks/useStreamingText';
+import StreamingMarkdown from '../components/common/StreamingMarkdown';
+import VirtualList from '../components/common/VirtualList';
+import { at, last } from '../lib/chunkedList';
 import { translations } from '../constants/translations';
 import { useNavigate } from 'react-router-dom';
 
@@ -16,8 +21,114 @@ const SettingsIcon = () => (
   <svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2" strokeLinecap="round" strokeLinejoin="round"><path d="M12.22 2h-.44a2 2 0 0 0-2 2v.18a2 2 0 0 1-1 1.73l-.43.25a2 2 0 0 1-2 0l-.15-.08a2 2 0 0 0-2.73.73l-.22.38a2 2 0 0 0 .73 2.73l.15.1a2 2 0 0 1 1 1.72v.51a2 2 0 0 1-1 1.74l-.15.09a2 2 0 0 0-.73 2.73l.22.38a2 2 0 0 0 2.73.73l.15-.08a2 2 0 0 1 2 0l.43.25a2 2 0 0 1 1 1.73V20a2 2 0 0 0 2 2h.44a2 2 0 0 0 2-2v-.18a2 2 0 0 1 1-1.73l.43-.25a2 2 0 0 1 2 0l.15.08a2 2 0 0 0 2.73-.73l.22-.39a2 2 0 0 0-.73-2.73l-.15-.1a2 2 0 0 1-1-1.72v-.51a2 2 0 0 1 1-1.74l.15-.09a2 2 0 0 0 .73-2.73l-.22-.38a2 2 0 0 0-2.73-.73l-.15.08a2 2 0 0 1-2 0l-.43.25a2 2 0 0 1-1-1.73V4a2 2 0 0 0-2-2z" /><circle cx="12" cy="12" r="3" /></svg>
 );
 
+const REMARK_PLUGINS = [remarkGfm];
+
+// Module-level so memoized messages and streamed blocks see the same objects on every render
+const MARKDOWN_COMPONENTS = {
+  table: ({ ...props }) => <table className="border-collapse border border-slate-200 w-full my-2 text-xs" {...props} />,
+  th: ({ ...props }) => <th className="border border-slate-200 bg-slate-50 p-2 text-left font-bold" {...props} />,
+  td: ({ ...props }) => <td className="border border-slate-200 p-2" {...props} />,
+  strong: ({ ...props }) => <strong className="font-bold text-indigo-600" {...props} />,
+  p: ({ node, ...props }) => <p className="mb-2 last:mb-0" {...props} />
+};
+
+// Parse AI response to separate core summary and details
+const parseAIResponse = (text, isUser) => {
+  if (isUser) return { summary: text, details: null };
+
+  const summaryMatch = text.match(/### 📌 핵심 요약.*?(?=###|---SPEECH---|$)/s);
+  const tipsMatch = text.match(/### 🔧 실전 팁.*?(?=###|---SPEECH---|$)/s);
+  const scriptMatch = text.match(/\[실전 스크립트.*?(?=###|---SPEECH---|$)/s);
+  const detailsMatch = text.match(/### 📚 상세 정보.*?(?=---SPEECH---|$)/s);
+
+  let summary = text;
+  let details = null;
+
+  if (summaryMatch) {
+    summary = summaryMatch[0];
+    if (tipsMatch) summary += '\n' + tipsMatch[0];
+    if (scriptMatch) summary += '\n' + scriptMatch[0];
+    if (detailsMatch) details = detailsMatch[0];
+  }
+
+  return { summary, details };
+};
+
+// Memoized: typing in the input or streaming a reply leaves finished messages alone
+const TutorMessage = memo(function TutorMessage({ msg, isExpanded, onToggleDetails, isStreaming = false }) {
+  const { summary, details } = useMemo(() => parseAIResponse(msg.text, msg.role === 'user'), [msg.text, msg.role]);
+
+  return (
+    <motion.div
+      initial={{ opacity: 0, y: 10 }}
+      animate={{ opacity: 1, y: 0 }}
+      className={clsx(
+        "flex gap-4 max-w-[90%] md:max-w-[80%]",
+        msg.role === 'user' ? "ml-auto flex-row-reverse" : ""
+      )}
+    >
+      <div className={clsx(
+        "w-8 h-8 rounded-full flex-shrink-0 flex items-center justify-center text-xs font-bold border",
+        msg.role === 'user' ? "bg-indigo-600 text-white border-indigo-700" : "bg-white text-emerald-600 border-slate-200"
+      )}>
+        {msg.role === 'user' ? 'ME' : 'AI'}
+      </div>
+      <div className="flex flex-col gap-2 flex-1">
+        <div className={clsx(
+          "p-5 rounded-2xl shadow-sm text-sm leading-relaxed",
+          msg.role === 'user'
+            ? "bg-indigo-600 text-white rounded-tr-none shadow-indigo-200"
+            : "bg-white border border-slate-200 text-slate-800 rounded-tl-none"
+        )}>
+          {msg.role === 'ai' ? (
+            isStreaming ? (
+              <StreamingMarkdown text={summary} components={MARKDOWN_COMPONENTS} remarkPlugins={REMARK_PLUGINS} />
+            ) : (
+              <ReactMarkdown remarkPlugins={REMARK_PLUGINS} components={MARKDOWN_COMPONENTS}>
+                {summary}
+              </ReactMarkdown>
+            )
+          ) : (
+            msg.text
+          )}
+        </div>
+
+        {/* Show Details Button */}
+        {details && msg.role === 'ai' && (
+          <button
+            onClick={() => onToggleDetails(msg.id)}
+            className="flex items-center gap-1 px-3 py-1.5 text-indigo-600 hover:text-indigo-700 font-bold text-xs transition-colors self-start"
+          >
+            <span>{isExpanded ? 'Hide Details' : 'View Details'}</span>
+            <ChevronDown
+              size={14}
+              className={clsx(
+                "transition-transform",
+                isExpanded ? "rotate-180" : ""
+              )}
+            />
+          </button>
+        )}
+
+        {/* Expanded Details */}
+        {details && msg.role === 'ai' && isExpanded && (
+          <motion.div
+            initial={{ opacity: 0, y: -10 }}
+            animate={{ opacity: 1, y: 0 }}
+            className="p-4 bg-indigo-50 border-l-4 border-indigo-400 rounded-r-lg text-sm text-slate-700"
+          >
+            <ReactMarkdown remarkPlugins={REMARK_PLUGINS} components={MARKDOWN_COMPONENTS}>
+              {details}
+            </ReactMarkdown>
+          </motion.div>
+        )}
+      </div>
+    </motion.div>
+  );
+});
+
 export default function AIChatbot() {
-  const { messages, addMessage, isTyping, setTyping } = useChatStore();
+  const { messages, addMessage, isTyping, setTyping, hasOlderMessages, loadOlderMessages } = useChatStore();
   const { language } = useAppStore();
   const { weakness } = useUserStore();
   const navigate = useNavigate();
@@ -29,10 +140,12 @@ export default function AIChatbot() {
   const [isSpeaking, setIsSpeaking] = useState(false);
   const [isContinuousMode, setIsContinuousMode] = useState(false);
   const [voices, setVoices] = useState([]);
+  const { text: streamingText, append: appendStreamingText, reset: resetStreamingText } = useStreamingText();
 
 
 
   const messagesEndRef = useRef(null);
+  const scrollRef = useRef(null);
   const recognitionRef = useRef(null);
   const inputRef = useRef('');
   const hasInitialized = useRef(false);
@@ -41,9 +154,11 @@ export default function AIChatbot() {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
   };
 
+  // Older pages are prepended to `messages`; only a new last message scrolls down
+  const lastMessage = last(messages);
   useEffect(() => {
     scrollToBottom();
-  }, [messages, isTyping]);
+  }, [lastMessage, isTyping, streamingText]);
 
   // Load Voices
   useEffect(() => {
@@ -78,10 +193,10 @@ export default function AIChatbot() {
   useEffect(() => {
     const initChat = async () => {
       try {
-        // Initialize Backend Session (Reuses if exists)
-        await aiService.initTutor();
+        // Initialize Backend Session (Reuses if exists) while the latest page of history loads
+        await Promise.all([aiService.initTutor(), useChatStore.getState().loadHistory()]);
 
-        // Check if we have existing messages in the store (Persistence)
+        // Check if we have existing messages in the store (restored from IndexedDB)
         const currentMessages = useChatStore.getState().messages;
         const hasHistory = currentMessages.length > 0;
 
@@ -296,11 +411,13 @@ export default function AIChatbot() {
     inputRef.current = '';
     addMessage({ role: 'user', text: textToSend });
     setTyping(true);
+    resetStreamingText();
 
     try {
-      const { text, speech } = await aiService.sendMessage(textToSend, language);
+      const { text, speech } = await aiService.sendMessageStream(textToSend, language, false, appendStreamingText);
 
       setTyping(false);
+      resetStreamingText();
       addMessage({ role: 'ai', text: text });
 
       // Only speak if in Voice mode (isAutoMode is true)
@@ -310,6 +427,7 @@ export default function AIChatbot() {
 
     } catch {
       setTyping(false);
+      resetStreamingText();
       addMessage({ role: 'ai', text: t?.common?.error || 'Error' });
     }
   };
@@ -320,15 +438,28 @@ export default function AIChatbot() {
 
   const [expandedMessages, setExpandedMessages] = useState({});
 
-  const toggleMessageDetails = (msgId) => {
+  const toggleMessageDetails = useCallback((msgId) => {
     setExpandedMessages(prev => ({
       ...prev,
       [msgId]: !prev[msgId]
     }));
-  };
+  }, []);
 
-  const handleClearChat = () => {
-    useChatStore.getState().clearMessages();
+  // Only the messages in view are mounted; long tutor histories stay cheap to scroll
+  const getMessageKey = useCallback((index) => at(messages, index).id, [messages]);
+  const renderMessage = useCallback((index) => {
+    const msg = at(messages, index);
+    return (
+      <TutorMessage
+        msg={msg}
+        isExpanded={expandedMessages[msg.id] || false}
+        onToggleDetails={toggleMessageDetails}
+      />
+    );
+  }, [messages, expandedMessages, toggleMessageDetails]);
+
+  const handleClearChat = async () => {
+    await useChatStore.getState().clearMessages();
     hasInitialized.current = false;
     window.location.reload();
   };
@@ -401,119 +532,28 @@ export default function AIChatbot() {
             </div>
           </div>
 
-          <div className="flex-1 overflow-y-auto p-4 md:p-6 space-y-6 bg-slate-50/50">
-            {messages.map((msg) => {
-              // Parse AI response to separate core summary and details
-              const parseAIResponse = (text) => {
-                if (msg.role === 'user') return { summary: text, details: null };
-
-                const summaryMatch = text.match(/### 📌 핵심 요약.*?(?=###|---SPEECH---|$)/s);
-                const tipsMatch = text.match(/### 🔧 실전 팁.*?(?=###|---SPEECH---|$)/s);
-                const scriptMatch = text.match(/\[실전 스크립트.*?(?=###|---SPEECH---|$)/s);
-                const detailsMatch = text.match(/### 📚 상세 정보.*?(?=---SPEECH---|$)/s);
-
-                let summary = text;
-                let details = null;
-
-                if (summaryMatch) {
-                  summary = summaryMatch[0];
-                  if (tipsMatch) summary += '\n' + tipsMatch[0];
-                  if (scriptMatch) summary += '\n' + scriptMatch[0];
-                  if (detailsMatch) details = detailsMatch[0];
-                }
-
-                return { summary, details };
-              };
-
-              const { summary, details } = parseAIResponse(msg.text);
-              const isExpanded = expandedMessages[msg.id] || false;
-
-              return (
-                <motion.div
-                  initial={{ opacity: 0, y: 10 }}
-                  animate={{ opacity: 1, y: 0 }}
-                  key={msg.id}
-                  className={clsx(
-                    "flex gap-4 max-w-[90%] md:max-w-[80%]",
-                    msg.role === 'user' ? "ml-auto flex-row-reverse" : ""
-                  )}
-                >
-                  <div className={clsx(
-                    "w-8 h-8 rounded-full flex-shrink-0 flex items-center justify-center text-xs font-bold border",
-                    msg.role === 'user' ? "bg-indigo-600 text-white border-indigo-700" : "bg-white text-emerald-600 border-slate-200"
-                  )}>
-                    {msg.role === 'user' ? 'ME' : 'AI'}
-                  </div>
-                  <div className="flex flex-col gap-2 flex-1">
-                    <div className={clsx(
-                      "p-5 rounded-2xl shadow-sm text-sm leading-relaxed",
-                      msg.role === 'user'
-                        ? "bg-indigo-600 text-white rounded-tr-none shadow-indigo-200"
-                        : "bg-white border border-slate-200 text-slate-800 rounded-tl-none"
-                    )}>
-                      {msg.role === 'ai' ? (
-                        <ReactMarkdown
-                          remarkPlugins={[remarkGfm]}
-                          components={{
-                            table: ({ ...props }) => <table className="border-collapse border border-slate-200 w-full my-2 text-xs" {...props} />,
-                            th: ({ ...props }) => <th className="border border-slate-200 bg-slate-50 p-2 text-left font-bold" {...props} />,
-                            td: ({ ...props }) => <td className="border border-slate-200 p-2" {...props} />,
-                            strong: ({ ...props }) => <strong className="font-bold text-indigo-600" {...props} />,
-                            p: ({ node, ...props }) => <p className="mb-2 last:mb-0" {...props} />
-                          }}
-                        >
-                          {summary}
-                        </ReactMarkdown>
-                      ) : (
-                        msg.text
-                      )}
-                    </div>
-
-                    {/* Show Details Button */}
-                    {details && msg.role === 'ai' && (
-                      <button
-                        onClick={() => toggleMessageDetails(msg.id)}
-                        className="flex items-center gap-1 px-3 py-1.5 text-indigo-600 hover:text-indigo-700 font-bold text-xs transition-colors self-start"
-                      >
-                        <span>{isExpanded ? 'Hide Details' : 'View Details'}</span>
-                        <ChevronDown
-                          size={14}
-                          className={clsx(
-                            "transition-transform",
-                            isExpanded ? "rotate-180" : ""
-                          )}
-                        />
-                      </button>
-                    )}
-
-                    {/* Expanded Details */}
-                    {details && msg.role === 'ai' && isExpanded && (
-                      <motion.div
-                        initial={{ opacity: 0, y: -10 }}
-                        animate={{ opacity: 1, y: 0 }}
-                        className="p-4 bg-indigo-50 border-l-4 border-indigo-400 rounded-r-lg text-sm text-slate-700"
-                      >
-                        <ReactMarkdown
-                          remarkPlugins={[remarkGfm]}
-                          components={{
-                            table: ({ ...props }) => <table className="border-collapse border border-slate-200 w-full my-2 text-xs" {...props} />,
-                            th: ({ ...props }) => <th className="border border-slate-200 bg-slate-50 p-2 text-left font-bold" {...props} />,
-                            td: ({ ...props }) => <td className="border border-slate-200 p-2" {...props} />,
-                            strong: ({ ...props }) => <strong className="font-bold text-indigo-600" {...props} />,
-                            p: ({ node, ...props }) => <p className="mb-2 last:mb-0" {...props} />
-                          }}
-                        >
-                          {details}
-                        </ReactMarkdown>
-                      </motion.div>
-                    )}
-                  </div>
-                </motion.div>
-              );
-            })}
+          <div ref={scrollRef} className="flex-1 overflow-y-auto p-4 md:p-6 space-y-6 bg-slate-50/50" data-testid="tutor-messages">
+            <VirtualList
+              count={messages.length}
+              getKey={getMessageKey}
+              renderItem={renderMessage}
+              scrollRef={scrollRef}
+              estimateSize={160}
+              gap={24}
+              followOutput
+              onStartReached={hasOlderMessages ? loadOlderMessages : undefined}
+            />
+            {streamingText && (
+              <TutorMessage
+                msg={{ id: 'streaming', role: 'ai', text: screenText(streamingText) }}
+                isExpanded={false}
+                onToggleDetails={toggleMessageDetails}
+                isStreaming
+              />
+            )}
 
             {/* Recommended Topics */}
-            {messages.length === 1 && messages[0].role === 'ai' && (
+            {messages.length === 1 && at(messages, 0).role === 'ai' && (
               <motion.div
                 initial={{ opacity: 0, y: 10 }}
                 animate={{ opacity: 1, y: 0 }}
@@ -531,7 +571,7 @@ export default function AIChatbot() {
                 ))}
               </motion.div>
             )}
-            {isTyping && (
+            {isTyping && !streamingText && (
               <div className="flex gap-4">
                 <div className="w-8 h-8 rounded-full bg-slate-200 flex-shrink-0 flex items-center justify-center text-slate-500 text-xs">AI</div>
                 <div className="bg-white p-4 rounded-2xl rounded-tl-none border border-slate-200 flex gap-1 items-center shadow-sm">
@@ -560,6 +600,7 @@ export default function AIChatbot() {
               </button>
               <input
                 type="text"
+                data-testid="tutor-input"
                 value={input}
                 onChange={(e) => setInput(e.target.value)}
                 onKeyDown={(e) => e.key === 'Enter' && handleSend()}
@@ -568,6 +609,7 @@ export default function AIChatbot() {
               />
               <button
                 onClick={() => handleSend()}
+                data-testid="tutor-send"
                 disabled={!input.trim()}
                 className="p-2.5 bg-indigo-600 text-white rounded-xl hover:bg-indigo-700 disabled:opacity-50 disabled:cursor-not-allowed transition-all shadow-sm flex-shrink-0"
               >
@@ -4,6 +4,7 @@ import { Radar, RadarChart, PolarGrid, PolarAngleAxis, ResponsiveContainer } fro
 import { Star, TrendingUp, AlertTriangle, CheckCircle2, ArrowRight, Share2, Download, Mic, Loader2 } from 'lucide-react';
 import { clsx } from 'clsx';
 import { useChatStore } from '../store/chatStore';
+import { toArray } from '../lib/chunkedList';
 import { useAppStore } from '../store/appStore';
 import { translations } from '../constants/translations';
 import { aiService } from '../lib/gemini';
@@ -53,7 +54,7 @@ export default function FeedbackReport() {
             }
 
             try {
-                const generatedReport = await aiService.generateFeedback(messages);
+                const generatedReport = await aiService.generateFeedback(toArray(messages));
                 if (generatedReport) {
                     setReport(generatedReport);
                 }
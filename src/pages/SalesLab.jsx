@@ -1,17 +1,21 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import { AnimatePresence, motion } from 'framer-motion'; // eslint-disable-line no-unused-vars
 import SalesLabSetup from '../components/sales-lab/SalesLabSetup';
 import SalesLabChat from '../components/sales-lab/SalesLabChat';
 import SalesLabFeedback from '../components/sales-lab/SalesLabFeedback';
 import SalesLabHistory from '../components/sales-lab/SalesLabHistory';
 import { useChatStore } from '../store/chatStore';
+import { find } from '../lib/chunkedList';
 
 export default function SalesLab() {
     const [phase, setPhase] = useState('SETUP'); // SETUP, ROLEPLAY, FEEDBACK, HISTORY
     const [sessionConfig, setSessionConfig] = useState(null);
     const [savedSession, setSavedSession] = useState(null);
     const [sessionResult, setSessionResult] = useState(null);
-    const { sessions, addSession } = useChatStore();
+    const { sessions, addSession, loadHistory } = useChatStore();
+
+    // Past sessions are kept in IndexedDB
+    useEffect(() => { loadHistory(); }, [loadHistory]);
 
     const handleStartRoleplay = (config, savedData = null) => {
         setSessionConfig(config);
@@ -39,7 +43,7 @@ export default function SalesLab() {
     };
 
     const handleViewSession = (sessionId) => {
-        const session = sessions.find(s => s.id === sessionId);
+        const session = find(sessions, s => s.id === sessionId);
         if (session) {
             setSessionResult(session);
             setPhase('FEEDBACK');
@@ -1,13 +1,16 @@
-import UserManagement from './UserManagement';
-import ScenarioManagement from './ScenarioManagement';
-import SystemSettings from './SystemSettings';
-import ProductCatalogManager from './ProductCatalogManager';
-import CustomerManager from './CustomerManager';
-import GamificationManager from './GamificationManager';
-import ContentManager from './ContentManager';
-import QuizBuilder from './QuizBuilder';
-import PerformanceMonitor from './PerformanceMonitor';
-import InsightsConsole from './InsightsConsole';
+import { lazyRoute } from '../../lib/lazyRoute';
+
+// Each admin screen is its own chunk, loaded when its route is first opened
+const UserManagement = lazyRoute(() => import('./UserManagement'));
+const ScenarioManagement = lazyRoute(() => import('./ScenarioManagement'));
+const SystemSettings = lazyRoute(() => import('./SystemSettings'));
+const ProductCatalogManager = lazyRoute(() => import('./ProductCatalogManager'));
+const CustomerManager = lazyRoute(() => import('./CustomerManager'));
+const GamificationManager = lazyRoute(() => import('./GamificationManager'));
+const ContentManager = lazyRoute(() => import('./ContentManager'));
+const QuizBuilder = lazyRoute(() => import('./QuizBuilder'));
+const PerformanceMonitor = lazyRoute(() => import('./PerformanceMonitor'));
+const InsightsConsole = lazyRoute(() => import('./InsightsConsole'));
 
 const PlaceholderPage = ({ title }) => (
     <div className="flex flex-col items-center justify-center h-[60vh] text-center">
@@ -1,9 +1,9 @@
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { Search, Filter, Plus, FileText, Video, MessageSquare, MoreHorizontal, Edit3, Eye, Upload, Trash2, Sparkles, Image as ImageIcon } from 'lucide-react';
 import { clsx } from 'clsx';
 import { localDB } from '../../lib/storage';
-// import { fileProcessor } from '../../lib/fileProcessor';
-import { aiService } from '../../lib/gemini';
+import { fileProcessor } from '../../lib/fileProcessor';
+import { aiService, COURSE_CONTEXT_CHARS } from '../../lib/gemini';
 import { useAppStore } from '../../store/appStore';
 
 export default function ContentManagement() {
@@ -15,6 +15,10 @@ export default function ContentManagement() {
     const [generatingId, setGeneratingId] = useState(null);
     const [isDragging, setIsDragging] = useState(false);
     const { language } = useAppStore();
+    const extraction = useRef(null); // AbortController of the running text extraction
+
+    // Stop reading a file in the background once the page is left
+    useEffect(() => () => extraction.current?.abort(), []);
 
 
 
@@ -140,11 +144,18 @@ export default function ContentManagement() {
         try {
             let content = "";
             if (file.fileObj) {
+                // Only the first pages are needed for the prompt; extraction stops there
+                extraction.current = new AbortController();
                 try {
-                    // content = await fileProcessor.extractText(file.fileObj);
-                    console.warn("File processing temporarily disabled");
+                    content = await fileProcessor.extractText(file.fileObj, {
+                        signal: extraction.current.signal,
+                        maxChars: COURSE_CONTEXT_CHARS
+                    });
                 } catch (e) {
+                    if (e.name === 'AbortError') return;
                     console.warn("Text extraction failed", e);
+                } finally {
+                    extraction.current = null;
                 }
             }
 
@@ -0,0 +1,111 @@
+/**
+ * KeyedCollection
+ * Ordered record collection for the mock DB: a primary-key Map plus secondary
+ * indexes (index name -> value -> bucket of keys), so get/update/delete and
+ * indexed lookups are O(1) instead of scanning arrays. Array views (the whole
+ * collection, or one index bucket) are cached until the next mutation touching them.
+ * Serialises to a plain array (toJSON), so StorageAdapter persists it unchanged.
+ */
+
+export class KeyedCollection {
+    /**
+     * @param {string} primaryKey - record field holding the unique id
+     * @param {Object<string, function>} indexes - index name -> (record) => indexed value
+     * @param {Array} records - initial records, in order
+     */
+    constructor(primaryKey, indexes = {}, records = []) {
+        this.primaryKey = primaryKey;
+        this.indexers = indexes;
+        this.records = new Map();
+        this.indexes = Object.fromEntries(Object.keys(indexes).map(name => [name, new Map()]));
+        this.snapshot = null;
+        records.forEach(record => this.insert(record));
+    }
+
+    static from(value, primaryKey, indexes) {
+        if (value instanceof KeyedCollection) return value;
+        return new KeyedCollection(primaryKey, indexes, Array.isArray(value) ? value : []);
+    }
+
+    get size() {
+        return this.records.size;
+    }
+
+    has(id) {
+        return this.records.has(id);
+    }
+
+    get(id) {
+        return this.records.get(id);
+    }
+
+    /** Records whose `indexName` value equals `value`, in insertion order of the index. */
+    where(indexName, value) {
+        if (!this.indexes[indexName]) throw new Error(`[KeyedCollection] Unknown index "${indexName}"`);
+        const bucket = this.indexes[indexName].get(value);
+        if (!bucket) return [];
+        if (!bucket.view) bucket.view = Array.from(bucket.keys, id => this.records.get(id));
+        return bucket.view;
+    }
+
+    /** Array view for API responses; rebuilt only after a mutation. */
+    toArray() {
+        if (!this.snapshot) this.snapshot = Array.from(this.records.values());
+        return this.snapshot;
+    }
+
+    toJSON() {
+        return this.toArray();
+    }
+
+    /** Adds or replaces a record (a replaced record keeps its position). */
+    insert(record) {
+        const id = record[this.primaryKey];
+        const previous = this.records.get(id);
+        if (previous) this.unindex(id, previous);
+        this.records.set(id, record);
+        this.index(id, record);
+        this.snapshot = null;
+        return record;
+    }
+
+    /** Shallow-merges `patch` (or the result of `patch(current)`) into a record; undefined if missing. */
+    update(id, patch) {
+        const current = this.records.get(id);
+        if (!current) return undefined;
+        const changes = typeof patch === 'function' ? patch(current) : patch;
+        return this.insert({ ...current, ...changes, [this.primaryKey]: id });
+    }
+
+    remove(id) {
+        const current = this.records.get(id);
+        if (!current) return false;
+        this.unindex(id, current);
+        this.records.delete(id);
+        this.snapshot = null;
+        return true;
+    }
+
+    index(id, record) {
+        Object.entries(this.indexers).forEach(([name, valueOf]) => {
+            const value = valueOf(record);
+            if (value === undefined || value === null) return;
+            const buckets = this.indexes[name];
+            if (!buckets.has(value)) buckets.set(value, { keys: new Set(), view: null });
+            const bucket = buckets.get(value);
+            bucket.keys.add(id);
+            bucket.view = null;
+        });
+    }
+
+    unindex(id, record) {
+        Object.entries(this.indexers).forEach(([name, valueOf]) => {
+            const value = valueOf(record);
+            const bucket = this.indexes[name].get(value);
+            if (!bucket) return;
+            bucket.keys.delete(id);
+            bucket.view = null;
+            if (bucket.keys.size === 0) this.indexes[name].delete(value);
+        });
+    }
+}
@@ -0,0 +1,132 @@
+/**
+ * Latency Profiles for the mock Operator API
+ * Replaces the fixed per-call delay with a profile chosen at startup:
+ * - zero:      no delay at all (default in dev and for the E2E suite)
+ * - fixed:     the historical constant delays (100 ms, 300 ms, ...)
+ * - realistic: log-normal jitter around the fixed delay plus an occasional slow tail (default in production builds)
+ * - replay:    per-method timings from a recording ({ method: [ms, ...] })
+ *
+ * Selection, first match wins: `?latency=<profile>` in the URL, localStorage
+ * AG_API_LATENCY, VITE_API_LATENCY, then the build default. A replay recording is
+ * read from localStorage AG_API_LATENCY_RECORDING or fetched from VITE_API_LATENCY_RECORDING.
+ * Recordings come from latencyProfile.startRecording() / stopRecording(), which time
+ * every operatorApi call end to end.
+ */
+
+const PROFILE_KEY = "AG_API_LATENCY";
+const RECORDING_KEY = "AG_API_LATENCY_RECORDING";
+const PROFILES = ['zero', 'fixed', 'realistic', 'replay'];
+
+const JITTER_SIGMA = 0.35;
+const TAIL_PROBABILITY = 0.03;
+const TAIL_FACTOR = 3;
+const MIN_REALISTIC_MS = 20;
+
+const readSetting = (key) => {
+    try {
+        if (typeof window === 'undefined') return null;
+        return new URLSearchParams(window.location.search).get('latency')
+            ?? window.localStorage.getItem(key);
+    } catch {
+        return null;
+    }
+};
+
+const selectProfile = () => {
+    const requested = readSetting(PROFILE_KEY) ?? import.meta.env.VITE_API_LATENCY;
+    if (PROFILES.includes(requested)) return requested;
+    if (requested) console.warn(`[latency] Unknown profile "${requested}", using the default`);
+    return import.meta.env.PROD ? 'realistic' : 'zero';
+};
+
+// Standard normal sample (Box-Muller)
+const gaussian = () => Math.sqrt(-2 * Math.log(1 - Math.random())) * Math.cos(2 * Math.PI * Math.random());
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+let profile = selectProfile();
+let replay = {};       // method -> recorded samples
+const replayCursor = {};
+let recording = null;  // method -> samples, while recording
+
+const loadRecording = async () => {
+    if (profile !== 'replay') return;
+    try {
+        const stored = typeof window !== 'undefined' && window.localStorage.getItem(RECORDING_KEY);
+        const url = import.meta.env.VITE_API_LATENCY_RECORDING;
+        if (stored) replay = JSON.parse(stored);
+        else if (url) replay = await (await fetch(url)).json();
+        else console.warn("[latency] Replay profile without a recording; falling back to fixed delays");
+    } catch (e) {
+        console.warn("[latency] Could not load the latency recording", e);
+    }
+};
+
+let ready = loadRecording();
+
+const delayFor = (method, baseMs) => {
+    switch (profile) {
+        case 'zero':
+            return 0;
+        case 'realistic': {
+            const tail = Math.random() < TAIL_PROBABILITY ? TAIL_FACTOR : 1;
+            return Math.max(MIN_REALISTIC_MS, Math.round(baseMs * Math.exp(gaussian() * JITTER_SIGMA) * tail));
+        }
+        case 'replay': {
+            const samples = replay[method];
+            if (!samples?.length) return baseMs;
+            const i = replayCursor[method] = ((replayCursor[method] ?? -1) + 1) % samples.length;
+            return samples[i];
+        }
+        default:
+            return baseMs;
+    }
+};
+
+export const latencyProfile = {
+    get name() {
+        return profile;
+    },
+
+    /** Applies the active profile's latency for `method`; `baseMs` is its historical fixed delay. */
+    async wait(method, baseMs = 100) {
+        if (profile === 'replay') await ready;
+        const ms = delayFor(method, baseMs);
+        if (ms > 0) await sleep(ms);
+    },
+
+    /** Switches profile at runtime (console: AG_LATENCY.use('fixed')); persists the choice for the next load. */
+    use(name) {
+        if (!PROFILES.includes(name)) throw new Error(`[latency] Unknown profile "${name}"`);
+        profile = name;
+        ready = loadRecording();
+        window.localStorage.setItem(PROFILE_KEY, name);
+    },
+
+    startRecording() {
+        recording = {};
+    },
+
+    /** Records one end-to-end call duration while a recording is active. */
+    record(method, ms) {
+        if (!recording) return;
+        (recording[method] ??= []).push(Math.round(ms));
+    },
+
+    /** Stops recording, stores it for the replay profile and returns it. */
+    stopRecording() {
+        const result = recording ?? {};
+        recording = null;
+        window.localStorage.setItem(RECORDING_KEY, JSON.stringify(result));
+        return result;
+    },
+
+    get isRecording() {
+        return recording !== null;
+    }
+};
+
+// Console access for switching profiles and capturing recordings
+if (typeof window !== 'undefined') {
+    window.AG_LATENCY = latencyProfile;
+}
@@ -1,4 +1,7 @@
 import { StorageAdapter } from './storageAdapter';
+import { KeyedCollection } from './keyedCollection';
+import { appActivity } from '../lib/appActivity';
+import { latencyProfile } from './latencyProfile';
 
 import {
     INITIAL_PRODUCT_CATALOG,
@@ -55,14 +58,56 @@ const INITIAL_DB_STATE = {
     insights: INITIAL_INSIGHTS || []
 };
 
-// Load from Storage or fallback to Initial
-let db = StorageAdapter.load(INITIAL_DB_STATE);
+// Record collections are keyed by id with secondary indexes (see keyedCollection.js)
+const COLLECTIONS = {
+    materials: {
+        key: 'materialId',
+        indexes: { status: m => m.status, moduleStatus: m => m.autoGeneratedModule?.status }
+    },
+    quizzes: { key: 'quizId', indexes: { materialId: q => q.materialId } },
+    modules: { key: 'moduleId', indexes: { sourceMaterialId: m => m.sourceMaterialId } },
+    scenarios: { key: 'scenarioId', indexes: {} },
+    users: { key: 'id', indexes: { regionId: u => u.scope?.regionId, role: u => u.role } }
+};
+
+// Collections are loaded from StorageAdapter on first use (fallback: Initial)
+const db = {};
+const loading = {};
 
-// Helper to save DB on every change
-const saveDb = () => {
-    StorageAdapter.save(db);
+const loadCollection = (name) => loading[name] ??= StorageAdapter.loadCollection(name, INITIAL_DB_STATE[name])
+    .then(value => {
+        const keyed = COLLECTIONS[name];
+        db[name] = keyed ? KeyedCollection.from(value, keyed.key, keyed.indexes) : value;
+        return db[name];
+    });
+
+// Every method awaits the collections it touches before reading or writing them
+const use = (...names) => Promise.all(names.map(loadCollection));
+
+// Helper to save changed collections; StorageAdapter writes them in the next idle batch
+const saveDb = (...names) => {
+    names.forEach(name => StorageAdapter.markDirty(name, () => db[name]));
 };
 
+// --- Batch Reads ---
+// Reads batch() can resolve in one pass: response field -> source collection + reader
+const BATCH_READS = {
+    catalog: { collection: 'catalog', read: () => db.catalog },
+    traits: { collection: 'traits', read: () => db.traits },
+    traitLinkages: { collection: 'traitLinkages', read: () => db.traitLinkages },
+    personas: { collection: 'personas', read: () => db.personas },
+    levels: { collection: 'difficulties', read: () => db.difficulties },
+    stages: { collection: 'stages', read: () => db.stages },
+    rules: { collection: 'upsellRules', read: () => db.upsellRules },
+    scenarios: { collection: 'scenarios', read: () => db.scenarios.toArray() },
+    prompts: { collection: 'prompts', read: () => db.prompts },
+    materials: { collection: 'materials', read: () => db.materials.toArray() },
+    quizzes: { collection: 'quizzes', read: () => db.quizzes.toArray() }
+};
+
+// Everything the Sales Lab setup screen and aiService.startRoleplay need
+export const SALES_LAB_BOOTSTRAP = ['catalog', 'personas', 'traits', 'levels', 'stages', 'rules'];
+
 // --- Helper: Standard Response Envelope ---
 const createResponse = (data, meta = {}) => ({
     success: true,
@@ -87,7 +132,8 @@ const createError = (code, message, details = null) => ({
 });
 
 // --- Helper: Middleware Simulation ---
-const delay = (ms = 100) => new Promise(resolve => setTimeout(resolve, ms));
+// Simulated backend latency; the amount depends on the startup profile (see latencyProfile.js)
+const delay = (method, ms = 100) => appActivity.track(latencyProfile.wait(method, ms));
 
 const checkScope = (requiredScope) => {
     // Admin bypass
@@ -104,7 +150,6 @@ class OperatorApiClient {
     constructor() {
         this.webhookUrl = null; // Plaeholder: Set this via setWebhookUrl()
         this.enableLogging = true;
-        saveDb();
     }
 
     setWebhookUrl(url) {
@@ -145,42 +190,66 @@ class OperatorApiClient {
 
     // === 1. Product Catalog ===
     async getProductCatalog() {
-        await delay();
+        await delay('getProductCatalog');
+        await use('catalog');
         // if (!checkScope('READ_CATALOG')) return createError("FORBIDDEN", "Scope violation");
         return createResponse({ catalog: db.catalog });
     }
 
     async updateProductCatalog(newCatalog) {
-        await delay(300);
+        await delay('updateProductCatalog', 300);
+        await use('catalog');
         if (sessionContext.role !== 'ADMIN') return createError("FORBIDDEN", "Admin only");
         db.catalog = newCatalog;
-        saveDb();
+        saveDb('catalog');
 
         this.emitEvent("catalog.updated", { itemCount: newCatalog.length });
         return createResponse({ catalog: db.catalog });
     }
 
+    // === 1.1 Batch Reads ===
+    // One delay, one envelope; all reads happen synchronously after loading, so they share one snapshot
+    async readBatch(method, ops) {
+        await delay(method);
+        const unknown = ops.filter(op => !BATCH_READS[op]);
+        if (unknown.length) return createError("BAD_REQUEST", `Unknown batch reads: ${unknown.join(', ')}`);
+        await use(...new Set(ops.map(op => BATCH_READS[op].collection)));
+        return createResponse(Object.fromEntries(ops.map(op => [op, BATCH_READS[op].read()])), { ops });
+    }
+
+    async batch(ops) {
+        return this.readBatch('batch', ops);
+    }
+
+    async getSalesLabBootstrap() {
+        return this.readBatch('getSalesLabBootstrap', SALES_LAB_BOOTSTRAP);
+    }
+
     // === 2. Customer Engine (Traits/Personas) ===
     async getTraits() {
-        await delay();
+        await delay('getTraits');
+        await use('traits');
         return createResponse({ traits: db.traits });
     }
 
     async updateTraits(newTraits) {
-        await delay();
+        await delay('updateTraits');
+        await use('traits');
         db.traits = newTraits;
-        saveDb();
+        saveDb('traits');
         this.emitEvent("traits.updated", { count: newTraits.length });
         return createResponse({ traits: db.traits });
     }
 
     async getTraitLinkages() {
-        await delay();
+        await delay('getTraitLinkages');
+        await use('traitLinkages');
         return createResponse({ linkages: db.traitLinkages });
     }
 
     async getPersonas(regionFilter) {
-        await delay();
+        await delay('getPersonas');
+        await use('personas');
         let list = db.personas;
         if (regionFilter) {
             list = list.filter(p => p.regions.includes(regionFilter) || p.regions.includes("GLOBAL"));
@@ -189,47 +258,56 @@ class OperatorApiClient {
     }
 
     async getDifficulties() {
-        await delay();
+        await delay('getDifficulties');
+        await use('difficulties');
         return createResponse({ levels: db.difficulties });
     }
 
     async updateDifficulties(l) {
-        await delay();
+        await delay('updateDifficulties');
+        await use('difficulties');
         db.difficulties = l;
+        saveDb('difficulties');
         this.emitEvent("difficulties.updated", { count: l.length });
         return createResponse({ levels: l });
     }
 
     // === 3. Scenario Engine ===
     async getStages() {
-        await delay();
+        await delay('getStages');
+        await use('stages');
         return createResponse({ stages: db.stages });
     }
 
     async updateStages(s) {
-        await delay();
+        await delay('updateStages');
+        await use('stages');
         db.stages = s;
+        saveDb('stages');
         this.emitEvent("stages.updated", { count: s.length });
         return createResponse({ stages: s });
     }
 
     // === 3.1 Scenario Management (V2) ===
     async getScenarios() {
-        await delay();
-        return createResponse({ scenarios: db.scenarios || [] });
+        await delay('getScenarios');
+        await use('scenarios');
+        return createResponse({ scenarios: db.scenarios.toArray() });
     }
 
     async getScenario(id) {
-        await delay();
-        const s = (db.scenarios || []).find(x => x.scenarioId === id);
+        await delay('getScenario');
+        await use('scenarios');
+        const s = db.scenarios.get(id);
         return s ? createResponse({ scenario: s }) : createError("NOT_FOUND");
     }
 
     async createScenario(scenario) {
-        await delay();
-        if (!db.scenarios) db.scenarios = [];
+        await delay('createScenario');
+        await use('scenarios');
         const newScenario = { ...scenario, scenarioId: `sc_${Date.now()}`, versionId: "v1.0", published: false };
-        db.scenarios.push(newScenario);
+        db.scenarios.insert(newScenario);
+        saveDb('scenarios');
 
         this.emitEvent("scenario.created", { scenarioId: newScenario.scenarioId, title: newScenario.title });
         return createResponse({ scenario: newScenario });
@@ -237,20 +315,23 @@ class OperatorApiClient {
 
     // === 4. Prompt Engine (V2) ===
     async getPrompts() {
-        await delay();
+        await delay('getPrompts');
+        await use('prompts');
         return createResponse({ prompts: db.prompts });
     }
 
     async resolvePrompt(context) {
-        await delay();
+        await delay('resolvePrompt');
         return createResponse({ resolvedPrompt: "Mock resolved prompt based on hierarchy." });
     }
 
     async updatePrompt(promptId, content) {
-        await delay();
+        await delay('updatePrompt');
+        await use('prompts');
         const idx = db.prompts.findIndex(p => p.promptId === promptId);
         if (idx !== -1) {
             db.prompts[idx] = { ...db.prompts[idx], ...content };
+            saveDb('prompts');
 
             this.emitEvent("prompt.updated", { promptId, updates: Object.keys(content) });
             return createResponse({ prompt: db.prompts[idx] });
@@ -260,32 +341,40 @@ class OperatorApiClient {
 
     // === Legacy / Upsell Rules ===
     async createUpsellRule(rule) {
-        await delay();
+        await delay('createUpsellRule');
+        await use('upsellRules');
         db.upsellRules.push(rule);
+        saveDb('upsellRules');
         return createResponse({ rule });
     }
 
     async updateUpsellRule(id, rule) {
-        await delay();
+        await delay('updateUpsellRule');
+        await use('upsellRules');
         const idx = db.upsellRules.findIndex(r => r.id === id);
         if (idx !== -1) db.upsellRules[idx] = rule;
+        saveDb('upsellRules');
         return createResponse({ rule });
     }
 
     async deleteUpsellRule(id) {
-        await delay();
+        await delay('deleteUpsellRule');
+        await use('upsellRules');
         db.upsellRules = db.upsellRules.filter(r => r.id !== id);
+        saveDb('upsellRules');
         return createResponse({ success: true });
     }
 
     async getUpsellRules() {
-        await delay();
+        await delay('getUpsellRules');
+        await use('upsellRules');
         return createResponse({ rules: db.upsellRules });
     }
 
     // === 5. Gamification Engine (V2) ===
     async getGamificationSettings() {
-        await delay();
+        await delay('getGamificationSettings');
+        await use('gamification');
         return createResponse({
             xpRules: db.gamification.xpRules,
             badges: db.gamification.badges,
@@ -294,10 +383,12 @@ class OperatorApiClient {
     }
 
     async updateXpRule(id, updates) {
-        await delay();
+        await delay('updateXpRule');
+        await use('gamification');
         const idx = db.gamification.xpRules.findIndex(r => r.ruleId === id);
         if (idx !== -1) {
             db.gamification.xpRules[idx] = { ...db.gamification.xpRules[idx], ...updates };
+            saveDb('gamification');
 
             this.emitEvent("gamification.rule_updated", { ruleId: id, updates });
             return createResponse({ rule: db.gamification.xpRules[idx] });
@@ -307,46 +398,54 @@ class OperatorApiClient {
 
     // === 6. Mission Engine (V2) ===
     async getMissionTemplates() {
-        await delay();
+        await delay('getMissionTemplates');
+        await use('missionTemplates');
         return createResponse({ templates: db.missionTemplates });
     }
 
     async createMissionTemplate(template) {
-        await delay();
+        await delay('createMissionTemplate');
+        await use('missionTemplates');
         const newTemplate = { ...template, templateId: `mt_${Date.now()}`, published: false };
         db.missionTemplates.push(newTemplate);
+        saveDb('missionTemplates');
 
         this.emitEvent("mission.template_created", { templateId: newTemplate.templateId });
         return createResponse({ template: newTemplate });
     }
 
     async getQuests() {
-        await delay();
+        await delay('getQuests');
+        await use('quests');
         return createResponse({ quests: db.quests });
     }
 
     // === 8. Content Engine (V2) ===
-    async getMaterials() {
-        await delay();
-        return createResponse({ materials: db.materials });
+    async getMaterials({ status } = {}) {
+        await delay('getMaterials');
+        await use('materials');
+        const materials = status ? db.materials.where('status', status) : db.materials.toArray();
+        return createResponse({ materials });
     }
 
     async createMaterial(material) {
-        await delay();
+        await delay('createMaterial');
+        await use('materials', 'modules');
         const newMaterial = {
             ...material,
             materialId: `mat_${Date.now()}`,
             createdAt: new Date().toISOString(),
             autoGeneratedModule: { moduleId: null, status: 'pending' }
         };
-        db.materials.push(newMaterial);
+        db.materials.insert(newMaterial);
+        saveDb('materials');
 
         this.emitEvent("file.uploaded", { materialId: newMaterial.materialId, title: newMaterial.title });
 
         // Mock async module generation trigger
         setTimeout(() => {
             const modId = `mod_${Date.now()}`;
-            db.modules.push({
+            db.modules.insert({
                 moduleId: modId,
                 sourceMaterialId: newMaterial.materialId,
                 title: `Module: ${newMaterial.title}`,
@@ -357,7 +456,8 @@ class OperatorApiClient {
                 ],
                 createdAt: new Date().toISOString()
             });
-            newMaterial.autoGeneratedModule = { moduleId: modId, status: 'completed' };
+            db.materials.update(newMaterial.materialId, { autoGeneratedModule: { moduleId: modId, status: 'completed' } });
+            saveDb('materials', 'modules');
 
             // Limit complexity of async firing for now
         }, 2000);
@@ -366,74 +466,75 @@ class OperatorApiClient {
     }
 
     async updateMaterial(materialId, updates) {
-        await delay();
-        const idx = db.materials.findIndex(m => m.materialId === materialId);
-        if (idx !== -1) {
-            const currentVersion = db.materials[idx].version || 1;
-            db.materials[idx] = {
-                ...db.materials[idx],
-                ...updates,
-                version: currentVersion + 1, // Auto-increment version
-                lastUpdated: new Date().toISOString()
-            };
-
-            this.emitEvent("content.updated", { materialId, version: db.materials[idx].version });
-            return createResponse({ material: db.materials[idx] });
+        await delay('updateMaterial');
+        await use('materials');
+        const material = db.materials.update(materialId, current => ({
+            ...updates,
+            version: (current.version || 1) + 1, // Auto-increment version
+            lastUpdated: new Date().toISOString()
+        }));
+        if (material) {
+            saveDb('materials');
+            this.emitEvent("content.updated", { materialId, version: material.version });
+            return createResponse({ material });
         }
         return createError("NOT_FOUND");
     }
 
     async getModule(moduleId) {
-        await delay();
-        const m = db.modules.find(x => x.moduleId === moduleId);
+        await delay('getModule');
+        await use('modules');
+        const m = db.modules.get(moduleId);
         return m ? createResponse({ module: m }) : createError("NOT_FOUND");
     }
 
     // === 5. Quiz Engine ===
-    async getQuizzes() {
-        await delay();
-        return createResponse({ quizzes: db.quizzes || [] });
+    async getQuizzes({ materialId } = {}) {
+        await delay('getQuizzes');
+        await use('quizzes');
+        const quizzes = materialId ? db.quizzes.where('materialId', materialId) : db.quizzes.toArray();
+        return createResponse({ quizzes });
     }
 
     async getQuiz(quizId) {
-        await delay();
-        const q = (db.quizzes || []).find(x => x.quizId === quizId);
+        await delay('getQuiz');
+        await use('quizzes');
+        const q = db.quizzes.get(quizId);
         return q ? createResponse({ quiz: q }) : createError("NOT_FOUND");
     }
 
     async createQuiz(quiz) {
-        await delay();
-        if (!db.quizzes) db.quizzes = [];
+        await delay('createQuiz');
+        await use('quizzes');
         const newQuiz = {
             ...quiz,
             quizId: quiz.quizId || `quiz_${Date.now()}`,
             createdAt: new Date().toISOString(),
             version: 1
         };
-        db.quizzes.push(newQuiz);
-        saveDb();
+        db.quizzes.insert(newQuiz);
+        saveDb('quizzes');
         this.emitEvent("quiz.created", { quizId: newQuiz.quizId });
         return createResponse({ quiz: newQuiz });
     }
 
     async updateQuiz(quizId, updates) {
-        await delay();
-        const idx = (db.quizzes || []).findIndex(q => q.quizId === quizId);
-        if (idx !== -1) {
-            db.quizzes[idx] = { ...db.quizzes[idx], ...updates, version: (db.quizzes[idx].version || 1) + 1 };
-            saveDb();
+        await delay('updateQuiz');
+        await use('quizzes');
+        const quiz = db.quizzes.update(quizId, current => ({ ...updates, version: (current.version || 1) + 1 }));
+        if (quiz) {
+            saveDb('quizzes');
             this.emitEvent("quiz.updated", { quizId });
-            return createResponse({ quiz: db.quizzes[idx] });
+            return createResponse({ quiz });
         }
         return createError("NOT_FOUND");
     }
 
     async deleteQuiz(quizId) {
-        await delay();
-        const initialLen = (db.quizzes || []).length;
-        db.quizzes = (db.quizzes || []).filter(q => q.quizId !== quizId);
-        if (db.quizzes.length < initialLen) {
-            saveDb();
+        await delay('deleteQuiz');
+        await use('quizzes');
+        if (db.quizzes.remove(quizId)) {
+            saveDb('quizzes');
             this.emitEvent("quiz.deleted", { quizId });
             return createResponse({ success: true });
         }
@@ -441,10 +542,11 @@ class OperatorApiClient {
     }
 
     async generateQuiz(materialId) {
-        await delay(1500); // Simulate AI processing
+        await delay('generateQuiz', 1500); // Simulate AI processing
+        await use('materials', 'quizzes');
 
         // Check if material exists
-        const material = (db.materials || []).find(m => m.materialId === materialId);
+        const material = db.materials.get(materialId);
         if (!material) return createError("NOT_FOUND", "Material not found");
 
         const quiz = {
@@ -467,16 +569,12 @@ class OperatorApiClient {
             version: 1
         };
 
-        if (!db.quizzes) db.quizzes = [];
-        db.quizzes.push(quiz);
+        db.quizzes.insert(quiz);
 
         // Update material status
-        const matIdx = db.materials.findIndex(m => m.materialId === materialId);
-        if (matIdx !== -1) {
-            db.materials[matIdx].autoGeneratedModule = { status: 'completed', moduleId: quiz.quizId };
-        }
+        db.materials.update(materialId, { autoGeneratedModule: { status: 'completed', moduleId: quiz.quizId } });
 
-        saveDb();
+        saveDb('quizzes', 'materials');
         this.emitEvent("quiz.generated", { materialId, quizId: quiz.quizId });
 
         return createResponse({ quiz });
@@ -485,20 +583,23 @@ class OperatorApiClient {
 
     // === 9. Intelligence Engine (V2) ===
     async getUserPerformance(userId) {
-        await delay();
+        await delay('getUserPerformance');
+        await use('upm');
         // Return mock data for a fixed user if not found
         const stats = db.upm[userId] || db.upm["u_01"];
         return createResponse({ performance: stats });
     }
 
     async getInsights(userId) {
-        await delay();
+        await delay('getInsights');
+        await use('insights');
         // Return all insights for now, filtered by user in real app
         return createResponse({ insights: db.insights });
     }
 
     async generateInsights(userId) {
-        await delay(1000); // Simulate AI analysis
+        await delay('generateInsights', 1000); // Simulate AI analysis
+        await use('insights');
         const newInsight = {
             insightId: `ins_${Date.now()}`,
             userId,
@@ -511,19 +612,22 @@ class OperatorApiClient {
             createdAt: new Date().toISOString()
         };
         db.insights.unshift(newInsight); // Add to top
+        saveDb('insights');
 
         this.emitEvent("insight.generated", { userId, type: newInsight.type });
         return createResponse({ insights: [newInsight] });
     }
 
     async getUserGamificationState(userId) {
-        await delay();
+        await delay('getUserGamificationState');
+        await use('userGamification');
         const state = db.userGamification[userId] || db.userGamification["u_01"];
         return createResponse({ state });
     }
 
     async runSimulation(params) {
-        await delay(500);
+        await delay('runSimulation', 500);
+        await use('upm', 'userGamification');
 
         // --- MOCK PIPELINE: Simulate Session Log & UPM Update ---
         const userId = "u_01";
@@ -570,6 +674,7 @@ class OperatorApiClient {
             }
             db.userGamification[userId] = { ...gameState };
         }
+        saveDb('upm', 'userGamification');
 
         this.emitEvent("session.completed", {
             userId,
@@ -589,44 +694,45 @@ class OperatorApiClient {
     }
 
     // === 8. User Management ===
-    async getUsers() {
-        await delay();
-        return createResponse({ users: db.users || [] });
+    async getUsers({ regionId } = {}) {
+        await delay('getUsers');
+        await use('users');
+        const users = regionId ? db.users.where('regionId', regionId) : db.users.toArray();
+        return createResponse({ users });
     }
 
     async createUser(user) {
-        await delay();
-        if (!db.users) db.users = [];
+        await delay('createUser');
+        await use('users');
         const newUser = {
             ...user,
             id: `u_${Date.now()}`,
             joined: new Date().toISOString().split('T')[0],
             status: 'Active'
         };
-        db.users.push(newUser);
-        saveDb();
+        db.users.insert(newUser);
+        saveDb('users');
         this.emitEvent("user.created", { userId: newUser.id });
         return createResponse({ user: newUser });
     }
 
     async updateUser(userId, updates) {
-        await delay();
-        const idx = (db.users || []).findIndex(u => u.id === userId);
-        if (idx !== -1) {
-            db.users[idx] = { ...db.users[idx], ...updates };
-            saveDb();
+        await delay('updateUser');
+        await use('users');
+        const user = db.users.update(userId, updates);
+        if (user) {
+            saveDb('users');
             this.emitEvent("user.updated", { userId });
-            return createResponse({ user: db.users[idx] });
+            return createResponse({ user });
         }
         return createError("NOT_FOUND");
     }
 
     async deleteUser(userId) {
-        await delay();
-        const initialLen = (db.users || []).length;
-        db.users = (db.users || []).filter(u => u.id !== userId);
-        if (db.users.length < initialLen) {
-            saveDb();
+        await delay('deleteUser');
+        await use('users');
+        if (db.users.remove(userId)) {
+            saveDb('users');
             this.emitEvent("user.deleted", { userId });
             return createResponse({ success: true });
         }
@@ -636,7 +742,8 @@ class OperatorApiClient {
 
     // === 10. Dashboard Engine ===
     async getDashboardWidgets() {
-        await delay();
+        await delay('getDashboardWidgets');
+        await use('dashboardWidgets');
         // Initialize if empty
         if (!db.dashboardWidgets) {
             db.dashboardWidgets = [
@@ -647,20 +754,21 @@ class OperatorApiClient {
                 { id: 'w_daily_activity', type: 'chart', title: 'Weekly Engagement Trends', endpoint: 'stats.activityData', size: 'large', order: 5, visible: true },
                 { id: 'w_module_dropoff', type: 'chart', title: 'Module Completion vs. Drop-off', endpoint: 'stats.moduleDropoff', size: 'medium', order: 6, visible: true },
             ];
-            saveDb();
+            saveDb('dashboardWidgets');
         }
         return createResponse({ widgets: db.dashboardWidgets });
     }
 
     async updateDashboardWidgets(widgets) {
-        await delay();
+        await delay('updateDashboardWidgets');
+        await use('dashboardWidgets');
         db.dashboardWidgets = widgets;
-        saveDb();
+        saveDb('dashboardWidgets');
         return createResponse({ widgets: db.dashboardWidgets });
     }
 
     async getWidgetData(endpoint, filter) {
-        await delay(); // Simulate network
+        await delay('getWidgetData'); // Simulate network
         // Mock Data Generation based on endpoint
         const scopeMultiplier = filter?.scope === 'GLOBAL' ? 1 : filter?.scope === 'REGION' ? 0.3 : 0.1;
 
@@ -705,11 +813,15 @@ export const operatorApi = {
     instance: apiInstance,
 
     // User Management
-    getUsers: () => apiInstance.getUsers(),
+    getUsers: (filter) => apiInstance.getUsers(filter),
     createUser: (u) => apiInstance.createUser(u),
     updateUser: (id, u) => apiInstance.updateUser(id, u),
     deleteUser: (id) => apiInstance.deleteUser(id),
 
+    // Batch Reads
+    batch: (ops) => apiInstance.batch(ops),
+    getSalesLabBootstrap: () => apiInstance.getSalesLabBootstrap(),
+
     // Product Catalog
     getProductCatalog: () => apiInstance.getProductCatalog(),
     updateProductCatalog: (c) => apiInstance.updateProductCatalog(c),
@@ -758,13 +870,13 @@ export const operatorApi = {
     getQuests: () => apiInstance.getQuests(),
 
     // Content
-    getMaterials: () => apiInstance.getMaterials(),
+    getMaterials: (filter) => apiInstance.getMaterials(filter),
     createMaterial: (m) => apiInstance.createMaterial(m),
     updateMaterial: (id, u) => apiInstance.updateMaterial(id, u),
     getModule: (id) => apiInstance.getModule(id),
 
     // Quiz (V2)
-    getQuizzes: () => apiInstance.getQuizzes(),
+    getQuizzes: (filter) => apiInstance.getQuizzes(filter),
     getQuiz: (id) => apiInstance.getQuiz(id),
     createQuiz: (q) => apiInstance.createQuiz(q),
     updateQuiz: (id, u) => apiInstance.updateQuiz(id, u),
@@ -782,3 +894,14 @@ export const operatorApi = {
     updateDashboardWidgets: (w) => apiInstance.updateDashboardWidgets(w),
     getWidgetData: (ep, f) => apiInstance.getWidgetData(ep, f)
 };
+
+// While a latency recording is active, time every call end to end (see latencyProfile.js)
+Object.keys(operatorApi).forEach((name) => {
+    const call = operatorApi[name];
+    if (typeof call !== 'function') return;
+    operatorApi[name] = (...args) => {
+        if (!latencyProfile.isRecording) return call(...args);
+        const started = performance.now();
+        return Promise.resolve(call(...args)).finally(() => latencyProfile.record(name, performance.now() - started));
+    };
+});
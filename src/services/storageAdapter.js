@@ -1,40 +1,102 @@
 /**
  * StorageAdapter
- * Persists the in-memory mock DB to LocalStorage so changes survive refreshes.
+ * Persists the in-memory mock DB to IndexedDB so changes survive refreshes.
+ * Each collection is stored as its own record: a mutation only marks its
+ * collection dirty, and dirty collections are written together in one
+ * transaction when the browser is idle. Collections are loaded lazily on first
+ * use; state saved by the previous LocalStorage adapter is read as a fallback.
  */
 
-const STORAGE_KEY = "AG_RETAIL_TRAINER_DB_V2";
+import { localDB } from '../lib/storage';
+import { appActivity } from '../lib/appActivity';
 
-export const StorageAdapter = {
-    save: (dbState) => {
+const LEGACY_STORAGE_KEY = "AG_RETAIL_TRAINER_DB_V2";
+const IDLE_TIMEOUT_MS = 1000;
+
+const dirty = new Map(); // collection name -> () => current value
+let scheduled = false;
+let flushing = Promise.resolve();
+let legacyState;
+
+const readLegacy = () => {
+    if (legacyState === undefined) {
         try {
-            const serialized = JSON.stringify(dbState);
-            localStorage.setItem(STORAGE_KEY, serialized);
-            // console.log("[StorageAdapter] Saved DB state.");
+            const serialized = localStorage.getItem(LEGACY_STORAGE_KEY);
+            legacyState = serialized ? JSON.parse(serialized) : null;
         } catch (e) {
-            console.error("[StorageAdapter] Save failed", e);
+            console.error("[StorageAdapter] Legacy load failed", e);
+            legacyState = null;
         }
-    },
+    }
+    return legacyState;
+};
+
+const whenIdle = (callback) => {
+    if (typeof requestIdleCallback === 'function') requestIdleCallback(callback, { timeout: IDLE_TIMEOUT_MS });
+    else setTimeout(callback, 50);
+};
 
-    load: (initialState) => {
+const toRecord = (name, value) => ({
+    name,
+    value: typeof value?.toJSON === 'function' ? value.toJSON() : value,
+    savedAt: Date.now()
+});
+
+export const StorageAdapter = {
+    /** Resolves with the saved value of one collection, or `initialValue` if none was saved. */
+    async loadCollection(name, initialValue) {
         try {
-            const serialized = localStorage.getItem(STORAGE_KEY);
-            if (!serialized) {
-                console.log("[StorageAdapter] No saved DB found. Using Initial Mock Data.");
-                return initialState;
-            }
-            const saved = JSON.parse(serialized);
-            // Deep merge logic could go here, but for now effective replacement
-            console.log("[StorageAdapter] Loaded DB from LocalStorage.");
-            return { ...initialState, ...saved };
+            const record = await localDB.getCollection(name);
+            if (record) return record.value;
         } catch (e) {
-            console.error("[StorageAdapter] Load failed", e);
-            return initialState;
+            console.error(`[StorageAdapter] Load of "${name}" failed`, e);
         }
+        const legacy = readLegacy();
+        return legacy && name in legacy ? legacy[name] : initialValue;
+    },
+
+    /** Marks a collection dirty; `getValue` is read when the next batch is written. */
+    markDirty(name, getValue) {
+        dirty.set(name, getValue);
+        if (scheduled) return;
+        scheduled = true;
+        appActivity.beginSave();
+        whenIdle(() => {
+            scheduled = false;
+            StorageAdapter.flush().finally(appActivity.endSave);
+        });
     },
 
-    clear: () => {
-        localStorage.removeItem(STORAGE_KEY);
+    /**
+     * Writes all dirty collections in one transaction; resolves once it is committed.
+     * If the write fails, its collections are dirty again and go out with the next batch.
+     */
+    flush() {
+        if (dirty.size === 0) return flushing;
+        const batch = Array.from(dirty);
+        const records = batch.map(([name, getValue]) => toRecord(name, getValue()));
+        dirty.clear();
+        flushing = flushing
+            .then(() => localDB.putCollections(records))
+            .catch(e => {
+                console.error("[StorageAdapter] Save failed", e);
+                // A collection marked again meanwhile already has a newer entry
+                for (const [name, getValue] of batch) {
+                    if (!dirty.has(name)) dirty.set(name, getValue);
+                }
+            });
+        return flushing;
+    },
+
+    async clear() {
+        dirty.clear();
+        await localDB.clearCollections();
+        localStorage.removeItem(LEGACY_STORAGE_KEY);
         window.location.reload();
     }
 };
+
+// Best effort: write a pending batch before the page goes away
+if (typeof window !== 'undefined') {
+    window.addEventListener('pagehide', () => StorageAdapter.flush());
+}
@@ -1,58 +1,128 @@
 import { create } from 'zustand';
+import { EMPTY_LIST, append, at, fromArray, last, toArray } from '../lib/chunkedList';
+import { chatHistory } from '../lib/chatHistory';
 
-export const useChatStore = create((set) => ({
-    messages: [],
+// Sample sessions for first-time users, newest first
+const SAMPLE_SESSIONS = [
+    {
+        id: 1,
+        date: new Date(Date.now() - 86400000).toISOString(),
+        totalScore: 85,
+        product: { name: 'LG OLED evo G5' },
+        customer: { traits: [{ label: 'Tech Savvy' }, { label: 'Male' }] },
+        summary: 'Great job explaining the technical features. Try to focus more on emotional benefits next time.',
+        pros: ['Strong product knowledge', 'Clear explanation'],
+        improvements: ['Missed closing signal', 'Could use more empathy'],
+        scores: [
+            { subject: 'Product Knowledge', A: 90, fullMark: 100 },
+            { subject: 'Objection Handling', A: 75, fullMark: 100 },
+            { subject: 'Empathy', A: 80, fullMark: 100 },
+            { subject: 'Policy', A: 85, fullMark: 100 },
+            { subject: 'Conversation', A: 88, fullMark: 100 },
+        ],
+        recommendedMission: { title: 'Emotional Selling', xp: 50 }
+    },
+    {
+        id: 2,
+        date: new Date(Date.now() - 172800000).toISOString(),
+        totalScore: 72,
+        product: { name: 'LG QNED 90' },
+        customer: { traits: [{ label: 'Price Sensitive' }, { label: 'Female' }] },
+        summary: 'Good effort handling the price objection. Remember to emphasize value over cost.',
+        pros: ['Patient listening', 'Polite tone'],
+        improvements: ['Struggled with price justification', 'Hesitant closing'],
+        scores: [
+            { subject: 'Product Knowledge', A: 70, fullMark: 100 },
+            { subject: 'Objection Handling', A: 65, fullMark: 100 },
+            { subject: 'Empathy', A: 85, fullMark: 100 },
+            { subject: 'Policy', A: 70, fullMark: 100 },
+            { subject: 'Conversation', A: 75, fullMark: 100 },
+        ],
+        recommendedMission: { title: 'Value Proposition', xp: 40 }
+    }
+];
+
+// Shared by every caller, so the history is read from IndexedDB once per page load
+let historyLoad = null;
+let olderLoad = null;
+
+// `messages` and `sessions` are chunked lists (see lib/chunkedList.js), both in
+// the order they were added: read them with at()/length, or toArray() when an array is needed.
+// Tutor messages are saved through lib/chatHistory.js; `messages` holds the latest
+// page of `chatSession` (the record chatHistory keeps up to date) and older pages
+// are prepended by loadOlderMessages().
+export const useChatStore = create((set, get) => ({
+    messages: EMPTY_LIST,
+    chatSession: null,
+    hasOlderMessages: false,
     isTyping: false,
     currentScenario: null,
     feedback: null,
-    sessions: [
-        {
-            id: 1,
-            date: new Date(Date.now() - 86400000).toISOString(),
-            totalScore: 85,
-            product: { name: 'LG OLED evo G5' },
-            customer: { traits: [{ label: 'Tech Savvy' }, { label: 'Male' }] },
-            summary: 'Great job explaining the technical features. Try to focus more on emotional benefits next time.',
-            pros: ['Strong product knowledge', 'Clear explanation'],
-            improvements: ['Missed closing signal', 'Could use more empathy'],
-            scores: [
-                { subject: 'Product Knowledge', A: 90, fullMark: 100 },
-                { subject: 'Objection Handling', A: 75, fullMark: 100 },
-                { subject: 'Empathy', A: 80, fullMark: 100 },
-                { subject: 'Policy', A: 85, fullMark: 100 },
-                { subject: 'Conversation', A: 88, fullMark: 100 },
-            ],
-            recommendedMission: { title: 'Emotional Selling', xp: 50 }
-        },
-        {
-            id: 2,
-            date: new Date(Date.now() - 172800000).toISOString(),
-            totalScore: 72,
-            product: { name: 'LG QNED 90' },
-            customer: { traits: [{ label: 'Price Sensitive' }, { label: 'Female' }] },
-            summary: 'Good effort handling the price objection. Remember to emphasize value over cost.',
-            pros: ['Patient listening', 'Polite tone'],
-            improvements: ['Struggled with price justification', 'Hesitant closing'],
-            scores: [
-                { subject: 'Product Knowledge', A: 70, fullMark: 100 },
-                { subject: 'Objection Handling', A: 65, fullMark: 100 },
-                { subject: 'Empathy', A: 85, fullMark: 100 },
-                { subject: 'Policy', A: 70, fullMark: 100 },
-                { subject: 'Conversation', A: 75, fullMark: 100 },
-            ],
-            recommendedMission: { title: 'Value Proposition', xp: 40 }
-        }
-    ],
-
-    addMessage: (message) => set((state) => ({
-        messages: [...state.messages, { ...message, id: Date.now() }]
-    })),
+    sessions: fromArray([...SAMPLE_SESSIONS].reverse()),
+
+    loadHistory: () => {
+        historyLoad ??= (async () => {
+            const [{ session, messages, hasOlder }, labSessions] = await Promise.all([
+                chatHistory.latestPage('tutor'),
+                chatHistory.loadLabSessions()
+            ]);
+            set((state) => {
+                const known = new Set(toArray(state.sessions).map(s => s.id));
+                return {
+                    chatSession: state.chatSession ?? session,
+                    messages: state.messages.length ? state.messages : fromArray(messages),
+                    hasOlderMessages: state.messages.length ? state.hasOlderMessages : hasOlder,
+                    sessions: labSessions.filter(s => !known.has(s.id)).reduce(append, state.sessions)
+                };
+            });
+        })();
+        return historyLoad;
+    },
+
+    loadOlderMessages: () => {
+        const { chatSession, messages, hasOlderMessages } = get();
+        if (!chatSession || !hasOlderMessages || olderLoad) return olderLoad;
+        olderLoad = chatHistory.olderPage(chatSession.id, at(messages, 0).seq)
+            .then(({ messages: older, hasOlder }) => set((state) => state.chatSession !== chatSession ? {} : {
+                messages: fromArray([...older, ...toArray(state.messages)]),
+                hasOlderMessages: hasOlder
+            }))
+            .finally(() => { olderLoad = null; });
+        return olderLoad;
+    },
+
+    addMessage: (message) => {
+        const state = get();
+        const previous = last(state.messages);
+        const chatSession = state.chatSession ?? chatHistory.newSession('tutor');
+        // Date.now() alone repeats within a millisecond; ids are list keys
+        const entry = {
+            ...message,
+            id: Math.max(Date.now(), (previous?.id ?? 0) + 1),
+            seq: previous ? previous.seq + 1 : 0
+        };
+        set({ chatSession, messages: append(state.messages, entry) });
+        chatHistory.append(chatSession, entry);
+    },
 
     setTyping: (status) => set({ isTyping: status }),
 
-    addSession: (session) => set((state) => ({
-        sessions: [session, ...state.sessions]
-    })),
+    addSession: (session) => {
+        set((state) => ({ sessions: append(state.sessions, session) }));
+        chatHistory.saveLabSession(session);
+    },
+
+    clearSessions: () => {
+        set({ sessions: EMPTY_LIST });
+        chatHistory.clearLabSessions();
+    },
+
+    resetChat: () => set({ messages: EMPTY_LIST, hasOlderMessages: false }),
 
-    resetChat: () => set({ messages: [] }),
+    // Ends the saved session (left for compaction) and starts a new one; resolves once written
+    clearMessages: () => {
+        const { chatSession } = get();
+        set({ messages: EMPTY_LIST, hasOlderMessages: false, chatSession: chatHistory.newSession('tutor') });
+        return chatSession && chatSession.messageCount > 0 ? chatHistory.endSession(chatSession) : Promise.resolve();
+    },
 }));
@@ -1,87 +1,47 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, waits
+
+async def run_case(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the app has rendered and settled
+    await waits.goto(page, "http://localhost:5173")
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on the 'AI 튜터' (AI Tutor) link to open the AI Chatbot interface.
+    frame = context.pages[-1]
+    # Click on 'AI 튜터' link to open AI Chatbot interface
+    elem = locators.on(frame)("nav.ai_trainer")
+    await waits.click(page, elem)
+
+
+    # -> Input a query in the chat input box to trigger a long AI response containing markdown elements such as tables and bold text.
+    frame = context.pages[-1]
+    # Input query to trigger long AI response with markdown elements
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/input').nth(0)
+    await waits.fill(page, elem, 'Please provide a detailed comparison of OLED vs QNED TVs including a summary and a detailed section with markdown formatting including bold text and tables.')
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the 'AI 튜터' (AI Tutor) link to open the AI Chatbot interface.
-        frame = context.pages[-1]
-        # Click on 'AI 튜터' link to open AI Chatbot interface
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Input a query in the chat input box to trigger a long AI response containing markdown elements such as tables and bold text.
-        frame = context.pages[-1]
-        # Input query to trigger long AI response with markdown elements
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Please provide a detailed comparison of OLED vs QNED TVs including a summary and a detailed section with markdown formatting including bold text and tables.')
-        
+    frame = context.pages[-1]
+    # Send the query by clicking the send button
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/button[3]').nth(0)
+    await waits.click(page, elem)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect(frame.locator('text=안녕하세요! LG TV 세일즈 튜터입니다. 제품 지식부터 판매 노하우까지, 무엇이든 물어보세요! 😊').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Differences between OLED and QNED').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Tips to overcome price resistance').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Effective closing phrases').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Competitor comparison points').first).to_be_visible(timeout=30000)
+
+
+async def run_test():
+    await runner.run_standalone(run_case)
 
-        frame = context.pages[-1]
-        # Send the query by clicking the send button
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=안녕하세요! LG TV 세일즈 튜터입니다. 제품 지식부터 판매 노하우까지, 무엇이든 물어보세요! 😊').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Differences between OLED and QNED').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Tips to overcome price resistance').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Effective closing phrases').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Competitor comparison points').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,125 +1,27 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, state, waits
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on Sales Lab to start a chat session and enter multiple messages.
-        frame = context.pages[-1]
-        # Click on Sales Lab to enter the chat interface and start a chat session.
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the 'Start Simulation' button to begin the chat session in Sales Lab and enter multiple messages.
-        frame = context.pages[-1]
-        # Click the 'Start Simulation' button to start the chat session in Sales Lab.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_case(context):
+    # Start from a Sales Lab session saved with Save & Exit and an AI Tutor question (built once, see harness/state.py)
+    page = await state.restore(context, "tutor_chat_history")
 
-        # -> Enter multiple messages in the chat input box and send them to simulate a chat session.
-        frame = context.pages[-1]
-        # Enter first message in Sales Lab chat input box.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Hello, I would like to know more about the AI Processor Alpha 11.')
-        
+    # Reload straight into the chatbot and verify chat history is restored from IndexedDB.
+    await waits.goto(page, 'http://localhost:5173/ai-trainer')
+    await expect(locators.on(page)("tutor.messages").get_by_text(state.TUTOR_QUESTION)).to_be_visible()
 
-        frame = context.pages[-1]
-        # Click send button to send first message.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Navigate back to the main dashboard and then re-enter Sales Lab to attempt to restore the chat session and verify chat history persistence.
-        frame = context.pages[-1]
-        # Click on the '홈 대시보드' (Home Dashboard) link in the sidebar to navigate back to the main dashboard.
-        elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try clicking the 'AI 튜터' link to navigate to the AI Chatbot interface and test chat history persistence there.
-        frame = context.pages[-1]
-        # Click on 'AI 튜터' link to navigate to AI Chatbot interface.
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    try:
+        await expect(frame.locator('text=Chat history successfully restored from IndexedDB').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test failed: Chat histories in Sales Lab and AI Chatbot were not saved to or restored from IndexedDB correctly across sessions as per the test plan.")
 
-        # -> Enter multiple messages in the AI Tutor chat input box at index 19 and send them using the send button at index 20 to simulate a chat session.
-        frame = context.pages[-1]
-        # Enter first message in AI Tutor chat input box.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Hello, can you explain the difference between OLED and QNED?')
-        
 
-        frame = context.pages[-1]
-        # Click send button to send first message.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_test():
+    await runner.run_standalone(run_case)
 
-        # -> Use browser reload action to refresh the page and verify if chat history is restored from IndexedDB.
-        await page.goto('http://localhost:5173/ai-trainer', timeout=10000)
-        await asyncio.sleep(3)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Chat history successfully restored from IndexedDB').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test failed: Chat histories in Sales Lab and AI Chatbot were not saved to or restored from IndexedDB correctly across sessions as per the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,178 +1,138 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, waits
+
+async def run_case(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the app has rendered and settled
+    await waits.goto(page, "http://localhost:5173")
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on the 'Sales Lab' link to access the chat interface for testing on mobile.
+    frame = context.pages[-1]
+    # Click on 'Sales Lab' link to navigate to Sales Lab chat interface
+    elem = locators.on(frame)("nav.sales_lab")
+    await waits.click(page, elem)
+
+
+    # -> Click the 'Start Simulation' button to enter the chat interface for testing input field visibility on mobile.
+    frame = context.pages[-1]
+    # Click 'Start Simulation' button to start the chat simulation
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Focus the chat input field to trigger the on-screen keyboard and verify the input remains fully visible and accessible.
+    frame = context.pages[-1]
+    # Focus the chat input field to trigger the on-screen keyboard
+    elem = locators.on(frame)("chat.input")
+    await waits.click(page, elem)
+
+
+    # -> Click 'Start Simulation' button to enter the chat interface and verify chat input visibility and usability on mobile.
+    frame = context.pages[-1]
+    # Click 'Start Simulation' button to start the chat simulation and access chat input interface
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Focus the chat input field (index 13) to trigger the on-screen keyboard and verify the input remains fully visible and accessible.
+    frame = context.pages[-1]
+    # Focus the chat input field to trigger the on-screen keyboard
+    elem = locators.on(frame)("chat.input")
+    await waits.click(page, elem)
+
+
+    # -> Verify that the user can scroll the chat history and type messages without any interface issues while the keyboard is active.
+    frame = context.pages[-1]
+    # Type a test message in the chat input field to verify typing usability and scroll behavior.
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, 'Test message to verify input usability and scroll behavior')
+
+
+    frame = context.pages[-1]
+    # Click the send button to send the test message and verify chat interface behavior.
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    await waits.scroll(page, 0, 200)
+
+
+    # -> Test speech-to-text auto mode activation by clicking the Auto Conversation Mode button (index 13) and verify it does not obscure or disrupt the chat input interface.
+    frame = context.pages[-1]
+    # Click the Auto Conversation Mode button to activate speech-to-text and verify chat input visibility and usability.
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div/button[2]').nth(0)
+    await waits.click(page, elem)
+
+
+    # -> Return to the chat interface by clicking 'Start Simulation' (index 52) to continue testing Markdown rendering and final input visibility checks.
+    frame = context.pages[-1]
+    # Click 'Start Simulation' button to return to chat interface for further testing
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Focus the chat input field (index 13) to trigger the on-screen keyboard and verify if the input remains fully visible and accessible despite the error message.
+    frame = context.pages[-1]
+    # Focus the chat input field to trigger the on-screen keyboard and check visibility and accessibility despite error message
+    elem = locators.on(frame)("chat.input")
+    await waits.click(page, elem)
+
+
+    # -> Verify that the user can scroll the chat history and type messages without any interface issues while the keyboard is active, despite the error message.
+    frame = context.pages[-1]
+    # Type a test message in the chat input field to verify typing usability despite the error message.
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, 'Testing input usability despite error message')
+
+
+    frame = context.pages[-1]
+    # Click the send button to send the test message and verify chat interface behavior.
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    await waits.scroll(page, 0, 200)
+
+
+    # -> Click the 'Start Simulation' button (index 56) to enter the chat interface for testing input field visibility on mobile.
+    frame = context.pages[-1]
+    # Click 'Start Simulation' button to start the chat simulation and access chat input interface
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Verify that the user can scroll the chat history and type messages without any interface issues while the keyboard is active, despite the error message.
+    frame = context.pages[-1]
+    # Type a test message in the chat input field to verify typing usability despite the error message.
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, 'Testing input usability despite error message')
+
+
+    frame = context.pages[-1]
+    # Click the send button to send the test message and verify chat interface behavior.
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    await waits.scroll(page, 0, 200)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect(frame.locator('text=Sales Lab').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=오류가 발생했습니다.').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Testing input usability despite error message').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=🏁 대화 종료 및 평가하기').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Type your response or click the mic for auto mode.').first).to_be_visible(timeout=30000)
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the 'Sales Lab' link to access the chat interface for testing on mobile.
-        frame = context.pages[-1]
-        # Click on 'Sales Lab' link to navigate to Sales Lab chat interface
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the 'Start Simulation' button to enter the chat interface for testing input field visibility on mobile.
-        frame = context.pages[-1]
-        # Click 'Start Simulation' button to start the chat simulation
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Focus the chat input field to trigger the on-screen keyboard and verify the input remains fully visible and accessible.
-        frame = context.pages[-1]
-        # Focus the chat input field to trigger the on-screen keyboard
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click 'Start Simulation' button to enter the chat interface and verify chat input visibility and usability on mobile.
-        frame = context.pages[-1]
-        # Click 'Start Simulation' button to start the chat simulation and access chat input interface
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Focus the chat input field (index 13) to trigger the on-screen keyboard and verify the input remains fully visible and accessible.
-        frame = context.pages[-1]
-        # Focus the chat input field to trigger the on-screen keyboard
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Verify that the user can scroll the chat history and type messages without any interface issues while the keyboard is active.
-        frame = context.pages[-1]
-        # Type a test message in the chat input field to verify typing usability and scroll behavior.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test message to verify input usability and scroll behavior')
-        
-
-        frame = context.pages[-1]
-        # Click the send button to send the test message and verify chat interface behavior.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        await page.mouse.wheel(0, 200)
-        
-
-        # -> Test speech-to-text auto mode activation by clicking the Auto Conversation Mode button (index 13) and verify it does not obscure or disrupt the chat input interface.
-        frame = context.pages[-1]
-        # Click the Auto Conversation Mode button to activate speech-to-text and verify chat input visibility and usability.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Return to the chat interface by clicking 'Start Simulation' (index 52) to continue testing Markdown rendering and final input visibility checks.
-        frame = context.pages[-1]
-        # Click 'Start Simulation' button to return to chat interface for further testing
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Focus the chat input field (index 13) to trigger the on-screen keyboard and verify if the input remains fully visible and accessible despite the error message.
-        frame = context.pages[-1]
-        # Focus the chat input field to trigger the on-screen keyboard and check visibility and accessibility despite error message
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Verify that the user can scroll the chat history and type messages without any interface issues while the keyboard is active, despite the error message.
-        frame = context.pages[-1]
-        # Type a test message in the chat input field to verify typing usability despite the error message.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Testing input usability despite error message')
-        
-
-        frame = context.pages[-1]
-        # Click the send button to send the test message and verify chat interface behavior.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        await page.mouse.wheel(0, 200)
-        
-
-        # -> Click the 'Start Simulation' button (index 56) to enter the chat interface for testing input field visibility on mobile.
-        frame = context.pages[-1]
-        # Click 'Start Simulation' button to start the chat simulation and access chat input interface
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Verify that the user can scroll the chat history and type messages without any interface issues while the keyboard is active, despite the error message.
-        frame = context.pages[-1]
-        # Type a test message in the chat input field to verify typing usability despite the error message.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Testing input usability despite error message')
-        
-
-        frame = context.pages[-1]
-        # Click the send button to send the test message and verify chat interface behavior.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        await page.mouse.wheel(0, 200)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Sales Lab').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=오류가 발생했습니다.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Testing input usability despite error message').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=🏁 대화 종료 및 평가하기').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Type your response or click the mic for auto mode.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    await runner.run_standalone(run_case)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
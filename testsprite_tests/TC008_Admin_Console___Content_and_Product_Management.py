@@ -1,80 +1,40 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, waits
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_case(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the app has rendered and settled
+    await waits.goto(page, "http://localhost:5173")
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on 'Admin Console' link to navigate to Content Management
+    frame = context.pages[-1]
+    # Click on Admin Console link to navigate to Content Management
+    elem = locators.on(frame)("nav.admin_console")
+    await waits.click(page, elem)
+
+
+    # -> Click on 'Content (CMS)' link to navigate to Content Management
+    frame = context.pages[-1]
+    # Click on Content (CMS) link to navigate to Content Management
+    elem = locators.on(frame)("admin.nav", section="cms")
+    await waits.click(page, elem)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on 'Admin Console' link to navigate to Content Management
-        frame = context.pages[-1]
-        # Click on Admin Console link to navigate to Content Management
-        elem = frame.locator('xpath=html/body/div/div/aside/div[2]/button/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+        await expect(frame.locator('text=Nonexistent Content Confirmation Message').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: Admin was unable to add, edit, or remove content and products as required, or changes did not persist via simulated APIs.")
+
+
+async def run_test():
+    await runner.run_standalone(run_case)
 
-        # -> Click on 'Content (CMS)' link to navigate to Content Management
-        frame = context.pages[-1]
-        # Click on Content (CMS) link to navigate to Content Management
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Nonexistent Content Confirmation Message').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: Admin was unable to add, edit, or remove content and products as required, or changes did not persist via simulated APIs.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,122 +1,82 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, waits
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_case(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the app has rendered and settled
+    await waits.goto(page, "http://localhost:5173")
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on the '공부방' (Study Room) tab to open the Study Room page
+    frame = context.pages[-1]
+    # Click on the '공부방' (Study Room) tab to navigate to Study Room page
+    elem = locators.on(frame)("nav.study")
+    await waits.click(page, elem)
+
+
+    # -> Click on the '자료실' tab to verify content loads correctly
+    frame = context.pages[-1]
+    # Click on the '자료실' tab to switch content
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/button[2]').nth(0)
+    await waits.click(page, elem)
+
+
+    # -> Click on the '토론방' tab to verify content loads correctly
+    frame = context.pages[-1]
+    # Click on the '토론방' tab to switch content
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/button[3]').nth(0)
+    await waits.click(page, elem)
+
+
+    # -> Click on the 'FAQ' tab to verify content loads correctly and no UI glitches occur
+    frame = context.pages[-1]
+    # Click on the 'FAQ' tab to switch content
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/button[4]').nth(0)
+    await waits.click(page, elem)
+
+
+    # -> Validate Speech-to-Text triggering in Auto Mode in Sales Lab tab
+    frame = context.pages[-1]
+    # Click on 'Sales Lab' tab to test Speech-to-Text triggering in Auto Mode
+    elem = locators.on(frame)("nav.sales_lab")
+    await waits.click(page, elem)
+
+
+    # -> Navigate to AI 튜터 (Chatbot) tab to verify Markdown rendering and UI stability
+    frame = context.pages[-1]
+    # Click on AI 튜터 (Chatbot) tab to verify Markdown rendering and UI stability
+    elem = locators.on(frame)("nav.ai_trainer")
+    await waits.click(page, elem)
+
+
+    # -> Click on the first chatbot message button 'OLED vs QNED 차이점' to verify Markdown rendering and UI stability
+    frame = context.pages[-1]
+    # Click on 'OLED vs QNED 차이점' chatbot message button to verify Markdown rendering and UI stability
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[2]/div[2]/button').nth(0)
+    await waits.click(page, elem)
+
+
+    # -> Click on the '가격 저항 극복 팁' chatbot message button to verify Markdown rendering and UI stability
+    frame = context.pages[-1]
+    # Click on '가격 저항 극복 팁' chatbot message button to verify Markdown rendering and UI stability
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[2]/div[2]/button[2]').nth(0)
+    await waits.click(page, elem)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the '공부방' (Study Room) tab to open the Study Room page
-        frame = context.pages[-1]
-        # Click on the '공부방' (Study Room) tab to navigate to Study Room page
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on the '자료실' tab to verify content loads correctly
-        frame = context.pages[-1]
-        # Click on the '자료실' tab to switch content
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on the '토론방' tab to verify content loads correctly
-        frame = context.pages[-1]
-        # Click on the '토론방' tab to switch content
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on the 'FAQ' tab to verify content loads correctly and no UI glitches occur
-        frame = context.pages[-1]
-        # Click on the 'FAQ' tab to switch content
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/button[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Validate Speech-to-Text triggering in Auto Mode in Sales Lab tab
-        frame = context.pages[-1]
-        # Click on 'Sales Lab' tab to test Speech-to-Text triggering in Auto Mode
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to AI 튜터 (Chatbot) tab to verify Markdown rendering and UI stability
-        frame = context.pages[-1]
-        # Click on AI 튜터 (Chatbot) tab to verify Markdown rendering and UI stability
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on the first chatbot message button 'OLED vs QNED 차이점' to verify Markdown rendering and UI stability
-        frame = context.pages[-1]
-        # Click on 'OLED vs QNED 차이점' chatbot message button to verify Markdown rendering and UI stability
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on the '가격 저항 극복 팁' chatbot message button to verify Markdown rendering and UI stability
-        frame = context.pages[-1]
-        # Click on '가격 저항 극복 팁' chatbot message button to verify Markdown rendering and UI stability
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[2]/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Study Room Tab Content Loaded Successfully').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test plan failed: Tabbed navigation in Study Room did not switch correctly or content did not load without errors as expected.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await expect(frame.locator('text=Study Room Tab Content Loaded Successfully').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test plan failed: Tabbed navigation in Study Room did not switch correctly or content did not load without errors as expected.")
+
+
+async def run_test():
+    await runner.run_standalone(run_case)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,89 +1,49 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, waits
+
+async def run_case(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the app has rendered and settled
+    await waits.goto(page, "http://localhost:5173")
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on Sales Lab navigation link to enter Sales Lab Setup
+    frame = context.pages[-1]
+    # Click on Sales Lab navigation link
+    elem = locators.on(frame)("nav.sales_lab")
+    await waits.click(page, elem)
+
+
+    # -> Clear or input invalid data in required fields to trigger validation errors
+    frame = context.pages[-1]
+    # Select size 55" to clear or reset for invalid input
+    elem = locators.on(frame)("setup.size", size=55)
+    await waits.click(page, elem)
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on Sales Lab navigation link to enter Sales Lab Setup
-        frame = context.pages[-1]
-        # Click on Sales Lab navigation link
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Clear or input invalid data in required fields to trigger validation errors
-        frame = context.pages[-1]
-        # Select size 55" to clear or reset for invalid input
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div[4]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    frame = context.pages[-1]
+    # Select size 65" to simulate invalid or empty input by toggling selection
+    elem = locators.on(frame)("setup.size", size=65)
+    await waits.click(page, elem)
 
-        frame = context.pages[-1]
-        # Select size 65" to simulate invalid or empty input by toggling selection
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div[4]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        frame = context.pages[-1]
-        # Click Start Simulation button to attempt to proceed to next step with invalid data
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    frame = context.pages[-1]
+    # Click Start Simulation button to attempt to proceed to next step with invalid data
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect(frame.locator('text=Start Simulation').first).to_be_visible(timeout=30000)
+
+
+async def run_test():
+    await runner.run_standalone(run_case)
+
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Start Simulation').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
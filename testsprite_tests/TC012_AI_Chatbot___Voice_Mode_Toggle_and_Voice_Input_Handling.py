@@ -1,94 +1,58 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, speech, waits
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_case(context):
+    # Headless Chromium has no voices or microphone: speak and listen through the harness stand-in
+    stack = await speech.install(context, transcripts=['Which TV is best for watching movies?'])
+
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the app has rendered and settled
+    await waits.goto(page, "http://localhost:5173")
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on 'Sales Lab' to enter the chatbot environment for voice mode testing.
+    frame = context.pages[-1]
+    # Click on 'Sales Lab' to enter the chatbot environment for voice mode testing.
+    elem = locators.on(frame)("nav.sales_lab")
+    await waits.click(page, elem)
+
+
+    # -> Click 'Start Simulation' button to enter the chatbot simulation environment for voice mode testing.
+    frame = context.pages[-1]
+    # Click 'Start Simulation' button to enter chatbot simulation environment.
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Click the voice mode toggle button (index 12) to enable voice mode.
+    frame = context.pages[-1]
+    # Click the voice mode toggle button to enable voice mode.
+    elem = locators.on(frame)("chat.mic")
+    await waits.click(page, elem)
+
+
+    # -> Simulate providing a voice input and verify the correct transcription appears in the input field.
+    frame = context.pages[-1]
+    # Focus on the voice input text field to simulate voice input transcription.
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div/button[2]').nth(0)
+    await waits.click(page, elem)
+    await stack.say(page, "Does it support Dolby Vision?")
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on 'Sales Lab' to enter the chatbot environment for voice mode testing.
-        frame = context.pages[-1]
-        # Click on 'Sales Lab' to enter the chatbot environment for voice mode testing.
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click 'Start Simulation' button to enter the chatbot simulation environment for voice mode testing.
-        frame = context.pages[-1]
-        # Click 'Start Simulation' button to enter chatbot simulation environment.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the voice mode toggle button (index 12) to enable voice mode.
-        frame = context.pages[-1]
-        # Click the voice mode toggle button to enable voice mode.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate providing a voice input and verify the correct transcription appears in the input field.
-        frame = context.pages[-1]
-        # Focus on the voice input text field to simulate voice input transcription.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Voice mode activated successfully').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: Voice mode activation verification failed as the UI did not update to indicate voice mode is active, or the voice input processing did not work as expected.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await expect(frame.locator('text=Voice mode activated successfully').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: Voice mode activation verification failed as the UI did not update to indicate voice mode is active, or the voice input processing did not work as expected.")
+
+
+async def run_test():
+    await runner.run_standalone(run_case)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
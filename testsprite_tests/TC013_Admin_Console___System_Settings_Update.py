@@ -1,115 +1,59 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, state, waits
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_case(context):
+    # Start from a seeded app (built once, see harness/state.py), directly on system settings
+    page = await state.restore(context, "app_ready")
+    await waits.goto(page, "http://localhost:5173/admin/settings")
+
+
+    # -> Change the Active Model setting from 'Gemini 2.0 Flash' to 'Gemini 2.0 Pro'.
+    frame = context.pages[-1]
+    # Select 'Gemini 2.0 Pro' as the Active Model to modify system setting.
+    elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[2]/div[2]/div/div[2]').nth(0)
+    await waits.click(page, elem)
+
+
+    # -> Retry clicking the 'Save Changes' button with index 13 to persist the updated system setting.
+    frame = context.pages[-1]
+    # Retry clicking the 'Save Changes' button to save the modified Active Model setting.
+    elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div/button').nth(0)
+    await waits.click(page, elem)
+
+
+    # -> Navigate to Sales Lab to verify the updated setting is reflected and platform behavior is consistent.
+    frame = context.pages[-1]
+    # Click on Sales Lab Rules in the left navigation menu to verify updated settings in Sales Lab.
+    elem = locators.on(frame)("admin.nav", section="sales-lab")
+    await waits.click(page, elem)
+
+
+    # -> Navigate to Chatbot module to verify if the updated Active Model setting affects AI responses, Speech-to-Text triggering, and Markdown rendering.
+    frame = context.pages[-1]
+    # Click on Customer Engine (Chatbot) to verify updated settings in Chatbot module.
+    elem = locators.on(frame)("admin.nav", section="customer")
+    await waits.click(page, elem)
+
+
+    # -> Test Speech-to-Text triggering in Auto Mode within Chatbot to ensure it remains robust.
+    frame = context.pages[-1]
+    # Click on Difficulty tab to access Speech-to-Text triggering settings and test Auto Mode.
+    elem = frame.locator('xpath=html/body/div/div/main/div/div/button[3]').nth(0)
+    await waits.click(page, elem)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on Admin Console to access system settings.
-        frame = context.pages[-1]
-        # Click on Admin Console link to navigate to system settings.
-        elem = frame.locator('xpath=html/body/div/div/aside/div[2]/button/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on Settings in the left navigation menu to open system settings.
-        frame = context.pages[-1]
-        # Click on Settings to open system settings page.
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[8]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Change the Active Model setting from 'Gemini 2.0 Flash' to 'Gemini 2.0 Pro'.
-        frame = context.pages[-1]
-        # Select 'Gemini 2.0 Pro' as the Active Model to modify system setting.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div[2]/div[2]/div/div[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Retry clicking the 'Save Changes' button with index 13 to persist the updated system setting.
-        frame = context.pages[-1]
-        # Retry clicking the 'Save Changes' button to save the modified Active Model setting.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to Sales Lab to verify the updated setting is reflected and platform behavior is consistent.
-        frame = context.pages[-1]
-        # Click on Sales Lab Rules in the left navigation menu to verify updated settings in Sales Lab.
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to Chatbot module to verify if the updated Active Model setting affects AI responses, Speech-to-Text triggering, and Markdown rendering.
-        frame = context.pages[-1]
-        # Click on Customer Engine (Chatbot) to verify updated settings in Chatbot module.
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Test Speech-to-Text triggering in Auto Mode within Chatbot to ensure it remains robust.
-        frame = context.pages[-1]
-        # Click on Difficulty tab to access Speech-to-Text triggering settings and test Auto Mode.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=System Settings Updated Successfully').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test case failed: The admin was unable to update system settings or the changes were not persisted and reflected across the platform as required by the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await expect(frame.locator('text=System Settings Updated Successfully').first).to_be_visible(timeout=1000)
+    except AssertionError:
+        raise AssertionError("Test case failed: The admin was unable to update system settings or the changes were not persisted and reflected across the platform as required by the test plan.")
+
+
+async def run_test():
+    await runner.run_standalone(run_case)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,179 +1,139 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, waits
+
+async def run_case(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the app has rendered and settled
+    await waits.goto(page, "http://localhost:5173")
+
+    # Interact with the page elements to simulate user flow
+    # -> Click on the Sales Lab section to start a chat session
+    frame = context.pages[-1]
+    # Click on Sales Lab navigation link to enter Sales Lab chat session
+    elem = locators.on(frame)("nav.sales_lab")
+    await waits.click(page, elem)
+
+
+    # -> Click the 'Start Simulation' button to begin the Sales Lab chat session
+    frame = context.pages[-1]
+    # Click the 'Start Simulation' button to start the Sales Lab chat session
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Send the first nonsensical input to the chat input box and submit it
+    frame = context.pages[-1]
+    # Input nonsensical text into the chat input box
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, 'asdfghjkl!@#')
+
+
+    frame = context.pages[-1]
+    # Click send button to submit the nonsensical input
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    # -> Locate and activate the chat input box or restart the Sales Lab chat session to regain chat input functionality
+    frame = context.pages[-1]
+    # Click on Sales Lab navigation link to ensure we are in the Sales Lab section
+    elem = locators.on(frame)("nav.sales_lab")
+    await waits.click(page, elem)
+
+
+    frame = context.pages[-1]
+    # Click the 'Start Simulation' button to start or restart the Sales Lab chat session
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Send the second nonsensical input '!@#$%^&*()_+' to the chat input box and submit it
+    frame = context.pages[-1]
+    # Input second nonsensical text into the chat input box
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, '!@#$%^&*()_+')
+
+
+    frame = context.pages[-1]
+    # Click send button to submit the second nonsensical input
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    # -> Click the 'Start Simulation' button to activate the Sales Lab chat session and chat input box
+    frame = context.pages[-1]
+    # Click the 'Start Simulation' button to activate the Sales Lab chat session
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Send the second nonsensical input 'qwertyuiop12345' to the chat input box and submit it
+    frame = context.pages[-1]
+    # Input second nonsensical text into the chat input box
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, 'qwertyuiop12345')
+
+
+    frame = context.pages[-1]
+    # Click send button to submit the second nonsensical input
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    # -> Send two more varied nonsensical or out-of-context inputs to further test AI response consistency and system stability.
+    frame = context.pages[-1]
+    # Input fourth nonsensical text into the chat input box
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, '12345qwerty')
+
+
+    frame = context.pages[-1]
+    # Click send button to submit the fourth nonsensical input
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    # -> Click the 'Start Simulation' button to restart the Sales Lab chat session and regain chat input functionality
+    frame = context.pages[-1]
+    # Click the 'Start Simulation' button to restart the Sales Lab chat session
+    elem = locators.on(frame)("setup.start")
+    await waits.click(page, elem)
+
+
+    # -> Send the fifth nonsensical input 'xyz123!@#' to the chat input box and submit it
+    frame = context.pages[-1]
+    # Input fifth nonsensical text into the chat input box
+    elem = locators.on(frame)("chat.input")
+    await waits.fill(page, elem, 'xyz123!@#')
+
+
+    frame = context.pages[-1]
+    # Click send button to submit the fifth nonsensical input
+    elem = locators.on(frame)("chat.send")
+    await waits.click(page, elem)
+
+
+    # -> Click the '대화 종료 및 평가하기' (End Conversation and Evaluate) button to gracefully end the session and verify no crashes or freezes occur.
+    frame = context.pages[-1]
+    # Click the '대화 종료 및 평가하기' (End Conversation and Evaluate) button to end the Sales Lab chat session
+    elem = locators.on(frame)("chat.end_session")
+    await waits.click(page, elem)
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect(frame.locator('text=Sales Lab').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=실전 고객 응대 시뮬레이션').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Start Simulation').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=대화 종료 및 평가하기').first).to_be_visible(timeout=30000)
+
 
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Click on the Sales Lab section to start a chat session
-        frame = context.pages[-1]
-        # Click on Sales Lab navigation link to enter Sales Lab chat session
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the 'Start Simulation' button to begin the Sales Lab chat session
-        frame = context.pages[-1]
-        # Click the 'Start Simulation' button to start the Sales Lab chat session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Send the first nonsensical input to the chat input box and submit it
-        frame = context.pages[-1]
-        # Input nonsensical text into the chat input box
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('asdfghjkl!@#')
-        
-
-        frame = context.pages[-1]
-        # Click send button to submit the nonsensical input
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Locate and activate the chat input box or restart the Sales Lab chat session to regain chat input functionality
-        frame = context.pages[-1]
-        # Click on Sales Lab navigation link to ensure we are in the Sales Lab section
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click the 'Start Simulation' button to start or restart the Sales Lab chat session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Send the second nonsensical input '!@#$%^&*()_+' to the chat input box and submit it
-        frame = context.pages[-1]
-        # Input second nonsensical text into the chat input box
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('!@#$%^&*()_+')
-        
-
-        frame = context.pages[-1]
-        # Click send button to submit the second nonsensical input
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the 'Start Simulation' button to activate the Sales Lab chat session and chat input box
-        frame = context.pages[-1]
-        # Click the 'Start Simulation' button to activate the Sales Lab chat session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Send the second nonsensical input 'qwertyuiop12345' to the chat input box and submit it
-        frame = context.pages[-1]
-        # Input second nonsensical text into the chat input box
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('qwertyuiop12345')
-        
-
-        frame = context.pages[-1]
-        # Click send button to submit the second nonsensical input
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Send two more varied nonsensical or out-of-context inputs to further test AI response consistency and system stability.
-        frame = context.pages[-1]
-        # Input fourth nonsensical text into the chat input box
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('12345qwerty')
-        
-
-        frame = context.pages[-1]
-        # Click send button to submit the fourth nonsensical input
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the 'Start Simulation' button to restart the Sales Lab chat session and regain chat input functionality
-        frame = context.pages[-1]
-        # Click the 'Start Simulation' button to restart the Sales Lab chat session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Send the fifth nonsensical input 'xyz123!@#' to the chat input box and submit it
-        frame = context.pages[-1]
-        # Input fifth nonsensical text into the chat input box
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('xyz123!@#')
-        
-
-        frame = context.pages[-1]
-        # Click send button to submit the fifth nonsensical input
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click the '대화 종료 및 평가하기' (End Conversation and Evaluate) button to gracefully end the session and verify no crashes or freezes occur.
-        frame = context.pages[-1]
-        # Click the '대화 종료 및 평가하기' (End Conversation and Evaluate) button to end the Sales Lab chat session
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[3]/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Sales Lab').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=실전 고객 응대 시뮬레이션').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Start Simulation').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=대화 종료 및 평가하기').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+    await runner.run_standalone(run_case)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,226 +1,47 @@
 import asyncio
-from playwright import async_api
 from playwright.async_api import expect
+from harness import locators, runner, state, waits
+
+async def run_case(context):
+    # Start from the persisted state the UI flow used to rebuild (saved Sales Lab session,
+    # operator DB in IndexedDB), restored in a fresh context; see harness/state.py
+    page = await state.restore(context, "sales_lab_saved_session")
+
+    # -> The saved roleplay survived the reload: Sales Lab offers to resume it
+    await waits.goto(page, 'http://localhost:5173/sales-lab')
+    await expect(locators.on(page)("setup.resume")).to_be_visible()
+
+    # -> Open the application on Admin Console settings and verify the platform state is intact.
+    await waits.goto(page, 'http://localhost:5173/admin/settings')
+
+
+    # --> Assertions to verify final state
+    frame = context.pages[-1]
+    await expect(frame.locator('text=Sales Lab').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=AI Configuration').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Settings').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Dashboard').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Product Catalog').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Customer Engine').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Sales Lab Rules').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Gamification').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Content (CMS)').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Analytics').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Exit Console').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Configure global settings for the platform.').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Save Changes').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Gemini API Key').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Check Quota').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Recommended: Use a secured API key with restricted scope.').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Gemini 2.0 Flash').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Fast, cost-effective. Best for quick roleplay interactions.').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=Gemini 2.0 Pro').first).to_be_visible(timeout=30000)
+    await expect(frame.locator('text=High reasoning capability. Best for complex feedback analysis.').first).to_be_visible(timeout=30000)
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
-        try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
-        except async_api.Error:
-            pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # -> Navigate to Sales Lab to perform actions that modify global and user state.
-        frame = context.pages[-1]
-        # Click on Sales Lab navigation link to enter Sales Lab section for state modification actions
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Modify user state by selecting different product options and customer profile traits.
-        frame = context.pages[-1]
-        # Select LG OLED evo C5 product to modify product selection state
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div[3]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Select 65 inch size to modify product size state
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div/div/div[2]/div/div/div[4]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Select Female gender in customer profile to modify user profile state
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div[2]/div/div[2]/div/div/div[3]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Select Quick-decider trait in customer profile to modify user traits state
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div[2]/div/div[2]/div/div/div[4]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Retry modifying user state by selecting Female gender and Quick-decider trait again, then verify changes.
-        frame = context.pages[-1]
-        # Select Female gender to modify user profile state
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div[2]/div/div[2]/div/div/div[3]/div[2]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Scroll to Female gender button and retry clicking Female gender and Quick-decider trait buttons to modify user state.
-        frame = context.pages[-1]
-        # Click Female gender button to modify user profile state
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div[2]/div/div[2]/div/div/div[3]/div[2]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click Quick-decider trait button to modify user traits state
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/div[2]/div/div[2]/div/div/div[4]/div[3]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Close and reopen the application to verify if the modified user state persists correctly across sessions.
-        await page.goto('about:blank', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.goto('http://localhost:5173/sales-lab', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Perform additional actions that modify global and user state such as adjusting chat messages or other settings, then verify persistence again.
-        frame = context.pages[-1]
-        # Click 'Randomize Customer' button to modify user state with new random customer profile
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # -> Close and reopen the application to verify if the randomized customer profile state persists correctly across sessions.
-        await page.goto('about:blank', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        await page.goto('http://localhost:5173/sales-lab', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Navigate to Chatbot section to perform actions that modify chat messages and verify state persistence.
-        frame = context.pages[-1]
-        # Click on AI 튜터 (Chatbot) navigation link to access Chatbot for modifying chat messages
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input a chat message and send it to modify user state, then verify the message appears in the chat history.
-        frame = context.pages[-1]
-        # Input a chat message in the chatbot input area
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Hello, can you explain the difference between OLED and QNED?')
-        
-
-        frame = context.pages[-1]
-        # Click send button to send the chat message
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Retry sending a different chat message to AI Tutor to check if the error persists or try clearing chat and sending again.
-        frame = context.pages[-1]
-        # Click 'Clear Chat' button to clear the chat history
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Retry clicking the Clear Chat button after scrolling to it or try sending a new chat message without clearing chat first.
-        frame = context.pages[-1]
-        # Retry clicking Clear Chat button to clear chat history
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Input a new chat message in the chatbot input area
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Can you provide tips to overcome price resistance?')
-        
-
-        frame = context.pages[-1]
-        # Click send button to send the new chat message
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/div[3]/div/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Navigate to Admin Console to verify mock API calls return success and UI changes persist.
-        frame = context.pages[-1]
-        # Click on Admin Console navigation link to access Admin Console for mock API call verification
-        elem = frame.locator('xpath=html/body/div/div/aside/div[2]/button/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Retry clicking Admin Console navigation link after scrolling to it or try alternative navigation to Admin Console.
-        frame = context.pages[-1]
-        # Retry clicking Admin Console navigation link to access Admin Console for mock API call verification
-        elem = frame.locator('xpath=html/body/div/div/aside/div[2]/button/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+async def run_test():
+    await runner.run_standalone(run_case)
 
-        # -> Click on Settings to modify settings and verify persistence of changes.
-        frame = context.pages[-1]
-        # Click on Settings navigation link to access settings for modification and persistence verification
-        elem = frame.locator('xpath=html/body/div/div/aside/nav/a[8]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # --> Assertions to verify final state
-        frame = context.pages[-1]
-        await expect(frame.locator('text=Sales Lab').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=AI Configuration').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Settings').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Dashboard').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Product Catalog').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Customer Engine').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Sales Lab Rules').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Gamification').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Content (CMS)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Analytics').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Exit Console').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Configure global settings for the platform.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Save Changes').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Gemini API Key').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Check Quota').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Recommended: Use a secured API key with restricted scope.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Gemini 2.0 Flash').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Fast, cost-effective. Best for quick roleplay interactions.').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Gemini 2.0 Pro').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=High reasoning capability. Best for complex feedback analysis.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_test())
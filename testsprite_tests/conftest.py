@@ -0,0 +1,125 @@
+"""pytest integration for the TC scripts.
+
+    cd testsprite_tests
+    python -m pytest -m smoke                        # navigation and admin cases
+    python -m pytest -m full --browsers 2            # everything
+    python -m pytest -k TC004 --gemini-fixtures replay --replay-speed 0
+
+The Playwright driver and the browser pool start once per session
+(``tc_pool``); each test gets a fresh context through ``runner.CaseSession``
+(``tc_session``), so ``--perf``, ``--gemini-fixtures`` and ``--speech`` work as
+they do in the runner. Async tests run on one session event loop driven by
+``pytest_pyfunc_call``, so no asyncio plugin is needed. The terminal summary
+lists the one-off startup cost and each case's setup, call and teardown time.
+"""
+import asyncio
+import inspect
+import time
+
+import pytest
+
+from harness.perf import PERF_MODES
+from harness.replay import FIXTURE_MODES
+from harness import state
+from harness.runner import DEFAULT_LATENCY, LATENCY_PROFILES, BrowserPool, CaseSession, state_context_opener
+
+try:
+    import playwright  # noqa: F401
+except ImportError:  # nothing to drive the browser with; leave the pure harness modules importable
+    collect_ignore = ["test_tc.py"]
+
+_startup = {}
+_timings = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("tc", "TC scripts")
+    group.addoption("--headed", action="store_true", help="show the browser windows")
+    group.addoption("--browsers", type=int, default=1, help="browsers in the session pool")
+    group.addoption("--latency", choices=LATENCY_PROFILES, default=DEFAULT_LATENCY,
+                    help="mock Operator API latency profile for the app under test")
+    group.addoption("--perf", choices=PERF_MODES, help="record Web Vitals and Gemini timings per case")
+    group.addoption("--gemini-fixtures", choices=FIXTURE_MODES, help="record or replay Gemini streams")
+    group.addoption("--replay-speed", type=float, default=1.0, help="scale of the recorded chunk timing")
+    group.addoption("--speech", action="store_true", help="install the speech stand-in in every case")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "smoke: quick navigation and admin cases without Gemini traffic")
+    config.addinivalue_line("markers", "full: every TC case")
+
+
+@pytest.fixture(scope="session")
+def tc_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def tc_pool(request, tc_loop):
+    from playwright.async_api import async_playwright
+
+    options = request.config.option
+    started = time.perf_counter()
+    pw = tc_loop.run_until_complete(async_playwright().start())
+    pool = tc_loop.run_until_complete(
+        BrowserPool(pw, options.browsers, not options.headed, options.latency).start())
+    _startup["seconds"] = time.perf_counter() - started
+    state.context_opener = state_context_opener(pool, options.gemini_fixtures, options.replay_speed)
+    yield pool
+    tc_loop.run_until_complete(pool.close())
+    tc_loop.run_until_complete(pw.stop())
+
+
+@pytest.fixture
+def tc_session(request, tc_pool, tc_loop):
+    """An opened ``CaseSession`` for the test's ``case`` parameter; closed after the test."""
+    options = request.config.option
+    case = request.node.callspec.params["case"]
+    session = CaseSession(case, tc_pool, len(_timings) % tc_pool.size, options.perf,
+                          options.gemini_fixtures, options.replay_speed, options.speech)
+    try:
+        tc_loop.run_until_complete(session.open())
+        yield session
+    finally:
+        summary, tape_summary = tc_loop.run_until_complete(session.close())
+        if summary:
+            request.node.user_properties.append(("perf", summary))
+        if tape_summary:
+            request.node.user_properties.append(("geminiFixtures", tape_summary))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    loop = pyfuncitem.funcargs["tc_loop"]
+    kwargs = {name: pyfuncitem.funcargs[name] for name in inspect.signature(pyfuncitem.obj).parameters}
+    loop.run_until_complete(pyfuncitem.obj(**kwargs))
+    return True
+
+
+def pytest_runtest_logreport(report):
+    if "test_tc.py::" not in report.nodeid:
+        return
+    entry = _timings.setdefault(report.nodeid, {"setup": 0.0, "call": 0.0, "teardown": 0.0, "outcome": ""})
+    entry[report.when] = report.duration
+    if report.when == "call" or report.failed or report.skipped:
+        entry["outcome"] = entry["outcome"] or report.outcome
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _timings:
+        return
+    write = terminalreporter.write_line
+    terminalreporter.write_sep("-", "TC timings")
+    if "seconds" in _startup:
+        write(f"driver + browser startup (once): {_startup['seconds']:.2f}s, included in the first setup")
+    write(f"{'case':<10}{'outcome':<9}{'setup':>8}{'call':>9}{'teardown':>10}")
+    rows = sorted(_timings.items(), key=lambda item: -sum(v for k, v in item[1].items() if k != "outcome"))
+    for nodeid, t in rows:
+        write(f"{nodeid.rsplit('[', 1)[-1].rstrip(']'):<10}{t['outcome']:<9}"
+              f"{t['setup']:>8.2f}{t['call']:>9.2f}{t['teardown']:>10.2f}")
+    total = sum(t["setup"] + t["call"] + t["teardown"] for t in _timings.values())
+    write(f"{len(_timings)} case(s), {total:.2f}s in total")
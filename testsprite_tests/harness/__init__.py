@@ -0,0 +1 @@
+"""Local tooling for running the TestSprite-generated TC scripts."""
@@ -0,0 +1,428 @@
+"""Offline stand-in for the Gemini REST API.
+
+Serves ``generateContent`` and ``streamGenerateContent?alt=sse`` the way
+``@google/generative-ai`` expects them, with scripted replies chosen from the
+request itself: the roleplay system prompt (persona name, tone, traits,
+language), the AI Tutor instruction, or the JSON task prompts used by
+``analyzeInteraction``, ``generateFeedback``, ``generateCourse`` and
+``generateDailyMission``. Replies are deterministic for a given conversation.
+
+Point the app at it with ``VITE_GEMINI_BASE_URL`` (any non-empty
+``VITE_GEMINI_API_KEY`` works), then:
+
+    cd testsprite_tests
+    python -m harness.gemini_stub --port 8787 --latency-ms 50 --chunk-interval-ms 10
+
+Latency and chunk cadence can also be set with ``GEMINI_STUB_LATENCY_MS``,
+``GEMINI_STUB_CHUNK_CHARS`` and ``GEMINI_STUB_CHUNK_INTERVAL_MS``. With
+``--max-in-flight`` (``GEMINI_STUB_MAX_IN_FLIGHT``) requests beyond that many
+concurrent ones are rejected with the API's 429 ``RESOURCE_EXHAUSTED`` error,
+like a quota-limited key.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+ROUTE = re.compile(r"^/(v1\w*)/models/([^:/]+):(generateContent|streamGenerateContent|countTokens)$")
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "*",
+    "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
+}
+REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found", 429: "Too Many Requests"}
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+@dataclass
+class StubConfig:
+    host: str = "127.0.0.1"
+    port: int = field(default_factory=lambda: _env_int("GEMINI_STUB_PORT", 8787))
+    latency_ms: int = field(default_factory=lambda: _env_int("GEMINI_STUB_LATENCY_MS", 150))
+    chunk_chars: int = field(default_factory=lambda: _env_int("GEMINI_STUB_CHUNK_CHARS", 12))
+    chunk_interval_ms: int = field(default_factory=lambda: _env_int("GEMINI_STUB_CHUNK_INTERVAL_MS", 30))
+    max_in_flight: int = field(default_factory=lambda: _env_int("GEMINI_STUB_MAX_IN_FLIGHT", 0))
+
+
+# --- Scripted replies -------------------------------------------------------
+
+ROLEPLAY = {
+    "en": {
+        "opening": "Hi there. I'm {name}. I'm just looking around for a new TV for the living room.",
+        "turns": [
+            "We mostly watch movies in the evening, and the room gets a lot of light during the day.",
+            "{concern}",
+            "Okay, that sounds interesting. How does it compare to the cheaper models next to it?",
+            "I see. And what about the warranty if something goes wrong?",
+            "Alright, I'm starting to like this one. What would delivery look like?",
+        ],
+        "concerns": {
+            "price": "Honestly, the price is what worries me. Is there any promotion running right now?",
+            "tech": "What processor does it use, and does it support 120Hz for gaming?",
+            "game": "I play a lot of console games. What's the input lag like?",
+            "design": "It has to look good on the wall. Can it be mounted flush?",
+            "default": "I'm not sure which size I need. The sofa is about three meters away.",
+        },
+        "closing": "Sounds good, I'll take it. Thanks for your help, goodbye!",
+        "hesitant": "Hmm... ",
+    },
+    "ko": {
+        "opening": "안녕하세요. 저는 {name}입니다. 거실에 둘 새 TV를 좀 보러 왔어요.",
+        "turns": [
+            "주로 저녁에 영화를 보는데, 낮에는 거실이 꽤 밝아요.",
+            "{concern}",
+            "오, 괜찮네요. 옆에 있는 저렴한 모델이랑 비교하면 어때요?",
+            "그렇군요. 고장 나면 보증은 어떻게 되나요?",
+            "점점 마음에 드네요. 배송은 어떻게 진행되나요?",
+        ],
+        "concerns": {
+            "price": "솔직히 가격이 제일 걱정이에요. 지금 진행 중인 프로모션이 있나요?",
+            "tech": "프로세서는 뭘 쓰고, 게임용으로 120Hz 지원되나요?",
+            "game": "콘솔 게임을 많이 하는데 입력 지연은 어떤가요?",
+            "design": "벽에 걸었을 때 예뻐야 해요. 벽에 딱 붙게 설치되나요?",
+            "default": "어떤 사이즈가 맞을지 모르겠어요. 소파에서 3미터 정도 떨어져 있어요.",
+        },
+        "closing": "좋습니다, 이걸로 할게요. 도와주셔서 감사합니다, 안녕히 계세요!",
+        "hesitant": "음... ",
+    },
+}
+
+CLOSING_CUES = ("goodbye", "bye", "buy", "purchase", "take it", "deal", "checkout", "안녕", "구매", "결제", "계약")
+
+TUTOR = {
+    "oled": ("### 📌 OLED vs QNED\n"
+             "**OLED** lights every pixel on its own for perfect black; **QNED** adds Quantum Dot and NanoCell to a backlight.\n\n"
+             "### 🔧 Quick Tips\n"
+             "- Dark rooms and movies: **OLED**\n"
+             "- Bright rooms and sports: **QNED**\n\n"
+             "| | OLED | QNED |\n|---|---|---|\n| Black level | Perfect | Very good |\n| Peak brightness | High | Very high |\n",
+             "OLED gives perfect blacks for movies, QNED is brighter for sunny rooms and sports."),
+    "price": ("### 📌 Handling Price Objections\n"
+              "1. **Acknowledge** the investment.\n"
+              "2. **Reframe** around value: panel warranty, energy savings.\n"
+              "3. **Break it down** into cost per day.\n",
+              "Acknowledge the price, then talk about long-term value and daily cost."),
+    "closing": ("### 📌 Closing Techniques\n"
+                "- **Alternative close**: \"Tuesday or Saturday delivery?\"\n"
+                "- **Assumptive close**: \"I'll get the paperwork ready.\"\n",
+                "Offer two delivery dates or assume the sale to move to a decision."),
+    "fallback": ("### 📌 Core Summary\n"
+                 "Ask open questions first, then match one feature to one need.\n\n"
+                 "### 🔧 Quick Tips\n"
+                 "- Listen before pitching\n"
+                 "- Tie every feature to a benefit\n"
+                 "- Confirm before you close\n",
+                 "Ask open questions, tie each feature to a benefit, and confirm before closing."),
+}
+
+STAGE_CUES = [
+    ("closing", ("buy", "delivery", "payment", "deal", "order", "구매", "배송", "결제")),
+    ("objection", ("price", "expensive", "discount", "but ", "worry", "비싸", "가격", "걱정")),
+    ("proposal", ("recommend", "feature", "oled", "qned", "warranty", "추천", "기능", "보증")),
+    ("needs", ("?", "what", "how", "looking for", "어떤", "무엇", "찾으")),
+]
+
+
+def _text_of(content):
+    return "".join(part.get("text", "") for part in (content or {}).get("parts", []))
+
+
+def _language(system_text, user_text):
+    if "Speak ONLY in Korean" in system_text or "한국어로" in user_text:
+        return "ko"
+    return "en"
+
+
+def roleplay_reply(system_text, contents):
+    def field_of(label):
+        match = re.search(rf"- {label}: (.*)", system_text)
+        return match.group(1).strip() if match else ""
+
+    script = ROLEPLAY[_language(system_text, "")]
+    user_turns = [_text_of(c) for c in contents if c.get("role") == "user"]
+    last = user_turns[-1].lower() if user_turns else ""
+
+    if len(user_turns) <= 1:
+        return script["opening"].format(name=field_of("Name") or "a customer")
+    if any(cue in last for cue in CLOSING_CUES):
+        return script["closing"]
+
+    traits = field_of("Visible Traits").lower()
+    concern_key = next((k for k in ("price", "tech", "game", "design") if k in traits), "default")
+    line = script["turns"][(len(user_turns) - 2) % len(script["turns"])]
+    line = line.format(concern=script["concerns"][concern_key])
+
+    level = re.search(r"\(Level (\d+)\)", system_text)
+    skeptical = "skeptic" in field_of("Tone").lower() or (level and int(level.group(1)) >= 4)
+    return script["hesitant"] + line if skeptical else line
+
+
+def tutor_reply(user_text):
+    lower = user_text.lower()
+    key = "fallback"
+    if "oled" in lower or "qned" in lower:
+        key = "oled"
+    elif any(w in lower for w in ("price", "expensive", "cost", "비싸")):
+        key = "price"
+    elif any(w in lower for w in ("close", "closing", "마무리")):
+        key = "closing"
+    screen, speech = TUTOR[key]
+    return f"{screen}\n---SPEECH---\n{speech}"
+
+
+def analysis_reply(prompt):
+    history = prompt.split("**Conversation History:**", 1)[-1].split("**Task:**", 1)[0]
+    lines = [l.strip() for l in history.strip().splitlines() if l.strip()]
+    last = next((l for l in reversed(lines) if l.lower().startswith("user:")), "").lower()
+    step = next((stage for stage, cues in STAGE_CUES if any(c in last for c in cues)), "greeting")
+
+    traits = re.search(r"Customer Traits: (\[.*\])", prompt)
+    trait_ids = [t.get("id") for t in json.loads(traits.group(1))] if traits else []
+    discovered = trait_ids[0] if step == "needs" and len(lines) >= 4 and trait_ids else None
+    objection = step == "objection"
+    return json.dumps({
+        "nextStep": step,
+        "discoveredTrait": discovered,
+        "objectionDetected": objection,
+        "objectionHint": "Acknowledge the concern, then restate the value." if objection else None,
+    })
+
+
+def feedback_reply(prompt):
+    turns = prompt.count("Salesperson:")
+    score = min(95, 55 + 5 * turns)
+    subjects = ["Product Knowledge", "Objection Handling", "Empathy", "Policy", "Conversation"]
+    return json.dumps({
+        "totalScore": score,
+        "rank": "Top 10%" if score >= 90 else "Top 25%" if score >= 80 else "Top 50%" if score >= 65 else "Needs Practice",
+        "summary": f"Stand-in feedback for a {turns}-turn session.",
+        "pros": ["Kept the conversation going", "Asked about the customer's needs"],
+        "improvements": ["Summarise the benefits before closing"],
+        "practiceSentence": "How would this fit the way you watch TV at home?",
+        "recommendedMission": {"title": "Closing Practice", "xp": 50, "type": "Roleplay"},
+        "scores": [{"subject": s, "A": max(0, score - 3 * i)} for i, s in enumerate(subjects)],
+    }, ensure_ascii=False)
+
+
+def course_reply(prompt):
+    topic = re.search(r"\*\*Topic:\*\* (.*)", prompt)
+    topic = topic.group(1).strip() if topic else "Product Basics"
+    return json.dumps({
+        "course": {
+            "id": "generated_stub",
+            "title": topic,
+            "category": "Generated",
+            "level": "Intermediate",
+            "duration": "10 min",
+            "modules": [
+                {"id": "m1", "title": f"{topic}: Overview",
+                 "content": [{"type": "text", "heading": "Overview", "body": f"What to know about {topic}."}]},
+                {"id": "m2", "title": "Selling Points",
+                 "content": [{"type": "list", "heading": "Key Points", "items": ["Picture quality", "Warranty"]}]},
+            ],
+        },
+        "quiz": [{
+            "id": 1,
+            "question": {"en": f"What is the focus of {topic}?", "ko": f"{topic}의 핵심은?"},
+            "options": [
+                {"id": k, "text": {"en": t, "ko": t}, "correct": k == "a"}
+                for k, t in (("a", "Customer value"), ("b", "Shelf layout"), ("c", "Stock count"), ("d", "Store hours"))
+            ],
+        }],
+        "faq": [{"category": "Product", "question": {"en": f"Why {topic}?", "ko": f"왜 {topic}인가요?"},
+                 "answer": {"en": "It matches common customer needs.", "ko": "고객 니즈에 잘 맞습니다."}}],
+    }, ensure_ascii=False)
+
+
+def mission_reply():
+    return json.dumps({"title": "Daily Warmup", "description": "Complete 1 Roleplay Session",
+                       "target": 1, "reward": "Starter Badge", "type": "roleplay"})
+
+
+def scripted_reply(body):
+    """Pick the reply text for a ``generateContent`` request body."""
+    system_text = _text_of(body.get("systemInstruction"))
+    contents = body.get("contents", [])
+    prompt = _text_of(contents[-1]) if contents else ""
+
+    if "playing the role of a customer" in system_text:
+        return roleplay_reply(system_text, contents)
+    if "---SPEECH---" in system_text:
+        return tutor_reply(prompt)
+    if "Analyze the following sales conversation" in prompt:
+        return analysis_reply(prompt)
+    if '"totalScore"' in prompt:
+        return feedback_reply(prompt)
+    if "instructional designer" in prompt:
+        return course_reply(prompt)
+    if "daily mission" in prompt:
+        return mission_reply()
+    return "OK"
+
+
+def _usage(body, text):
+    prompt_chars = len(json.dumps(body.get("contents", []), ensure_ascii=False))
+    prompt_tokens, reply_tokens = prompt_chars // 4, len(text) // 4
+    return {"promptTokenCount": prompt_tokens, "candidatesTokenCount": reply_tokens,
+            "totalTokenCount": prompt_tokens + reply_tokens}
+
+
+def _candidate(text, finished):
+    candidate = {"content": {"role": "model", "parts": [{"text": text}]}, "index": 0}
+    if finished:
+        candidate["finishReason"] = "STOP"
+    return candidate
+
+
+# --- HTTP plumbing ----------------------------------------------------------
+
+class GeminiStub:
+    """Minimal asyncio HTTP server speaking the Gemini ``models/*`` endpoints."""
+
+    def __init__(self, config=None, reply=scripted_reply):
+        self.config = config or StubConfig()
+        self.reply = reply
+        self.stats = Counter()
+        self.in_flight = 0
+        self._server = None
+
+    @property
+    def base_url(self):
+        return f"http://{self.config.host}:{self.config.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.config.host, self.config.port)
+        if self.config.port == 0:
+            self.config.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader, writer):
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = request_line.split(" ", 2)
+            headers = {k.strip().lower(): v.strip() for k, _, v in
+                       (line.partition(":") for line in header_lines if line)}
+            length = int(headers.get("content-length", 0))
+            raw = await reader.readexactly(length) if length else b""
+            await self._dispatch(method, urlsplit(target), raw, writer)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, url, raw, writer):
+        if method == "OPTIONS":
+            return await self._respond(writer, 204, b"")
+        if method == "GET" and url.path == "/healthz":
+            return await self._respond(writer, 200, b"ok", "text/plain")
+
+        route = ROUTE.match(url.path)
+        if method != "POST" or not route:
+            return await self._respond_json(writer, 404, {"error": {"code": 404, "message": "Not found"}})
+        _, model, task = route.groups()
+        self.stats[task] += 1
+        try:
+            body = json.loads(raw or b"{}")
+        except json.JSONDecodeError:
+            return await self._respond_json(writer, 400, {"error": {"code": 400, "message": "Invalid JSON"}})
+
+        if task == "countTokens":
+            return await self._respond_json(writer, 200, {"totalTokens": _usage(body, "")["promptTokenCount"]})
+
+        if self.config.max_in_flight and self.in_flight >= self.config.max_in_flight:
+            self.stats["rejected"] += 1
+            return await self._respond_json(writer, 429, {"error": {
+                "code": 429, "message": "Resource has been exhausted (e.g. check quota).", "status": "RESOURCE_EXHAUSTED",
+            }})
+        self.in_flight += 1
+        try:
+            text = self.reply(body)
+            await asyncio.sleep(self.config.latency_ms / 1000)
+            if task == "generateContent":
+                return await self._respond_json(writer, 200, {
+                    "candidates": [_candidate(text, True)], "usageMetadata": _usage(body, text), "modelVersion": model,
+                })
+            await self._stream(writer, body, text, model)
+        finally:
+            self.in_flight -= 1
+
+    async def _stream(self, writer, body, text, model):
+        writer.write(self._head(200, "text/event-stream", None))
+        size = max(1, self.config.chunk_chars)
+        pieces = [text[i:i + size] for i in range(0, len(text), size)] or [""]
+        for i, piece in enumerate(pieces):
+            last = i == len(pieces) - 1
+            event = {"candidates": [_candidate(piece, last)], "modelVersion": model}
+            if last:
+                event["usageMetadata"] = _usage(body, text)
+            writer.write(b"data: " + json.dumps(event, ensure_ascii=False).encode() + b"\r\n\r\n")
+            await writer.drain()
+            if not last:
+                await asyncio.sleep(self.config.chunk_interval_ms / 1000)
+
+    def _head(self, status, content_type, length):
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", "Connection: close"]
+        lines += [f"{k}: {v}" for k, v in CORS_HEADERS.items()]
+        if content_type:
+            lines.append(f"Content-Type: {content_type}")
+        if length is not None:
+            lines.append(f"Content-Length: {length}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _respond(self, writer, status, payload, content_type=None):
+        writer.write(self._head(status, content_type, len(payload)) + payload)
+        await writer.drain()
+
+    async def _respond_json(self, writer, status, data):
+        await self._respond(writer, status, json.dumps(data, ensure_ascii=False).encode(), "application/json")
+
+
+def main(argv=None):
+    defaults = StubConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default=defaults.host)
+    parser.add_argument("--port", type=int, default=defaults.port)
+    parser.add_argument("--latency-ms", type=int, default=defaults.latency_ms, help="delay before the first byte")
+    parser.add_argument("--chunk-chars", type=int, default=defaults.chunk_chars, help="characters per streamed chunk")
+    parser.add_argument("--chunk-interval-ms", type=int, default=defaults.chunk_interval_ms, help="gap between chunks")
+    parser.add_argument("--max-in-flight", type=int, default=defaults.max_in_flight,
+                        help="answer 429 beyond this many concurrent requests (0: unlimited)")
+    args = parser.parse_args(argv)
+
+    stub = GeminiStub(StubConfig(args.host, args.port, args.latency_ms, args.chunk_chars, args.chunk_interval_ms,
+                                 args.max_in_flight))
+    print(f"Gemini stand-in listening on {stub.base_url}  (VITE_GEMINI_BASE_URL={stub.base_url})", flush=True)
+    try:
+        asyncio.run(stub.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+"""Benchmark history for the TC suite.
+
+``runner_results.json`` only describes the last run. This module appends every
+run to a SQLite history (``tmp/history.sqlite3``) -- per-case wall time plus
+the ``--perf`` summary metrics -- and compares the newest run with a rolling
+baseline of the previous passing runs:
+
+* baseline median and p95 per case and metric, each with a bootstrap 95%
+  confidence interval;
+* delta of the newest sample against the baseline median;
+* a regression flag when the sample is more than ``--threshold`` above the
+  baseline median *and* above the upper bound of the median's interval, so
+  noise within the baseline's own spread is not reported.
+
+    python -m harness.runner --perf vitals --history     # run, then record
+    python -m harness.history record tmp/runner_results.json --label my-branch
+    python -m harness.history report --window 20 --threshold 0.10
+
+``report`` writes ``tmp/report.md`` and ``tmp/report.html`` and exits 1 with
+``--fail-on-regression`` when anything regressed.
+"""
+import argparse
+import datetime
+import html
+import json
+import pathlib
+import random
+import sqlite3
+import subprocess
+import time
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+DB_PATH = TESTS_DIR / "tmp" / "history.sqlite3"
+REPORT_DIR = TESTS_DIR / "tmp"
+
+# Lower is better for all of them; counts (requests, interactions) are not tracked
+METRICS = ("durationMs", "lcpMs", "inpMs", "longTaskMs", "blockingMs",
+           "geminiTtfbP50Ms", "geminiP50Ms", "geminiP95Ms", "ttfsP50Ms", "ttfsMaxMs")
+
+DEFAULT_WINDOW = 20
+DEFAULT_THRESHOLD = 0.10
+MIN_BASELINE = 5
+BOOTSTRAP_ROUNDS = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at REAL NOT NULL,
+    label TEXT,
+    git_rev TEXT,
+    meta TEXT
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    case_id TEXT NOT NULL,
+    title TEXT,
+    status TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_series ON samples (case_id, metric, run_id);
+"""
+
+
+def connect(path=DB_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def git_rev():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, timeout=5, cwd=TESTS_DIR).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def record(db, results, label=None, meta=None):
+    """Append one run (the entries of a ``runner_results.json``); returns its run id."""
+    with db:
+        run_id = db.execute(
+            "INSERT INTO runs (recorded_at, label, git_rev, meta) VALUES (?, ?, ?, ?)",
+            (time.time(), label, git_rev(), json.dumps(meta or {})),
+        ).lastrowid
+        rows = []
+        for entry in results:
+            values = {"durationMs": entry.get("durationMs"), **(entry.get("perf") or {})}
+            for metric in METRICS:
+                if isinstance(values.get(metric), (int, float)):
+                    rows.append((run_id, entry["caseId"], entry.get("title"), entry["testStatus"],
+                                 metric, float(values[metric])))
+        db.executemany("INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?)", rows)
+    return run_id
+
+
+# --- Statistics ------------------------------------------------------------
+
+def quantile(values, q):
+    """Linear-interpolated quantile of a non-empty list."""
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def bootstrap_ci(values, q, rounds=BOOTSTRAP_ROUNDS, confidence=0.95, seed=0):
+    """Percentile-bootstrap interval for the ``q`` quantile of ``values``."""
+    rng = random.Random(seed)
+    estimates = sorted(
+        quantile([rng.choice(values) for _ in values], q) for _ in range(rounds)
+    )
+    tail = (1 - confidence) / 2
+    return quantile(estimates, tail), quantile(estimates, 1 - tail)
+
+
+def compare(db, run_id=None, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD, min_baseline=MIN_BASELINE):
+    """Rows comparing ``run_id`` (default: the newest run) with the previous ``window`` passing runs."""
+    if run_id is None:
+        row = db.execute("SELECT MAX(id) FROM runs").fetchone()
+        run_id = row[0]
+    if run_id is None:
+        return None, []
+    current = db.execute(
+        "SELECT case_id, title, status, metric, value FROM samples WHERE run_id = ? ORDER BY case_id, metric",
+        (run_id,),
+    ).fetchall()
+    rows = []
+    for case_id, title, status, metric, value in current:
+        baseline = [v for (v,) in db.execute(
+            "SELECT value FROM samples WHERE case_id = ? AND metric = ? AND status = 'PASSED' AND run_id < ? "
+            "ORDER BY run_id DESC LIMIT ?",
+            (case_id, metric, run_id, window),
+        )]
+        row = {"case": case_id, "title": title, "status": status, "metric": metric,
+               "value": value, "n": len(baseline), "verdict": "new"}
+        if len(baseline) >= min_baseline:
+            median, p95 = quantile(baseline, 0.5), quantile(baseline, 0.95)
+            median_ci, p95_ci = bootstrap_ci(baseline, 0.5), bootstrap_ci(baseline, 0.95)
+            delta = (value - median) / median if median else 0.0
+            if status != "PASSED":
+                verdict = "failed"
+            elif delta > threshold and value > median_ci[1]:
+                verdict = "regression"
+            elif delta < -threshold and value < median_ci[0]:
+                verdict = "improvement"
+            else:
+                verdict = "ok"
+            row.update(median=median, median_ci=median_ci, p95=p95, p95_ci=p95_ci,
+                       delta=delta, verdict=verdict)
+        elif status != "PASSED":
+            row["verdict"] = "failed"
+        rows.append(row)
+    return run_id, rows
+
+
+# --- Reports ---------------------------------------------------------------
+
+def _num(value):
+    return "-" if value is None else f"{value:,.0f}" if abs(value) >= 100 else f"{value:.1f}"
+
+
+def _ci(bounds):
+    return "-" if not bounds else f"{_num(bounds[0])}–{_num(bounds[1])}"
+
+
+def _columns(row):
+    return [
+        row["case"], row["metric"], _num(row["value"]),
+        _num(row.get("median")), _ci(row.get("median_ci")),
+        _num(row.get("p95")), _ci(row.get("p95_ci")),
+        "-" if "delta" not in row else f"{row['delta']:+.1%}",
+        str(row["n"]), row["verdict"],
+    ]
+
+
+HEADERS = ["case", "metric", "this run", "median", "median 95% CI", "p95", "p95 95% CI", "Δ vs median", "n", "verdict"]
+
+
+def _run_line(db, run_id):
+    recorded_at, label, rev = db.execute(
+        "SELECT recorded_at, label, git_rev FROM runs WHERE id = ?", (run_id,)).fetchone()
+    when = datetime.datetime.fromtimestamp(recorded_at).strftime("%Y-%m-%d %H:%M")
+    return f"run #{run_id} · {when} · {rev or 'unknown rev'}" + (f" · {label}" if label else "")
+
+
+def markdown_report(db, run_id, rows, window, threshold):
+    flagged = [r for r in rows if r["verdict"] in ("regression", "failed")]
+    lines = [
+        "# TC benchmark report",
+        "",
+        f"{_run_line(db, run_id)} — baseline: previous {window} passing runs, threshold {threshold:.0%}",
+        "",
+        f"**{sum(r['verdict'] == 'regression' for r in rows)} regression(s)**, "
+        f"{sum(r['verdict'] == 'improvement' for r in rows)} improvement(s), "
+        f"{sum(r['verdict'] == 'failed' for r in rows)} failed sample(s), "
+        f"{sum(r['verdict'] == 'new' for r in rows)} without enough baseline.",
+        "",
+    ]
+    for title, subset in (("Flagged", flagged), ("All metrics", rows)):
+        if not subset:
+            continue
+        lines += [f"## {title}", "", "| " + " | ".join(HEADERS) + " |", "|" + "---|" * len(HEADERS)]
+        lines += ["| " + " | ".join(_columns(r)) + " |" for r in subset]
+        lines.append("")
+    return "\n".join(lines)
+
+
+VERDICT_COLORS = {"regression": "#fde2e1", "failed": "#fde2e1", "improvement": "#e3f6e5"}
+
+
+def html_report(db, run_id, rows, window, threshold):
+    body_rows = "\n".join(
+        f'<tr style="background:{VERDICT_COLORS.get(r["verdict"], "transparent")}">'
+        + "".join(f"<td>{html.escape(c)}</td>" for c in _columns(r)) + "</tr>"
+        for r in rows
+    )
+    regressions = sum(r["verdict"] == "regression" for r in rows)
+    return f"""<!doctype html>
+<html><head><meta charset="utf-8"><title>TC benchmark report</title>
+<style>
+body {{ font: 14px system-ui, sans-serif; margin: 2rem; color: #222; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 4px 10px; border-bottom: 1px solid #ddd; text-align: right; }}
+th:nth-child(-n+2), td:nth-child(-n+2) {{ text-align: left; }}
+</style></head><body>
+<h1>TC benchmark report</h1>
+<p>{html.escape(_run_line(db, run_id))} — baseline: previous {window} passing runs, threshold {threshold:.0%}</p>
+<p><strong>{regressions} regression(s)</strong></p>
+<table><thead><tr>{"".join(f"<th>{html.escape(h)}</th>" for h in HEADERS)}</tr></thead>
+<tbody>
+{body_rows}
+</tbody></table>
+</body></html>
+"""
+
+
+def write_reports(db, run_id, rows, window, threshold, out_dir=REPORT_DIR):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "report.md").write_text(markdown_report(db, run_id, rows, window, threshold))
+    (out_dir / "report.html").write_text(html_report(db, run_id, rows, window, threshold))
+    return out_dir / "report.md", out_dir / "report.html"
+
+
+# --- CLI -------------------------------------------------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=pathlib.Path, default=DB_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rec = commands.add_parser("record", help="append a runner_results.json to the history")
+    rec.add_argument("results", type=pathlib.Path, nargs="?", default=TESTS_DIR / "tmp" / "runner_results.json")
+    rec.add_argument("--label", help="free-form tag for the run, e.g. a branch name")
+
+    rep = commands.add_parser("report", help="compare a run with its rolling baseline")
+    rep.add_argument("--run", type=int, help="run id (default: newest)")
+    rep.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="baseline size in passing runs")
+    rep.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                     help="relative slowdown over the baseline median that counts as a regression")
+    rep.add_argument("--min-baseline", type=int, default=MIN_BASELINE)
+    rep.add_argument("-o", "--out-dir", type=pathlib.Path, default=REPORT_DIR)
+    rep.add_argument("--fail-on-regression", action="store_true")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    db = connect(args.db)
+    if args.command == "record":
+        run_id = record(db, json.loads(args.results.read_text()), args.label)
+        print(f"recorded run #{run_id} in {args.db}")
+        return 0
+    run_id, rows = compare(db, args.run, args.window, args.threshold, args.min_baseline)
+    if run_id is None:
+        print("history is empty; record a run first")
+        return 1
+    md, page = write_reports(db, run_id, rows, args.window, args.threshold, args.out_dir)
+    regressions = [r for r in rows if r["verdict"] == "regression"]
+    for r in regressions:
+        print(f"REGRESSION {r['case']} {r['metric']}: {_num(r['value'])} vs median {_num(r['median'])} "
+              f"({r['delta']:+.1%})")
+    print(f"{len(regressions)} regression(s); report: {md} / {page}")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
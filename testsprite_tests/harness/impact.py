@@ -0,0 +1,329 @@
+"""Test-impact selection: run only the TC cases a change can affect.
+
+Every case maps to the set of app modules it exercises, from two sources:
+
+* static -- the routes a case reaches (its ``goto`` URLs, the ``locators``
+  names it clicks and the ``state`` snapshots it restores), resolved through
+  the ``<Route>`` tree in ``src/App.jsx`` to their element and layout modules,
+  plus the app shell, each closed over the ``import`` graph of ``src/``
+  (static, re-exports and ``import()``);
+* recorded -- the ``/src/...`` modules the Vite dev server actually served to
+  the case's context, written to ``tmp/impact_map.json`` by
+  ``python -m harness.runner --record-impact``. This also covers steps that
+  navigate by XPath, which the static pass cannot follow.
+
+A case is selected when a changed file is in the union of both sets. Changes
+to the harness, the build setup (``package.json``, ``vite.config.js``,
+``index.html``, ``.env``...) or a ``src/`` file the graph cannot place select
+the whole suite; a changed TC script selects itself; ``src/`` files no entry
+point reaches, docs and other files select nothing.
+
+    python -m harness.impact select --base origin/main     # case ids, one line
+    python -m harness.impact select src/pages/admin/QuizBuilder.jsx
+    python -m harness.impact map                           # routes and module counts per case
+    python -m harness.runner --changed-since origin/main   # run the selection
+"""
+import argparse
+import ast
+import json
+import pathlib
+import posixpath
+import re
+import subprocess
+from urllib.parse import urlsplit
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+REPO_DIR = TESTS_DIR.parent
+MAP_PATH = TESTS_DIR / "tmp" / "impact_map.json"
+ENTRY = "src/main.jsx"
+ROUTES_FILE = "src/App.jsx"
+
+SOURCE_SUFFIXES = (".js", ".jsx", ".ts", ".tsx")
+RESOLVE_SUFFIXES = ("", ".jsx", ".js", ".tsx", ".ts", ".json", ".css")
+# Outside src/, these change what every case runs against
+GLOBAL_FILES = re.compile(r"^(package(-lock)?\.json|vite\.config\.\w+|index\.html|tailwind\.config\.\w+|"
+                          r"postcss\.config\.\w+|\.env(\..*)?|public/.*|testsprite_tests/(harness/.*|conftest\.py|"
+                          r"test_tc\.py))$")
+TC_FILE = re.compile(r"^testsprite_tests/(TC\d+)_\w+\.py$")
+
+# Routes a locator name (or prefix) leads to
+LOCATOR_ROUTES = {
+    "nav.home": "/",
+    "nav.sales_lab": "/sales-lab",
+    "nav.ai_trainer": "/ai-trainer",
+    "nav.study": "/study",
+    "nav.my": "/my",
+    "nav.admin_console": "/admin",
+    "setup.": "/sales-lab",
+    "chat.": "/sales-lab",
+    "exit.": "/sales-lab",
+    "save_prompt.": "/sales-lab",
+}
+# Routes the state.py recipes walk through
+STATE_ROUTES = {
+    "app_ready": ["/", "/sales-lab"],
+    "sales_lab_saved_session": ["/", "/sales-lab"],
+    "tutor_chat_history": ["/", "/sales-lab", "/ai-trainer"],
+}
+
+_IMPORT = re.compile(r"""(?:\bimport|\bexport)\s[^'";]*?\bfrom\s*['"]([^'"]+)['"]"""
+                     r"""|\bimport\s*['"]([^'"]+)['"]"""
+                     r"""|\bimport\s*\(\s*['"]([^'"]+)['"]\s*\)""")
+_BINDINGS = re.compile(r"""\bimport\s+([^'";]+?)\s+from\s*['"]([^'"]+)['"]"""
+                       r"""|\bconst\s+(\w+)\s*=\s*(?:React\.)?lazy\w*\(\s*\(\)\s*=>\s*import\(\s*['"]([^'"]+)['"]""")
+_ATTR = re.compile(r"""(\w+)(?:=(?:"([^"]*)"|'([^']*)'|\{\s*<\s*(\w+)[^}]*\}))?""")
+
+
+# --- import graph ----------------------------------------------------------
+
+def _resolve(importer, spec):
+    if not spec.startswith("."):
+        return None  # a package
+    base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+    for candidate in [base + s for s in RESOLVE_SUFFIXES] + [f"{base}/index{s}" for s in SOURCE_SUFFIXES]:
+        if (REPO_DIR / candidate).is_file():
+            return candidate
+    return None
+
+
+def import_graph():
+    """``{module: set(imported modules)}`` for every source file under ``src/``."""
+    graph = {}
+    for path in sorted((REPO_DIR / "src").rglob("*")):
+        if path.suffix not in SOURCE_SUFFIXES or not path.is_file():
+            continue
+        module = path.relative_to(REPO_DIR).as_posix()
+        edges = set()
+        for match in _IMPORT.finditer(path.read_text(encoding="utf-8", errors="replace")):
+            target = _resolve(module, next(g for g in match.groups() if g))
+            if target:
+                edges.add(target)
+        graph[module] = edges
+    return graph
+
+
+def closure(graph, roots, skip=frozenset()):
+    """Modules reachable from ``roots``, not following edges out of ``skip``."""
+    seen, stack = set(), list(roots)
+    while stack:
+        module = stack.pop()
+        if module in seen:
+            continue
+        seen.add(module)
+        if module not in skip:
+            stack.extend(graph.get(module, ()))
+    return seen
+
+
+# --- routes ----------------------------------------------------------------
+
+def _component_modules(source):
+    """``{local name: module}`` for the imports (and ``lazy()``/``lazyRoute()`` imports) of ``App.jsx``."""
+    names = {}
+    for match in _BINDINGS.finditer(source):
+        clause, spec, lazy_name, lazy_spec = match.groups()
+        if lazy_name:
+            names[lazy_name] = _resolve(ROUTES_FILE, lazy_spec)
+            continue
+        module = _resolve(ROUTES_FILE, spec)
+        for name in re.findall(r"\w+(?:\s+as\s+\w+)?", clause.replace("{", " ").replace("}", " ")):
+            names[name.split()[-1]] = module
+    return names
+
+
+def _route_tags(source):
+    """``(attributes, kind)`` for each ``<Route>`` tag; kind is open, close or self."""
+    for match in re.finditer(r"<Route\b|</Route\s*>", source):
+        if match.group().startswith("</"):
+            yield None, "close"
+            continue
+        depth, i = 0, match.end()
+        while i < len(source):
+            ch = source[i]
+            depth += ch == "{"
+            depth -= ch == "}"
+            if ch == ">" and depth == 0:
+                break
+            i += 1
+        body = source[match.end():i]
+        yield body, "self" if body.rstrip().endswith("/") else "open"
+
+
+def routes():
+    """``{route path: [modules of its element and enclosing layouts]}`` from ``App.jsx``."""
+    source = (REPO_DIR / ROUTES_FILE).read_text(encoding="utf-8")
+    components = _component_modules(source)
+    table, stack = {}, []
+    for body, kind in _route_tags(source):
+        if kind == "close":
+            stack.pop()
+            continue
+        attrs = {}
+        for name, dq, sq, element in _ATTR.findall(body):
+            attrs[name] = element or dq or sq or True
+        parent_path, parent_modules = stack[-1] if stack else ("", [])
+        path = attrs.get("path")
+        if isinstance(path, str):
+            full = path if path.startswith("/") else f"{parent_path.rstrip('/')}/{path}"
+        else:
+            full = parent_path or "/"
+        module = components.get(attrs.get("element")) if isinstance(attrs.get("element"), str) else None
+        modules = parent_modules + ([module] if module else [])
+        if attrs.get("index") is True or kind == "self":
+            table.setdefault(full, modules)
+        if kind == "open":
+            stack.append((full, modules))
+    return table
+
+
+def match_route(table, path):
+    """The route modules serving ``path`` (``:param`` segments match anything, ``*`` is the fallback)."""
+    path = "/" + path.strip("/")
+    fallback = []
+    for pattern, modules in table.items():
+        if pattern.endswith("*"):
+            fallback = modules
+            continue
+        regex = "^" + re.sub(r":\w+", "[^/]+", re.escape(pattern.rstrip("/") or "/").replace("\\:", ":")) + "/?$"
+        if re.match(regex, path):
+            return modules
+    return fallback
+
+
+# --- cases -----------------------------------------------------------------
+
+def case_routes(path):
+    """Routes a TC script reaches, from its source."""
+    found = {"/"}
+    for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+        if not isinstance(node, ast.Call):
+            continue
+        func, args = node.func, node.args
+        strings = [a.value for a in args if isinstance(a, ast.Constant) and isinstance(a.value, str)]
+        name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", "")
+        if name == "goto" and strings and "://" in strings[0]:
+            found.add(urlsplit(strings[0]).path or "/")
+        elif name == "restore" and strings:
+            found.update(STATE_ROUTES.get(strings[0], []))
+        elif isinstance(func, ast.Call) and getattr(func.func, "attr", "") == "on" and strings:
+            locator = strings[0]
+            params = {k.arg: k.value.value for k in node.keywords if isinstance(k.value, ast.Constant)}
+            if locator in ("admin.nav", "admin.mobile_nav") and "section" in params:
+                section = params["section"]
+                found.add("/admin" if section == "dashboard" else f"/admin/{section}")
+            for prefix, route in LOCATOR_ROUTES.items():
+                if locator == prefix or (prefix.endswith(".") and locator.startswith(prefix)):
+                    found.add(route)
+    return sorted(found)
+
+
+def static_map(cases):
+    """``{caseId: {"routes": [...], "modules": set}}`` from the route tree and import graph."""
+    graph = import_graph()
+    table = routes()
+    route_modules = {m for modules in table.values() for m in modules}
+    shell = closure(graph, [ENTRY], skip={ROUTES_FILE}) | {ROUTES_FILE}
+    shell |= closure(graph, graph.get(ROUTES_FILE, set()) - route_modules)
+    result = {}
+    for case in cases:
+        reached = case_routes(case.path)
+        roots = {m for r in reached for m in match_route(table, r)}
+        result[case.case_id] = {"routes": reached, "modules": shell | closure(graph, roots)}
+    return result
+
+
+def recorded_map(path=MAP_PATH):
+    return {k: set(v) for k, v in json.loads(path.read_text()).items()} if path.exists() else {}
+
+
+def update_recorded_map(modules_by_case, path=MAP_PATH):
+    """Merge ``{caseId: modules}`` from a ``--record-impact`` run into ``tmp/impact_map.json``."""
+    current = recorded_map(path)
+    current.update({k: set(v) for k, v in modules_by_case.items() if v})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({k: sorted(v) for k, v in sorted(current.items())}, indent=1))
+
+
+def served_module(url):
+    """``src/...`` for a Vite dev server module URL, else None."""
+    path = urlsplit(url).path
+    return path.lstrip("/") if path.startswith("/src/") else None
+
+
+# --- selection -------------------------------------------------------------
+
+def changed_files(base):
+    """Files changed between ``base`` and the working tree (committed, staged and unstaged)."""
+    out = subprocess.run(["git", "diff", "--name-only", base], cwd=REPO_DIR,
+                         capture_output=True, text=True, check=True).stdout
+    untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"], cwd=REPO_DIR,
+                               capture_output=True, text=True, check=True).stdout
+    return sorted(set(out.split("\n") + untracked.split("\n")) - {""})
+
+
+def select(cases, files):
+    """``(selected case ids or None for the full suite, {file: reason})``."""
+    files = [pathlib.PurePosixPath(f).as_posix() for f in files]
+    ids = {c.case_id for c in cases}
+    static = static_map(cases)
+    recorded = recorded_map()
+    modules = {cid: static[cid]["modules"] | recorded.get(cid, set()) for cid in ids}
+    reachable = closure(import_graph(), [ENTRY])
+    selected, reasons = set(), {}
+    for f in files:
+        tc = TC_FILE.match(f)
+        if GLOBAL_FILES.match(f):
+            reasons[f] = "affects every case"
+            return None, reasons
+        if tc:
+            hit = {tc.group(1)} & ids
+        elif f.startswith("src/"):
+            hit = {cid for cid, mods in modules.items() if f in mods}
+            if not hit and f in reachable:
+                reasons[f] = "reachable but not mapped to a case"
+                return None, reasons
+            if not hit and not (REPO_DIR / f).exists():
+                reasons[f] = "deleted; importers are part of the change"
+        else:
+            hit = set()
+        reasons.setdefault(f, ", ".join(sorted(hit)) or "no case")
+        selected |= hit
+    return sorted(selected), reasons
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    pick = commands.add_parser("select", help="print the cases affected by a change")
+    pick.add_argument("files", nargs="*", help="changed files (default: git diff against --base)")
+    pick.add_argument("--base", default="HEAD", help="git ref to diff against")
+    pick.add_argument("--pattern", action="store_true", help="print a -k regex instead of ids")
+    pick.add_argument("-v", "--verbose", action="store_true", help="explain each file")
+    commands.add_parser("map", help="print the routes and module count per case")
+    return parser
+
+
+def main(argv=None):
+    from harness.runner import discover
+
+    args = build_parser().parse_args(argv)
+    cases = discover()
+    if args.command == "map":
+        static, recorded = static_map(cases), recorded_map()
+        for case in cases:
+            entry = static[case.case_id]
+            extra = f", {len(recorded[case.case_id])} recorded" if case.case_id in recorded else ""
+            print(f"{case.case_id}  {len(entry['modules']):4d} modules{extra}  {' '.join(entry['routes'])}")
+        return 0
+
+    selected, reasons = select(cases, args.files or changed_files(args.base))
+    if args.verbose:
+        for f, reason in reasons.items():
+            print(f"  {f}: {reason}")
+    ids = [c.case_id for c in cases] if selected is None else selected
+    print("|".join(ids) if args.pattern else " ".join(ids))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,367 @@
+"""Synthetic multi-trainee load for the Sales Lab roleplay pipeline.
+
+Every virtual trainee loops over the roleplay session of a TC scenario:
+``startRoleplay`` (opening line), then per turn ``sendMessageStream`` with
+``analyzeInteraction`` in parallel (as ``SalesLabChat`` schedules them), then
+``generateFeedback``. The trainee's lines come from the ``waits.fill`` steps of
+the template case (TC001 by default), padded with a scripted sales flow up to
+``--turns``.
+
+Two drivers:
+
+* ``http`` (default) -- lightweight sessions sending the app's Gemini requests
+  directly (same endpoints, system instruction, chat history and prompt
+  markers), so hundreds of trainees fit in one process;
+* ``browser`` -- runs the template case itself in pooled browser contexts
+  against the dev server (start it with ``VITE_GEMINI_BASE_URL`` pointing at
+  the stand-in); stages are told apart from the request bodies.
+
+Concurrency ramps through ``--stages``; each stage keeps that many trainees
+busy for ``--stage-seconds`` and reports throughput, per-stage latency
+percentiles and error/429 rates:
+
+    python -m harness.load --stages 10,50,100,200 --stage-seconds 30
+    python -m harness.load --max-in-flight 64          # make the stand-in rate limit
+    python -m harness.load --driver browser --stages 2,4,8 --case TC003
+
+Without ``--base-url`` the Gemini stand-in (``harness.gemini_stub``) is started
+in-process. Results are also written to ``tmp/load_results.json``.
+"""
+import argparse
+import ast
+import asyncio
+import json
+import pathlib
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from harness.gemini_stub import GeminiStub, StubConfig
+from harness.perf import percentile
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+RESULTS_PATH = TESTS_DIR / "tmp" / "load_results.json"
+MODEL = "gemini-2.0-flash"
+API_KEY = "load-test"
+
+STAGES = ("start", "turn", "analysis", "feedback")
+
+# Continues the template's own lines through the sales stages
+SCRIPTED_TURNS = [
+    "What will you mostly use the TV for, and how bright is the room?",
+    "For bright rooms I'd recommend the OLED evo, its brightness booster handles daylight well.",
+    "I understand the price is a concern. There's a trade-in promotion this month.",
+    "The panel warranty also covers you for five years.",
+    "Shall I arrange delivery for Saturday? We can handle payment at the counter.",
+]
+
+ROLEPLAY_SYSTEM = """You are a professional actor playing the role of a customer in a sales roleplay scenario.
+
+**Your Character (Persona):**
+- Name: {name}
+- Age: 35
+- Gender: Male
+- Tone: Neutral
+- Description: A customer interested in buying a TV.
+
+**Traits:**
+- Visible Traits: price, quick-decider
+
+**Difficulty Level: Beginner (Level 1)**
+
+**Your Instructions:**
+1.  **Language:** Speak ONLY in English.
+2.  **Format:** Write ONLY the dialogue.
+"""
+
+ANALYSIS_PROMPT = """Analyze the following sales conversation between a Salesperson (User) and a Customer (AI).
+
+**Context:**
+- Product: LG OLED evo G5
+- Customer Traits: [{{"id": "price", "label": "Price-sensitive"}}]
+- Current Language: English
+
+**Conversation History:**
+{history}
+User: {message}
+
+**Task:**
+Return a JSON object with nextStep, discoveredTrait, objectionDetected and objectionHint.
+"""
+
+FEEDBACK_PROMPT = """Analyze the following sales training roleplay conversation log.
+
+Conversation Log:
+{log}
+
+Return JSON: {{"totalScore": number, "rank": string, "summary": string, "pros": [], "improvements": [], "scores": []}}
+"""
+
+
+def scenario_from_case(path, turns):
+    """The trainee's lines: the ``waits.fill`` texts of a TC script, then ``SCRIPTED_TURNS``."""
+    lines = []
+    for node in ast.walk(ast.parse(path.read_text())):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "fill"
+                and len(node.args) >= 3 and isinstance(node.args[2], ast.Constant)):
+            lines.append(node.args[2].value)
+    lines += SCRIPTED_TURNS
+    return lines[:turns]
+
+
+def find_case(case_id):
+    matches = sorted(TESTS_DIR.glob(f"{case_id}_*.py"))
+    if not matches:
+        raise SystemExit(f"no TC script matches {case_id}")
+    return matches[0]
+
+
+def classify(body):
+    """Which pipeline stage a Gemini request body belongs to (None for other app traffic)."""
+    system_text = "".join(p.get("text", "") for p in (body.get("systemInstruction") or {}).get("parts", []))
+    prompt = "".join(p.get("text", "") for c in body.get("contents", [])[-1:] for p in c.get("parts", []))
+    if "playing the role of a customer" in system_text:
+        return "start" if len(body.get("contents", [])) <= 1 else "turn"
+    if "Analyze the following sales conversation" in prompt:
+        return "analysis"
+    if '"totalScore"' in prompt:
+        return "feedback"
+    return None
+
+
+class Metrics:
+    """Latencies and outcomes per pipeline stage, for one concurrency step."""
+
+    def __init__(self):
+        self.latency = defaultdict(list)
+        self.ttfb = defaultdict(list)
+        self.outcomes = defaultdict(lambda: defaultdict(int))
+        self.sessions = 0
+        self.failed_sessions = 0
+
+    def add(self, stage, status, total_ms, ttfb_ms=None):
+        key = "ok" if status == 200 else "429" if status == 429 else "error"
+        self.outcomes[stage][key] += 1
+        if key == "ok":
+            self.latency[stage].append(total_ms)
+            if ttfb_ms is not None:
+                self.ttfb[stage].append(ttfb_ms)
+
+    def report(self, concurrency, seconds):
+        requests = sum(sum(o.values()) for o in self.outcomes.values())
+        stages = {}
+        for stage in STAGES:
+            counts = self.outcomes.get(stage, {})
+            total = sum(counts.values())
+            lat = self.latency.get(stage, [])
+            stages[stage] = {
+                "requests": total,
+                "p50Ms": _round(percentile(lat, 0.5)),
+                "p95Ms": _round(percentile(lat, 0.95)),
+                "p99Ms": _round(percentile(lat, 0.99)),
+                "ttfbP50Ms": _round(percentile(self.ttfb.get(stage, []), 0.5)),
+                "errorRate": round(counts.get("error", 0) / total, 4) if total else 0.0,
+                "rate429": round(counts.get("429", 0) / total, 4) if total else 0.0,
+            }
+        return {
+            "concurrency": concurrency,
+            "seconds": round(seconds, 2),
+            "sessions": self.sessions,
+            "failedSessions": self.failed_sessions,
+            "sessionsPerSec": round(self.sessions / seconds, 2) if seconds else 0.0,
+            "requestsPerSec": round(requests / seconds, 2) if seconds else 0.0,
+            "stages": stages,
+        }
+
+
+def _round(value):
+    return None if value is None else round(value, 1)
+
+
+# --- HTTP driver -----------------------------------------------------------
+
+async def gemini_call(base_url, body, stream=False):
+    """POST one request; returns (status, ttfb ms, total ms, reply text)."""
+    url = urlsplit(base_url)
+    task = "streamGenerateContent" if stream else "generateContent"
+    path = f"{url.path.rstrip('/')}/v1beta/models/{MODEL}:{task}?{'alt=sse&' if stream else ''}key={API_KEY}"
+    payload = json.dumps(body).encode()
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+    try:
+        writer.write((f"POST {path} HTTP/1.1\r\nHost: {url.netloc}\r\nContent-Type: application/json\r\n"
+                      f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n").encode() + payload)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        ttfb = (time.perf_counter() - started) * 1000
+        while (await reader.readline()) not in (b"\r\n", b""):
+            pass
+        raw = (await reader.read()).decode()
+    finally:
+        writer.close()
+    total = (time.perf_counter() - started) * 1000
+    if status != 200:
+        return status, ttfb, total, ""
+    if stream:
+        events = [json.loads(line[5:]) for line in raw.splitlines() if line.startswith("data:")]
+    else:
+        events = [json.loads(raw)]
+    text = "".join(p.get("text", "") for e in events for c in e.get("candidates", [])
+                   for p in c.get("content", {}).get("parts", []))
+    return status, ttfb, total, text
+
+
+async def http_session(base_url, lines, metrics, trainee):
+    """One roleplay session issuing the app's Gemini requests in the app's order."""
+    system = {"parts": [{"text": ROLEPLAY_SYSTEM.format(name=f"Trainee {trainee} Customer")}]}
+    contents = [{"role": "user", "parts": [{"text": "Start the roleplay now with the opening line."}]}]
+
+    async def timed(stage, body, stream=False):
+        try:
+            status, ttfb, total, text = await gemini_call(base_url, body, stream)
+        except (OSError, ValueError, IndexError):
+            status, ttfb, total, text = 0, None, 0.0, ""
+        metrics.add(stage, status, total, ttfb if stream else None)
+        return text
+
+    opening = await timed("start", {"systemInstruction": system, "contents": contents})
+    contents.append({"role": "model", "parts": [{"text": opening}]})
+    transcript = [f"Customer: {opening}"]
+    for message in lines:
+        analysis = {"contents": [{"role": "user", "parts": [{"text": ANALYSIS_PROMPT.format(
+            history="\n".join(transcript[-6:]), message=message)}]}]}
+        turn = {"systemInstruction": system,
+                "contents": contents + [{"role": "user", "parts": [{"text": message}]}]}
+        reply, _ = await asyncio.gather(timed("turn", turn, stream=True), timed("analysis", analysis))
+        contents = turn["contents"] + [{"role": "model", "parts": [{"text": reply}]}]
+        transcript += [f"Salesperson: {message}", f"Customer: {reply}"]
+    await timed("feedback", {"contents": [{"role": "user", "parts": [{"text": FEEDBACK_PROMPT.format(
+        log="\n".join(transcript))}]}]})
+    metrics.sessions += 1
+
+
+# --- Browser driver --------------------------------------------------------
+
+async def browser_session(pool, slot, module, metrics):
+    """Run the template case in a fresh context, timing its Gemini requests by stage."""
+    context = await pool.new_context(slot)
+    pending = []
+
+    async def on_finished(request, failed=False):
+        if request.method != "POST":
+            return
+        try:
+            stage = classify(json.loads(request.post_data or "{}"))
+        except ValueError:
+            return
+        if stage is None:
+            return
+        timing = request.timing
+        response = None if failed else await request.response()
+        stage = "turn" if stage == "start" and "streamGenerateContent" in request.url else stage
+        metrics.add(stage, response.status if response else 0, max(0.0, timing["responseEnd"]),
+                    timing["responseStart"] if timing["responseStart"] >= 0 else None)
+
+    context.on("requestfinished", lambda r: pending.append(asyncio.ensure_future(on_finished(r))))
+    context.on("requestfailed", lambda r: pending.append(asyncio.ensure_future(on_finished(r, True))))
+    try:
+        await module.run_case(context)
+        metrics.sessions += 1
+    except Exception as exc:  # a failed session is data, not a reason to stop the load
+        metrics.failed_sessions += 1
+        print(f"[load] session failed: {type(exc).__name__}: {exc}", flush=True)
+    finally:
+        await asyncio.gather(*pending, return_exceptions=True)
+        await context.close()
+
+
+# --- Ramp ------------------------------------------------------------------
+
+async def run_stage(concurrency, seconds, session):
+    """Keep ``concurrency`` trainees looping ``session(metrics, trainee)`` for ``seconds``."""
+    metrics = Metrics()
+    deadline = time.perf_counter() + seconds
+
+    async def trainee(i):
+        while time.perf_counter() < deadline:
+            await session(metrics, i)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(trainee(i) for i in range(concurrency)))
+    return metrics.report(concurrency, time.perf_counter() - started)
+
+
+def print_stage(result):
+    print(f"\nconcurrency {result['concurrency']:>4}: {result['sessions']} sessions in {result['seconds']}s  "
+          f"({result['sessionsPerSec']} sessions/s, {result['requestsPerSec']} req/s)")
+    print(f"  {'stage':<10}{'requests':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'ttfb p50':>10}{'errors':>8}{'429':>8}")
+    for stage, s in result["stages"].items():
+        cells = [f"{'-' if s[k] is None else s[k]:>9}" for k in ("p50Ms", "p95Ms", "p99Ms")]
+        print(f"  {stage:<10}{s['requests']:>9}{''.join(cells)}{'-' if s['ttfbP50Ms'] is None else s['ttfbP50Ms']:>10}"
+              f"{s['errorRate']:>8.1%}{s['rate429']:>8.1%}")
+
+
+async def run_load(args):
+    case_path = find_case(args.case)
+    results = []
+
+    async def ramp(make_session):
+        for concurrency in args.stages:
+            result = await run_stage(concurrency, args.stage_seconds, make_session)
+            print_stage(result)
+            results.append(result)
+
+    async def with_driver(base_url):
+        if args.driver == "http":
+            lines = scenario_from_case(case_path, args.turns)
+            print(f"scenario: {case_path.stem}, {len(lines)} trainee turns per session, Gemini at {base_url}")
+            await ramp(lambda metrics, i: http_session(base_url, lines, metrics, i))
+            return
+        from playwright.async_api import async_playwright
+        from harness.runner import BrowserPool, TestCase
+        module = TestCase(args.case, case_path.stem, case_path).load()
+        print(f"scenario: {case_path.stem} in browser contexts (dev server must use VITE_GEMINI_BASE_URL={base_url})")
+        async with async_playwright() as pw:
+            pool = await BrowserPool(pw, args.browsers).start()
+            try:
+                await ramp(lambda metrics, i: browser_session(pool, i, module, metrics))
+            finally:
+                await pool.close()
+
+    if args.base_url:
+        await with_driver(args.base_url)
+    else:
+        config = StubConfig(port=args.stub_port, max_in_flight=args.max_in_flight)
+        async with GeminiStub(config) as stub:
+            await with_driver(stub.base_url)
+            print(f"\nstand-in: {dict(stub.stats)}")
+    return results
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--driver", choices=("http", "browser"), default="http")
+    parser.add_argument("--case", default="TC001", help="TC script used as the scenario template")
+    parser.add_argument("--stages", type=lambda v: [int(n) for n in v.split(",")], default=[10, 50, 100],
+                        help="comma-separated concurrency steps")
+    parser.add_argument("--stage-seconds", type=float, default=20)
+    parser.add_argument("--turns", type=int, default=5, help="trainee messages per session (http driver)")
+    parser.add_argument("--browsers", type=int, default=2, help="browser pool size (browser driver)")
+    parser.add_argument("--base-url", help="Gemini endpoint to load instead of an in-process stand-in")
+    parser.add_argument("--stub-port", type=int, default=0, help="port for the in-process stand-in (0: any)")
+    parser.add_argument("--max-in-flight", type=int, default=0,
+                        help="stand-in answers 429 beyond this many concurrent requests (0: unlimited)")
+    parser.add_argument("-o", "--output", type=pathlib.Path, default=RESULTS_PATH)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = asyncio.run(run_load(args))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps({"case": args.case, "driver": args.driver, "stages": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,120 @@
+"""Named locators for the app's ``data-testid`` hooks.
+
+The generated scripts address controls by absolute XPath
+(``html/body/div/div/main/div/div/div/div/div[3]/button``), which is slow to
+evaluate and breaks whenever a wrapper ``div`` or menu entry is added. The
+Sidebar, AdminLayout, SalesLabSetup, SalesLabChat and AIChatbot components
+expose stable ``data-testid`` attributes instead; this registry names them once:
+
+    ui = locators.on(page)
+    await waits.click(page, ui("setup.trait", id="price_sensitive"))
+    await waits.fill(page, ui("chat.input"), "Hello")
+
+``on(page)`` is cached per page and every resolved ``Locator`` is cached per
+(name, params), so repeated steps reuse the same handle. Unknown names or
+missing parameters raise immediately instead of timing out on a selector that
+can never match. ``await ui.has(name)`` checks the current DOM in one round
+trip, for steps that branch on what is shown.
+"""
+import string
+import weakref
+
+# name -> data-testid (str.format template for parameterised hooks)
+TEST_IDS = {
+    # Sidebar (src/components/layout/modern/Sidebar.jsx)
+    "nav.home": "nav-home",
+    "nav.sales_lab": "nav-sales-lab",
+    "nav.ai_trainer": "nav-ai-trainer",
+    "nav.study": "nav-study",
+    "nav.my": "nav-my",
+    "nav.admin_console": "nav-admin-console",
+    "nav.language": "language-select",
+    "nav.demo_mode": "demo-mode-toggle",
+    # AdminLayout (src/components/layout/AdminLayout.jsx); section is the path under /admin
+    "admin.nav": "admin-nav-{section}",
+    "admin.mobile_nav": "mobile-admin-nav-{section}",
+    "admin.mobile_more": "admin-mobile-more",
+    "admin.exit": "admin-exit",
+    # SalesLabSetup (src/components/sales-lab/SalesLabSetup.jsx)
+    "setup.randomize": "setup-randomize",
+    "setup.randomize_product": "setup-randomize-product",
+    "setup.history": "setup-history",
+    "setup.api_mode": "setup-api-mode",
+    "setup.load_preset": "setup-load-preset",
+    "setup.preset": "preset-{id}",
+    "setup.preset_close": "preset-close",
+    "setup.product_type": "product-type-{type}",
+    "setup.category": "product-category-{category}",
+    "setup.model": "product-model-{id}",
+    "setup.size": "product-size-{size}",
+    "setup.difficulty": "difficulty-{level}",
+    "setup.age": "age-{age}",
+    "setup.gender": "gender-{gender}",
+    "setup.trait": "trait-{id}",
+    "setup.resume": "setup-resume",
+    "setup.start": "setup-start",
+    # SalesLabChat (src/components/sales-lab/SalesLabChat.jsx)
+    "chat.exit": "chat-exit",
+    "chat.guide": "chat-guide-toggle",
+    "chat.messages": "chat-messages",
+    "chat.end_session": "chat-end-session",
+    "chat.mic": "chat-mic",
+    "chat.input": "chat-input",
+    "chat.send": "chat-send",
+    "chat.view_analysis": "chat-view-analysis",
+    "exit.save": "exit-save",
+    "exit.discard": "exit-discard",
+    "exit.cancel": "exit-cancel",
+    "save_prompt.save": "save-prompt-save",
+    "save_prompt.discard": "save-prompt-discard",
+    # AI Tutor (src/pages/AIChatbot.jsx)
+    "tutor.messages": "tutor-messages",
+    "tutor.input": "tutor-input",
+    "tutor.send": "tutor-send",
+}
+
+_PRESENT_JS = "() => Array.from(document.querySelectorAll('[data-testid]'), el => el.dataset.testid)"
+
+_registries = weakref.WeakKeyDictionary()
+
+
+def resolve_test_id(name, **params):
+    """Resolve a registry name (plus its template parameters) to a ``data-testid`` value."""
+    try:
+        template = TEST_IDS[name]
+    except KeyError:
+        raise KeyError(f"unknown locator {name!r}") from None
+    fields = {f for _, f, _, _ in string.Formatter().parse(template) if f}
+    if fields != set(params):
+        raise TypeError(f"locator {name!r} takes {sorted(fields) or 'no'} parameter(s), got {sorted(params)}")
+    return template.format(**params)
+
+
+class PageLocators:
+    """Locator cache for one page."""
+
+    def __init__(self, page):
+        self.page = page
+        self._locators = {}
+
+    def __call__(self, name, **params):
+        key = (name, tuple(sorted(params.items())))
+        locator = self._locators.get(key)
+        if locator is None:
+            locator = self._locators[key] = self.page.get_by_test_id(resolve_test_id(name, **params)).first
+        return locator
+
+    async def present(self):
+        """The set of test ids currently in the document."""
+        return set(await self.page.evaluate(_PRESENT_JS))
+
+    async def has(self, name, **params):
+        return resolve_test_id(name, **params) in await self.present()
+
+
+def on(page):
+    """The cached locator registry of ``page``."""
+    registry = _registries.get(page)
+    if registry is None:
+        registry = _registries[page] = PageLocators(page)
+    return registry
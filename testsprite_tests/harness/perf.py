@@ -0,0 +1,183 @@
+"""Per-case performance samples for the TC runner.
+
+With ``--perf vitals`` every case also records, for its whole context:
+
+* Web Vitals per document -- LCP (last ``largest-contentful-paint`` entry),
+  INP (the interaction-duration percentile web-vitals reports: the worst
+  interaction, skipping one per 50) and long tasks (count, total, max and
+  blocking time over 50 ms), collected by ``PerformanceObserver``\\s installed
+  as an init script and reported through an exposed binding;
+* Gemini request timings -- status, time to first byte and total time for
+  every ``generateContent``/``streamGenerateContent`` request, from
+  Playwright's resource timing (API keys are stripped from the URL).
+
+``--perf trace`` additionally records a Chromium performance trace per case
+(open it in DevTools > Performance or https://ui.perfetto.dev). Tracing is
+browser-wide, so the runner gives every worker its own browser in that mode.
+
+Artifacts go to ``tmp/perf/<case>.json`` (and ``<case>.trace.json``), next to
+``tmp/runner_results.json``, which carries each case's summary under ``perf``.
+"""
+import asyncio
+import json
+import pathlib
+import time
+
+from harness.waits import GEMINI_URL
+
+PERF_DIR = pathlib.Path(__file__).resolve().parent.parent / "tmp" / "perf"
+PERF_MODES = ("vitals", "trace")
+
+BINDING = "__agPerfReport"
+LONG_TASK_BLOCKING_MS = 50
+EVENT_DURATION_THRESHOLD_MS = 16
+
+VITALS_JS = """
+(() => {
+    const report = window.%(binding)s;
+    if (!report || window.__agPerfObserving) return;
+    window.__agPerfObserving = true;
+    const doc = Math.random().toString(36).slice(2);
+    const observe = (type, map, options = {}) => {
+        try {
+            new PerformanceObserver(list => {
+                report({ doc, url: location.href, type, entries: list.getEntries().map(map) }).catch(() => {});
+            }).observe({ type, buffered: true, ...options });
+        } catch (e) { /* entry type not supported */ }
+    };
+    observe('largest-contentful-paint', e => ({ t: e.startTime, size: e.size }));
+    observe('event', e => ({ id: e.interactionId, name: e.name, t: e.startTime, duration: e.duration }),
+            { durationThreshold: %(threshold)d });
+    observe('longtask', e => ({ t: e.startTime, duration: e.duration }));
+})();
+""" % {"binding": BINDING, "threshold": EVENT_DURATION_THRESHOLD_MS}
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of ``values`` (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def interaction_to_next_paint(durations):
+    """web-vitals' INP: the worst interaction, ignoring one outlier per 50 interactions."""
+    if not durations:
+        return None
+    ordered = sorted(durations, reverse=True)
+    return ordered[min(len(ordered) - 1, len(ordered) // 50)]
+
+
+class PerfRecorder:
+    """Collects Web Vitals, Gemini timings and optionally a trace for one case's context."""
+
+    def __init__(self, case_id, mode="vitals", out_dir=PERF_DIR):
+        self.case_id = case_id
+        self.mode = mode
+        self.out_dir = out_dir
+        self.documents = {}
+        self.gemini = []
+        self._pending = set()
+        self._browser = None
+        self._started = time.time()
+
+    async def attach(self, context, browser=None):
+        await context.expose_binding(BINDING, self._on_report)
+        await context.add_init_script(VITALS_JS)
+        context.on("requestfinished", lambda request: self._track(self._on_request(request)))
+        context.on("requestfailed", lambda request: self._track(self._on_request(request, failed=True)))
+        if self.mode == "trace" and browser is not None:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            await browser.start_tracing(path=str(self.trace_path), screenshots=True)
+            self._browser = browser
+
+    @property
+    def trace_path(self):
+        return self.out_dir / f"{self.case_id}.trace.json"
+
+    def _track(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _on_report(self, source, payload):
+        doc = self.documents.setdefault(payload["doc"], {
+            "url": payload["url"], "lcp": None, "interactions": {}, "longTasks": [],
+        })
+        kind, entries = payload["type"], payload["entries"]
+        if kind == "largest-contentful-paint" and entries:
+            doc["lcp"] = entries[-1]["t"]
+        elif kind == "event":
+            for entry in entries:
+                if entry["id"]:
+                    key = str(entry["id"])
+                    doc["interactions"][key] = max(doc["interactions"].get(key, 0), entry["duration"])
+        elif kind == "longtask":
+            doc["longTasks"].extend(entry["duration"] for entry in entries)
+
+    async def _on_request(self, request, failed=False):
+        if not GEMINI_URL.search(request.url):
+            return
+        timing = request.timing
+        record = {
+            "url": request.url.split("?", 1)[0],
+            "method": request.method,
+            "startedAtMs": round(timing["startTime"] - self._started * 1000) if timing["startTime"] > 0 else None,
+            "ttfbMs": round(timing["responseStart"], 1) if timing["responseStart"] >= 0 else None,
+            "totalMs": round(timing["responseEnd"], 1) if timing["responseEnd"] >= 0 else None,
+            "status": None,
+            "error": request.failure if failed else None,
+        }
+        if not failed:
+            response = await request.response()
+            record["status"] = response.status if response else None
+        self.gemini.append(record)
+
+    def summary(self):
+        lcps = [d["lcp"] for d in self.documents.values() if d["lcp"] is not None]
+        interactions = [v for d in self.documents.values() for v in d["interactions"].values()]
+        long_tasks = [t for d in self.documents.values() for t in d["longTasks"]]
+        gemini_ok = [r["totalMs"] for r in self.gemini if r["totalMs"] is not None and not r["error"]]
+        ttfb = [r["ttfbMs"] for r in self.gemini if r["ttfbMs"] is not None and not r["error"]]
+        rounded = lambda v: None if v is None else round(v, 1)
+        return {
+            "lcpMs": rounded(max(lcps) if lcps else None),
+            "inpMs": rounded(interaction_to_next_paint(interactions)),
+            "interactions": len(interactions),
+            "longTasks": len(long_tasks),
+            "longTaskMs": rounded(sum(long_tasks)),
+            "blockingMs": rounded(sum(max(0, t - LONG_TASK_BLOCKING_MS) for t in long_tasks)),
+            "geminiRequests": len(self.gemini),
+            "geminiErrors": sum(1 for r in self.gemini if r["error"] or (r["status"] or 0) >= 400),
+            "geminiTtfbP50Ms": rounded(percentile(ttfb, 0.5)),
+            "geminiP50Ms": rounded(percentile(gemini_ok, 0.5)),
+            "geminiP95Ms": rounded(percentile(gemini_ok, 0.95)),
+        }
+
+    async def finish(self):
+        """Stop tracing, write ``<case>.json`` and return the summary. Call before closing the context."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self._browser is not None:
+            await self._browser.stop_tracing()
+            self._browser = None
+        summary = self.summary()
+        documents = [{
+            "url": d["url"],
+            "lcpMs": d["lcp"],
+            "inpMs": interaction_to_next_paint(list(d["interactions"].values())),
+            "interactions": len(d["interactions"]),
+            "longTasksMs": d["longTasks"],
+        } for d in self.documents.values()]
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        artifact = {
+            "caseId": self.case_id,
+            "recordedAt": self._started,
+            "summary": summary,
+            "documents": documents,
+            "gemini": self.gemini,
+            "trace": self.trace_path.name if self.mode == "trace" else None,
+        }
+        (self.out_dir / f"{self.case_id}.json").write_text(json.dumps(artifact, indent=2))
+        return summary
@@ -0,0 +1,304 @@
+"""Record and replay Gemini traffic as HAR-like fixtures.
+
+The streamed replies behind TC002 (auto mode TTS/STT), TC004 (markdown and
+``---SPEECH---`` splitting) and TC012 (voice mode) come from the live model, so
+their runs differ from one another and depend on the network. With fixtures:
+
+    cd testsprite_tests
+    python -m harness.runner -k "TC002|TC004|TC012" --gemini-fixtures record
+    python -m harness.runner -k "TC002|TC004|TC012" --gemini-fixtures replay
+    python -m harness.runner --gemini-fixtures replay --replay-speed 0.1   # 10x faster
+
+Recording wraps ``window.fetch`` in the page: the live response still streams
+to the app unchanged, while a tee of its body reports every chunk with its
+offset from the request through an exposed binding once the stream ends; the
+fixture is saved only after every report still in flight has arrived. Each case is saved to
+``fixtures/gemini/<case>.har.json`` (HAR ``log.entries`` plus ``_key`` and
+``_chunks``; the API key is stripped from URLs).
+
+Replay is network-free. A Playwright route on the Gemini URLs answers each
+request from the fixture, matched by its normalised prompt -- model, method,
+system instruction, contents and generation config, with whitespace collapsed
+and timestamps, UUIDs and long numbers masked. ``route.fulfill`` can only
+deliver a whole body, so the route returns the recorded chunks as a tape and
+the same fetch wrapper plays them back to the app as a ``ReadableStream`` at
+the recorded offsets times ``--replay-speed`` (1 = original timing, 0 = no
+waits). Requests whose key is not recorded take the next unused entry for the
+same model and method, in recording order (a randomised persona changes the
+prompt, not the turn order); requests with nothing left to replay fail the case.
+"""
+import hashlib
+import json
+import pathlib
+import re
+import time
+from collections import defaultdict
+from urllib.parse import urlsplit, urlunsplit
+
+from harness.waits import GEMINI_URL
+
+FIXTURE_DIR = pathlib.Path(__file__).resolve().parent.parent / "fixtures" / "gemini"
+FIXTURE_MODES = ("record", "replay")
+BINDING = "__agGeminiRecord"
+# How long finish() waits for streams still being recorded
+FLUSH_TIMEOUT_MS = 15000
+
+# Recorded streams not reported yet, counted by the shim
+PENDING_JS = "() => window.__agGeminiPending || 0"
+
+SHIM_JS = """
+(() => {
+    if (window.__agGeminiShim) return;
+    window.__agGeminiShim = true;
+    const cfg = %(config)s;
+    const GEMINI = /generativelanguage\\.googleapis\\.com|:(stream)?[gG]enerateContent/;
+    const realFetch = window.fetch.bind(window);
+    const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+    const urlOf = input => typeof input === 'string' ? input : (input.url || String(input));
+
+    const replay = async (input, init) => {
+        const tape = await (await realFetch(input, init)).json();
+        const encoder = new TextEncoder();
+        const started = performance.now();
+        const body = new ReadableStream({
+            async start(controller) {
+                for (const [t, data] of tape.chunks) {
+                    const wait = t * cfg.speed - (performance.now() - started);
+                    if (wait > 0) await sleep(wait);
+                    if (init && init.signal && init.signal.aborted) {
+                        controller.error(new DOMException('The operation was aborted.', 'AbortError'));
+                        return;
+                    }
+                    controller.enqueue(encoder.encode(data));
+                }
+                controller.close();
+            },
+        });
+        return new Response(body, { status: tape.status, headers: tape.headers });
+    };
+
+    const record = async (input, init) => {
+        const started = performance.now();
+        const response = await realFetch(input, init);
+        if (!response.body) return response;
+        const [mine, theirs] = response.body.tee();
+        window.__agGeminiPending = (window.__agGeminiPending || 0) + 1;
+        (async () => {
+            const reader = mine.getReader();
+            const decoder = new TextDecoder();
+            const chunks = [];
+            for (;;) {
+                const { done, value } = await reader.read();
+                if (done) break;
+                chunks.push([Math.round(performance.now() - started), decoder.decode(value, { stream: true })]);
+            }
+            await window.%(binding)s({
+                url: urlOf(input),
+                body: init && typeof init.body === 'string' ? init.body : null,
+                status: response.status,
+                headers: Object.fromEntries(response.headers),
+                chunks,
+            });
+        })().catch(() => {}).finally(() => { window.__agGeminiPending -= 1; });
+        return new Response(theirs, { status: response.status, statusText: response.statusText, headers: response.headers });
+    };
+
+    window.fetch = (input, init) => {
+        if (!GEMINI.test(urlOf(input))) return realFetch(input, init);
+        return cfg.mode === 'replay' ? replay(input, init) : record(input, init);
+    };
+})();
+"""
+
+_VOLATILE = [
+    (re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?"), "<datetime>"),
+    (re.compile(r"\d{4}[-./]\d{1,2}[-./]\d{1,2}"), "<date>"),
+    (re.compile(r"\b\d{1,2}:\d{2}(:\d{2})?\b"), "<time>"),
+    (re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I), "<uuid>"),
+    (re.compile(r"\d{6,}"), "<n>"),
+]
+
+
+def strip_key(url):
+    """``url`` without its query string (the API key travels as ``?key=``), keeping ``alt=sse``."""
+    parts = urlsplit(url)
+    query = "alt=sse" if "alt=sse" in parts.query else ""
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def endpoint(url):
+    """``(model, method)`` of a Gemini URL, e.g. ``("gemini-2.0-flash", "streamGenerateContent")``."""
+    match = re.search(r"/models/([^:/]+):(\w+)", urlsplit(url).path)
+    return match.groups() if match else ("", urlsplit(url).path)
+
+
+def normalise_text(text):
+    text = " ".join(text.split())
+    for pattern, mask in _VOLATILE:
+        text = pattern.sub(mask, text)
+    return text
+
+
+def _parts_text(content):
+    if isinstance(content, str):
+        return normalise_text(content)
+    parts = (content or {}).get("parts", [])
+    return normalise_text(" ".join(p.get("text", "") for p in parts if isinstance(p, dict)))
+
+
+def prompt_key(url, body):
+    """Stable key of a Gemini request: hash of its endpoint and normalised prompt."""
+    try:
+        payload = json.loads(body or "{}")
+    except ValueError:
+        payload = {"raw": normalise_text(body or "")}
+    canonical = {
+        "endpoint": endpoint(url),
+        "system": _parts_text(payload.get("systemInstruction") or payload.get("system_instruction")),
+        "contents": [(c.get("role", "user"), _parts_text(c)) for c in payload.get("contents", [])],
+        "config": payload.get("generationConfig") or payload.get("generation_config") or {},
+        "raw": payload.get("raw"),
+    }
+    return hashlib.sha256(json.dumps(canonical, sort_keys=True, ensure_ascii=False).encode()).hexdigest()[:16]
+
+
+def har_entry(report):
+    """A HAR ``log.entries`` item for one recorded request."""
+    chunks = report["chunks"]
+    text = "".join(data for _, data in chunks)
+    total = chunks[-1][0] if chunks else 0
+    first = chunks[0][0] if chunks else 0
+    headers = report.get("headers") or {}
+    return {
+        "_key": prompt_key(report["url"], report.get("body")),
+        "startedDateTime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "time": total,
+        "request": {
+            "method": "POST",
+            "url": strip_key(report["url"]),
+            "postData": {"mimeType": "application/json", "text": report.get("body") or ""},
+        },
+        "response": {
+            "status": report["status"],
+            "headers": [{"name": k, "value": v} for k, v in sorted(headers.items())],
+            "content": {"size": len(text), "mimeType": headers.get("content-type", ""), "text": text},
+        },
+        "timings": {"send": 0, "wait": first, "receive": total - first},
+        "_chunks": chunks,
+    }
+
+
+class Cassette:
+    """The recorded entries of one case, handed out in recording order per key."""
+
+    def __init__(self, entries=()):
+        self.entries = list(entries)
+        self._used = set()
+        self._by_key = defaultdict(list)
+        for i, entry in enumerate(self.entries):
+            self._by_key[entry["_key"]].append(i)
+
+    @classmethod
+    def load(cls, path):
+        return cls(json.loads(path.read_text())["log"]["entries"]) if path.exists() else cls()
+
+    def save(self, path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        log = {"version": "1.2", "creator": {"name": "harness.replay", "version": "1"}, "entries": self.entries}
+        path.write_text(json.dumps({"log": log}, indent=1, ensure_ascii=False))
+
+    def take(self, url, body):
+        """The next unused entry for this request, or None; the second value tells if it matched exactly."""
+        for i in self._by_key.get(prompt_key(url, body), []):
+            if i not in self._used:
+                self._used.add(i)
+                return self.entries[i], True
+        wanted = endpoint(url)
+        for i, entry in enumerate(self.entries):
+            if i not in self._used and endpoint(entry["request"]["url"]) == wanted:
+                self._used.add(i)
+                return entry, False
+        return None, False
+
+
+class GeminiFixtures:
+    """Records or replays one case's Gemini traffic in a browser context."""
+
+    def __init__(self, case_id, mode="replay", speed=1.0, fixture_dir=FIXTURE_DIR):
+        if mode not in FIXTURE_MODES:
+            raise ValueError(f"unknown fixture mode {mode!r}")
+        self.case_id = case_id
+        self.mode = mode
+        self.speed = max(0.0, speed)
+        self.path = fixture_dir / f"{case_id}.har.json"
+        self.cassette = Cassette() if mode == "record" else Cassette.load(self.path)
+        self.exact = self.loose = 0
+        self.misses = []
+        self.context = None
+
+    @property
+    def active(self):
+        """Whether this case is affected: always when recording, only with a fixture when replaying."""
+        return self.mode == "record" or bool(self.cassette.entries)
+
+    async def attach(self, context):
+        if not self.active:
+            return
+        self.context = context
+        if self.mode == "record":
+            await context.expose_binding(BINDING, self._on_record)
+        else:
+            await context.route(GEMINI_URL, self._on_route)
+        config = json.dumps({"mode": self.mode, "speed": self.speed})
+        await context.add_init_script(SHIM_JS % {"config": config, "binding": BINDING})
+
+    def _on_record(self, source, report):
+        self.cassette.entries.append(har_entry(report))
+
+    async def _on_route(self, route, request):
+        if request.method == "OPTIONS":
+            await route.fulfill(status=204, headers={"Access-Control-Allow-Origin": "*",
+                                                     "Access-Control-Allow-Headers": "*"})
+            return
+        entry, exact = self.cassette.take(request.url, request.post_data)
+        if entry is None:
+            self.misses.append(strip_key(request.url))
+            message = {"error": {"code": 503, "status": "UNAVAILABLE",
+                                 "message": f"no recorded Gemini fixture left in {self.path.name}"}}
+            tape = {"status": 503, "headers": {"content-type": "application/json"},
+                    "chunks": [[0, json.dumps(message)]]}
+        else:
+            if exact:
+                self.exact += 1
+            else:
+                self.loose += 1
+            response = entry["response"]
+            tape = {"status": response["status"],
+                    "headers": {h["name"]: h["value"] for h in response["headers"]},
+                    "chunks": entry["_chunks"]}
+        await route.fulfill(status=200, content_type="application/json",
+                            headers={"Access-Control-Allow-Origin": "*"}, body=json.dumps(tape))
+
+    async def _drain(self):
+        """Wait until no page of the context is still recording a stream."""
+        for page in self.context.pages if self.context else ():
+            if page.is_closed():
+                continue
+            try:
+                await page.wait_for_function("() => !window.__agGeminiPending", timeout=FLUSH_TIMEOUT_MS)
+            except Exception as exc:
+                pending = 0 if page.is_closed() else await page.evaluate(PENDING_JS)
+                if pending:
+                    print(f"[fixtures] {self.case_id}: {pending} stream(s) not recorded ({type(exc).__name__})",
+                          flush=True)
+
+    async def finish(self):
+        """Save a recording; returns a summary, or None when the case was not affected."""
+        if not self.active:
+            return None
+        if self.mode == "record":
+            await self._drain()
+            self.cassette.save(self.path)
+            return {"mode": "record", "requests": len(self.cassette.entries), "fixture": self.path.name}
+        return {"mode": "replay", "speed": self.speed, "exact": self.exact, "loose": self.loose,
+                "misses": len(self.misses)}
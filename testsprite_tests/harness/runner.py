@@ -0,0 +1,414 @@
+"""Parallel runner for the TC scripts.
+
+Every TC module exposes ``run_case(context)``. Instead of paying one Playwright
+driver and one Chromium launch per script, this runner starts the driver once,
+launches a small pool of browsers, and runs ``--workers`` cases at a time, each
+in its own isolated ``BrowserContext``.
+
+    cd testsprite_tests
+    python -m harness.runner --workers 4 --browsers 2
+    python -m harness.runner -k TC00 --workers 1      # serial baseline
+    python -m harness.runner --gemini-stub            # offline, see gemini_stub.py
+    python -m harness.runner --refresh-state          # rebuild seeded state, see state.py
+    python -m harness.runner --perf vitals            # per-case perf samples, see perf.py
+    python -m harness.runner --history                # append to the benchmark history, see history.py
+    python -m harness.runner --shard 2/3              # one duration-balanced slice, see shard.py
+    python -m harness.runner --gemini-fixtures replay # recorded Gemini streams, see replay.py
+    python -m harness.runner --speech                 # TTS/STT stand-in for every case, see speech.py
+    python -m harness.runner --changed-since main     # only the cases a diff affects, see impact.py
+"""
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import json
+import pathlib
+import re
+import time
+from dataclasses import dataclass
+
+from harness import history, impact, shard, speech, state
+from harness.gemini_stub import GeminiStub, StubConfig
+from harness.perf import PERF_MODES, PerfRecorder
+from harness.replay import FIXTURE_MODES, GeminiFixtures
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+RESULTS_PATH = TESTS_DIR / "tmp" / "runner_results.json"
+
+# Same flags the generated scripts use, minus --single-process: a pooled
+# browser hosts several contexts at once and needs its renderer processes.
+BROWSER_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+    "--ipc=host",
+]
+DEFAULT_TIMEOUT_MS = 5000
+
+# Mock Operator API latency profile (src/services/latencyProfile.js); "zero"
+# keeps admin flows and timings free of simulated backend delays.
+LATENCY_PROFILES = ("zero", "fixed", "realistic", "replay")
+DEFAULT_LATENCY = "zero"
+
+
+def latency_init_script(profile):
+    return f"try {{ localStorage.setItem('AG_API_LATENCY', {json.dumps(profile)}); }} catch (e) {{}}"
+
+
+@dataclass
+class TestCase:
+    case_id: str
+    title: str
+    path: pathlib.Path
+
+    def load(self):
+        spec = importlib.util.spec_from_file_location(self.path.stem, self.path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+
+@dataclass
+class CaseResult:
+    case_id: str
+    title: str
+    status: str
+    error: str
+    duration_s: float
+    worker: int
+    perf: dict = None
+    fixtures: dict = None
+    modules: set = None
+
+
+def case_title(stem):
+    """``TC007_Admin_Console___User_Management`` -> ``TC007-Admin Console - User Management``."""
+    case_id, _, rest = stem.partition("_")
+    return f"{case_id}-" + rest.replace("___", " - ").replace("_", " ")
+
+
+def discover(pattern=None, tests_dir=TESTS_DIR):
+    """Return the TC cases in ``tests_dir``, optionally filtered by a regex on the file stem."""
+    matcher = re.compile(pattern) if pattern else None
+    cases = []
+    for path in sorted(tests_dir.glob("TC[0-9]*.py")):
+        if matcher and not matcher.search(path.stem):
+            continue
+        cases.append(TestCase(path.stem.split("_", 1)[0], case_title(path.stem), path))
+    return cases
+
+
+class BrowserPool:
+    """A fixed set of browsers launched once and shared by all workers."""
+
+    def __init__(self, playwright, size, headless=True, latency=DEFAULT_LATENCY):
+        self.playwright = playwright
+        self.size = max(1, size)
+        self.headless = headless
+        self.latency = latency
+        self.browsers = []
+
+    async def start(self):
+        self.browsers = await asyncio.gather(*(
+            self.playwright.chromium.launch(headless=self.headless, args=BROWSER_ARGS)
+            for _ in range(self.size)
+        ))
+        return self
+
+    def browser_for(self, worker_id):
+        return self.browsers[worker_id % len(self.browsers)]
+
+    async def new_context(self, worker_id, **options):
+        context = await self.browser_for(worker_id).new_context(**options)
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        await context.add_init_script(latency_init_script(self.latency))
+        return context
+
+    async def close(self):
+        await asyncio.gather(*(b.close() for b in self.browsers), return_exceptions=True)
+        self.browsers = []
+
+
+class CaseSession:
+    """One case's context, with the perf, Gemini fixture and speech recorders the run asked for."""
+
+    def __init__(self, case, pool, worker_id, perf=None, fixtures=None, replay_speed=1.0, with_speech=False,
+                 record_impact=False):
+        self.case = case
+        self.pool = pool
+        self.worker_id = worker_id
+        self.perf = perf
+        self.fixtures = fixtures
+        self.replay_speed = replay_speed
+        self.with_speech = with_speech
+        self.modules = set() if record_impact else None
+        self.context = self.recorder = self.tape = None
+
+    async def open(self):
+        self.context = await self.pool.new_context(self.worker_id)
+        if self.perf:
+            self.recorder = PerfRecorder(self.case.case_id, self.perf)
+            await self.recorder.attach(self.context, self.pool.browser_for(self.worker_id))
+        if self.fixtures:
+            self.tape = GeminiFixtures(self.case.case_id, self.fixtures, self.replay_speed)
+            await self.tape.attach(self.context)
+        if self.with_speech:
+            await speech.install(self.context)
+        if self.modules is not None:
+            self.context.on("request", self._on_request)
+        return self.context
+
+    def _on_request(self, request):
+        module = impact.served_module(request.url)
+        if module:
+            self.modules.add(module)
+
+    def check(self):
+        """Fail a case that ran past the end of its Gemini fixture."""
+        if self.tape and self.tape.misses:
+            raise AssertionError(f"no Gemini fixture for {len(self.tape.misses)} request(s): {self.tape.misses[0]}")
+
+    async def close(self):
+        """Close the context; returns (perf summary, fixture summary)."""
+        summary = tape_summary = None
+        if self.tape:
+            tape_summary = await self.tape.finish()
+        if self.recorder:
+            try:
+                summary = await self.recorder.finish()
+            except Exception as exc:
+                print(f"[perf] {self.case.case_id}: {type(exc).__name__}: {exc}", flush=True)
+        stack = self.context and speech.for_context(self.context)
+        if stack:
+            summary = {**(summary or {}), **stack.summary()}
+        if self.context:
+            await self.context.close()
+        return summary, tape_summary
+
+
+def state_context_opener(pool, fixtures=None, replay_speed=1.0):
+    """Build state snapshots in contexts prepared like the cases' (see ``state.context_opener``)."""
+    @contextlib.asynccontextmanager
+    async def open_context(name):
+        session = CaseSession(TestCase(f"state_{name}", f"state {name}", None), pool, 0,
+                              fixtures=fixtures, replay_speed=replay_speed)
+        try:
+            yield await session.open()
+            session.check()
+        finally:
+            await session.close()
+    return open_context
+
+
+async def run_one(case, pool, worker_id, perf=None, fixtures=None, replay_speed=1.0, with_speech=False,
+                  record_impact=False):
+    started = time.perf_counter()
+    session = CaseSession(case, pool, worker_id, perf, fixtures, replay_speed, with_speech, record_impact)
+    status, error = "PASSED", ""
+    try:
+        module = case.load()
+        await module.run_case(await session.open())
+        session.check()
+    except Exception as exc:  # a failing case must not take the worker down
+        status, error = "FAILED", f"{type(exc).__name__}: {exc}"
+    finally:
+        summary, tape_summary = await session.close()
+    return CaseResult(case.case_id, case.title, status, error,
+                      time.perf_counter() - started, worker_id, summary, tape_summary, session.modules)
+
+
+async def run_standalone(run_case, headless=True):
+    """Run one case on its own driver and browser -- what ``python TCxxx.py`` does.
+
+    Each TC script's ``run_test`` calls this, so a script run directly starts
+    and stops a Playwright driver and browser just for its case. Under pytest
+    (``conftest.py``) and ``python -m harness.runner``, ``run_case`` is called
+    instead, with a context from a browser shared by every case.
+    """
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as pw:
+        pool = await BrowserPool(pw, 1, headless).start()
+        state.context_opener = state_context_opener(pool)
+        context = None
+        try:
+            context = await pool.new_context(0)
+            await run_case(context)
+        finally:
+            if context:
+                await context.close()
+            await pool.close()
+
+
+async def run_suite(cases, workers=4, browsers=2, headless=True, latency=DEFAULT_LATENCY, perf=None,
+                    fixtures=None, replay_speed=1.0, with_speech=False, record_impact=False):
+    """Run ``cases`` on ``workers`` concurrent slots; returns (results, total wall seconds)."""
+    from playwright.async_api import async_playwright
+
+    queue = asyncio.Queue()
+    for case in cases:
+        queue.put_nowait(case)
+    results = []
+
+    async def worker(worker_id):
+        while True:
+            try:
+                case = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            result = await run_one(case, pool, worker_id, perf, fixtures, replay_speed, with_speech, record_impact)
+            print(f"[w{worker_id}] {result.status:6} {result.duration_s:7.2f}s  {case.title}", flush=True)
+            results.append(result)
+
+    # A Chromium trace covers the whole browser: one browser per worker keeps them apart
+    pool_size = workers if perf == "trace" else min(browsers, workers)
+    started = time.perf_counter()
+    async with async_playwright() as pw:
+        pool = await BrowserPool(pw, pool_size, headless, latency).start()
+        state.context_opener = state_context_opener(pool, fixtures, replay_speed)
+        try:
+            await asyncio.gather(*(worker(i) for i in range(max(1, workers))))
+        finally:
+            await pool.close()
+    total = time.perf_counter() - started
+
+    results.sort(key=lambda r: r.case_id)
+    return results, total
+
+
+async def run_with_stub(cases, args):
+    """Run the suite, serving Gemini from the local stand-in when ``--gemini-stub`` is set."""
+    options = dict(workers=args.workers, browsers=args.browsers, headless=not args.headed, latency=args.latency,
+                   perf=args.perf, fixtures=args.gemini_fixtures, replay_speed=args.replay_speed,
+                   with_speech=args.speech, record_impact=args.record_impact)
+    if not args.gemini_stub:
+        return await run_suite(cases, **options)
+    async with GeminiStub(StubConfig(port=args.stub_port)) as stub:
+        print(f"Gemini stand-in on {stub.base_url} (dev server needs VITE_GEMINI_BASE_URL={stub.base_url})")
+        return await run_suite(cases, **options)
+
+
+def print_report(results, total, workers):
+    print()
+    with_perf = any(r.perf for r in results)
+    perf_header = f"{'LCP (ms)':>10}{'INP (ms)':>10}{'Gemini p50':>12}" if with_perf else ""
+    print(f"{'case':<8}{'status':<8}{'wall (s)':>10}{perf_header}")
+    for r in results:
+        perf = ""
+        if with_perf:
+            p = r.perf or {}
+            perf = "".join(f"{'-' if p.get(k) is None else p[k]:>{w}}"
+                           for k, w in (("lcpMs", 10), ("inpMs", 10), ("geminiP50Ms", 12)))
+        print(f"{r.case_id:<8}{r.status:<8}{r.duration_s:>10.2f}{perf}")
+    serial = sum(r.duration_s for r in results)
+    passed = sum(r.status == "PASSED" for r in results)
+    print()
+    print(f"{passed}/{len(results)} passed with {workers} worker(s)")
+    print(f"total wall time: {total:.2f}s  (sum of case times {serial:.2f}s, "
+          f"speedup x{serial / total if total else 0:.2f})")
+
+
+def write_results(results, path=RESULTS_PATH):
+    """Write one entry per case to the runner's own results file.
+
+    Status and error use TestSprite's field names (``testStatus``, ``testError``);
+    the rest is the runner's. ``tmp/test_results.json`` is TestSprite's artifact,
+    with a different layout, and is never written here.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = [{
+        "caseId": r.case_id,
+        "title": r.title,
+        "testStatus": r.status,
+        "testError": r.error,
+        "durationMs": round(r.duration_s * 1000),
+        "worker": r.worker,
+        **({"perf": r.perf} if r.perf else {}),
+        **({"geminiFixtures": r.fixtures} if r.fixtures else {}),
+    } for r in results]
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+
+
+def record_history(results, args):
+    db = history.connect()
+    run_id = history.record(db, json.loads(args.output.read_text()), meta={
+        "workers": args.workers, "browsers": args.browsers, "latency": args.latency, "perf": args.perf,
+    })
+    _, rows = history.compare(db, run_id)
+    md, _ = history.write_reports(db, run_id, rows, history.DEFAULT_WINDOW, history.DEFAULT_THRESHOLD)
+    regressions = sum(r["verdict"] == "regression" for r in rows)
+    print(f"history: run #{run_id}, {regressions} regression(s), report in {md}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--select", help="regex matched against TC file names")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="cases run concurrently")
+    parser.add_argument("-b", "--browsers", type=int, default=2, help="browsers in the shared pool")
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    parser.add_argument("--gemini-stub", action="store_true",
+                        help="serve Gemini from harness.gemini_stub for the duration of the run")
+    parser.add_argument("--stub-port", type=int, default=StubConfig().port)
+    parser.add_argument("--latency", choices=LATENCY_PROFILES, default=DEFAULT_LATENCY,
+                        help="mock Operator API latency profile for the app under test")
+    parser.add_argument("--refresh-state", action="store_true",
+                        help="rebuild the seeded state snapshots instead of reusing tmp/state")
+    parser.add_argument("--perf", choices=PERF_MODES,
+                        help="record Web Vitals and Gemini timings per case (trace: plus a Chromium trace)")
+    parser.add_argument("--gemini-fixtures", choices=FIXTURE_MODES,
+                        help="record Gemini streams to fixtures/gemini, or replay them without network")
+    parser.add_argument("--replay-speed", type=float, default=1.0,
+                        help="scale of the recorded chunk timing on replay (1 original, 0.1 ten times faster, 0 none)")
+    parser.add_argument("--speech", action="store_true",
+                        help="install the speech stand-in in every case and report time-to-first-speech")
+    parser.add_argument("--changed-since", metavar="REF",
+                        help="run only the cases affected by the diff against REF (full suite when unsure)")
+    parser.add_argument("--record-impact", action="store_true",
+                        help="record the app modules each case loads into tmp/impact_map.json")
+    parser.add_argument("--history", action="store_true",
+                        help="append the run to tmp/history.sqlite3 and write the regression report")
+    parser.add_argument("--shard", type=shard.parse_shard, metavar="K/N",
+                        help="run only shard K of N, balanced by historical case duration")
+    parser.add_argument("--durations", type=pathlib.Path,
+                        help="JSON {caseId: ms} to balance shards with instead of the history")
+    parser.add_argument("-o", "--output", type=pathlib.Path, default=RESULTS_PATH,
+                        help="where to write the results JSON")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    state.REFRESH = state.REFRESH or args.refresh_state
+    cases = discover(args.select)
+    if not cases:
+        print("no TC cases matched")
+        return 1
+    if args.changed_since:
+        selected, _ = impact.select(cases, impact.changed_files(args.changed_since))
+        if selected is not None:
+            cases = [c for c in cases if c.case_id in selected]
+            print(f"impact: {len(cases)} case(s) affected since {args.changed_since}: "
+                  f"{' '.join(c.case_id for c in cases) or '(none)'}")
+            if not cases:
+                return 0
+    durations = shard.load_durations(args.durations)
+    if args.shard:
+        cases = shard.select(cases, args.shard, durations)
+        print(f"shard {args.shard[0]}/{args.shard[1]}: {' '.join(c.case_id for c in cases) or '(empty)'}")
+        if not cases:
+            write_results([], args.output)
+            return 0
+    else:
+        # Longest first, so no long case starts last on an otherwise idle pool
+        cases = shard.longest_first(cases, durations)
+    results, total = asyncio.run(run_with_stub(cases, args))
+    print_report(results, total, args.workers)
+    write_results(results, args.output)
+    if args.record_impact:
+        impact.update_recorded_map({r.case_id: r.modules for r in results if r.status == "PASSED"})
+    if args.history:
+        record_history(results, args)
+    return 0 if all(r.status == "PASSED" for r in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+"""Duration-balanced sharding of the TC suite across machines or processes.
+
+Expected case durations come from the benchmark history (median wall time of
+the last passing runs, see ``history.py``), else from the last
+``runner_results.json``, else the median of the known cases. Cases are dealt
+longest-processing-time first -- each to the shard with the least work so far
+-- so one long case (TC014, TC015) does not end up behind a queue of others.
+Within a shard the runner also starts the longest cases first.
+
+    # machine k of 3
+    python -m harness.runner --shard k/3 -o tmp/shards/results-k.json
+    # afterwards, anywhere with the shard files
+    python -m harness.shard merge tmp/shards/results-*.json -o tmp/runner_results.json
+    # preview the split
+    python -m harness.shard plan 3
+    # the merged file feeds the history like a single-machine run
+    python -m harness.history record tmp/runner_results.json
+
+Every shard computes the same split as long as it sees the same history, so
+copy ``tmp/history.sqlite3`` (or the last ``runner_results.json``) to each
+machine, or pass ``--durations`` with an exported JSON of ``{caseId: ms}``.
+Splits that disagree drop or repeat cases: ``merge`` fails when a case
+appears in two shard files or in none (checked against the discovered TC
+files; pass the shards' ``-k`` to it too).
+"""
+import argparse
+import json
+import pathlib
+import statistics
+
+from harness import history
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+RESULTS_PATH = TESTS_DIR / "tmp" / "runner_results.json"
+DEFAULT_DURATION_MS = 30000
+HISTORY_RUNS = 10
+
+
+def parse_shard(value):
+    """``"2/4"`` -> ``(2, 4)``, 1-based."""
+    index, _, total = value.partition("/")
+    index, total = int(index), int(total)
+    if not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"shard must be k/N with 1 <= k <= N, got {value!r}")
+    return index, total
+
+
+def known_durations(db_path=history.DB_PATH, results_path=RESULTS_PATH, runs=HISTORY_RUNS):
+    """``{caseId: expected ms}`` from the history, falling back to the last results file."""
+    durations = {}
+    if db_path.exists():
+        db = history.connect(db_path)
+        cases = [c for (c,) in db.execute("SELECT DISTINCT case_id FROM samples WHERE metric = 'durationMs'")]
+        for case_id in cases:
+            values = [v for (v,) in db.execute(
+                "SELECT value FROM samples WHERE case_id = ? AND metric = 'durationMs' AND status = 'PASSED' "
+                "ORDER BY run_id DESC LIMIT ?", (case_id, runs))]
+            if values:
+                durations[case_id] = statistics.median(values)
+    if results_path.exists():
+        for entry in json.loads(results_path.read_text()):
+            if "durationMs" in entry:
+                durations.setdefault(entry["caseId"], entry["durationMs"])
+    return durations
+
+
+def expected(cases, durations):
+    """Expected ms per case id, using the median known duration for unseen cases."""
+    fallback = statistics.median(durations.values()) if durations else DEFAULT_DURATION_MS
+    return {case.case_id: durations.get(case.case_id, fallback) for case in cases}
+
+
+def plan(cases, total, durations):
+    """Split ``cases`` into ``total`` shards by LPT; each shard is longest-first."""
+    cost = expected(cases, durations)
+    shards = [[] for _ in range(total)]
+    loads = [0.0] * total
+    for case in sorted(cases, key=lambda c: (-cost[c.case_id], c.case_id)):
+        target = min(range(total), key=lambda i: (loads[i], i))
+        shards[target].append(case)
+        loads[target] += cost[case.case_id]
+    return shards, loads
+
+
+def select(cases, shard, durations):
+    """The cases of shard ``(index, total)``, longest first."""
+    index, total = shard
+    shards, _ = plan(cases, total, durations)
+    return shards[index - 1]
+
+
+def longest_first(cases, durations):
+    """``cases`` ordered for a local worker queue: longest expected first."""
+    cost = expected(cases, durations)
+    return sorted(cases, key=lambda c: (-cost[c.case_id], c.case_id))
+
+
+def merge(paths, output=RESULTS_PATH, expected_ids=None):
+    """Combine shard result files into one ``runner_results.json``; returns the merged entries.
+
+    With ``expected_ids``, every one of them must have run on some shard.
+    """
+    merged = {}
+    for path in paths:
+        for entry in json.loads(pathlib.Path(path).read_text()):
+            if entry["caseId"] in merged:
+                raise SystemExit(f"{entry['caseId']} appears in more than one shard ({path})")
+            merged[entry["caseId"]] = entry
+    missing = sorted(set(expected_ids or ()) - set(merged))
+    if missing:
+        raise SystemExit(f"{len(missing)} case(s) ran on no shard: {' '.join(missing)} "
+                         "(did the shards see different histories?)")
+    entries = [merged[k] for k in sorted(merged)]
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(entries, indent=2, ensure_ascii=False))
+    return entries
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show = commands.add_parser("plan", help="print the split for N shards")
+    show.add_argument("shards", type=int)
+    show.add_argument("-k", "--select", help="regex matched against TC file names")
+    show.add_argument("--durations", type=pathlib.Path, help="JSON {caseId: ms} instead of the history")
+
+    join = commands.add_parser("merge", help="merge shard results into one runner_results.json")
+    join.add_argument("results", type=pathlib.Path, nargs="+")
+    join.add_argument("-o", "--output", type=pathlib.Path, default=RESULTS_PATH)
+    join.add_argument("-k", "--select", help="the regex the shards ran with; every matching case must be merged")
+    return parser
+
+
+def load_durations(path=None):
+    """Durations from an exported ``{caseId: ms}`` file, or from the local history."""
+    return json.loads(path.read_text()) if path else known_durations()
+
+
+def main(argv=None):
+    from harness.runner import discover
+
+    args = build_parser().parse_args(argv)
+    if args.command == "merge":
+        entries = merge(args.results, args.output, [c.case_id for c in discover(args.select)])
+        passed = sum(e["testStatus"] == "PASSED" for e in entries)
+        slowest = max((e.get("durationMs", 0) for e in entries), default=0)
+        print(f"merged {len(entries)} cases from {len(args.results)} shard(s) into {args.output}: "
+              f"{passed} passed, slowest case {slowest / 1000:.1f}s")
+        return 0 if passed == len(entries) else 1
+
+    durations = load_durations(args.durations)
+    shards, loads = plan(discover(args.select), args.shards, durations)
+    for i, (cases, load) in enumerate(zip(shards, loads), 1):
+        print(f"shard {i}/{args.shards}  ~{load / 1000:6.1f}s  {' '.join(c.case_id for c in cases)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
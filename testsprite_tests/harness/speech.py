@@ -0,0 +1,271 @@
+"""Headless stand-in for the Web Speech API, with time-to-first-speech.
+
+``SalesLabChat.jsx`` and ``AIChatbot.jsx`` speak every AI reply through
+``window.speechSynthesis`` and listen through ``webkitSpeechRecognition``.
+Headless Chromium has no voices and no microphone, so utterances never start
+or end and recognition only errors. This module installs an init script that
+replaces both:
+
+* ``speechSynthesis`` -- a fixed voice list (``voiceschanged`` fires once),
+  a FIFO of utterances that fire ``start`` after ``start_delay_ms`` and ``end``
+  after ``len(text) / chars_per_second / rate``; ``cancel()`` fires ``error``
+  (``canceled``) on everything pending, like Chrome;
+* ``SpeechRecognition`` / ``webkitSpeechRecognition`` -- each ``start()``
+  takes the next scripted transcript from the harness and delivers it as an
+  interim result (when ``interimResults``) and then a final one;
+  ``await stack.say(page, text)`` makes an active recogniser hear ``text`` on
+  demand.
+
+Each utterance start is reported with its time-to-first-speech: the time from
+the Gemini request that produced the reply (the latest streamed request
+before ``speak()``, else the latest request) to the ``start`` event. That is
+the voice-mode latency a trainee hears, and it lands in the case's ``perf``
+summary as ``ttfsP50Ms`` / ``ttfsMaxMs``.
+
+    stack = await speech.install(context, transcripts=["I'm looking for a TV"])
+    ...
+    await stack.say(page, "What about the price?")
+
+Cases install it themselves; ``python -m harness.runner --speech`` installs it
+for every case.
+"""
+import json
+import weakref
+from dataclasses import asdict, dataclass, field
+
+from harness.perf import percentile
+
+BINDING = "__agSpeechReport"
+
+DEFAULT_VOICES = (
+    {"name": "Google US English", "lang": "en-US", "default": True},
+    {"name": "Microsoft Guy Online (Natural) - English (United States) male", "lang": "en-US"},
+    {"name": "Microsoft Aria Online (Natural) - English (United States) female", "lang": "en-US"},
+    {"name": "Google 한국의", "lang": "ko-KR"},
+    {"name": "Google español", "lang": "es-ES"},
+    {"name": "Google português do Brasil", "lang": "pt-BR"},
+)
+
+
+@dataclass
+class SpeechConfig:
+    chars_per_second: float = 15.0
+    start_delay_ms: int = 50
+    min_utterance_ms: int = 300
+    transcript_delay_ms: int = 400
+    voices: tuple = field(default=DEFAULT_VOICES)
+
+
+SPEECH_JS = """
+(() => {
+    if (window.__agSpeech) return;
+    const cfg = %(config)s;
+    const report = event => window.%(binding)s({ t: performance.now(), path: location.pathname, ...event });
+    const fire = (target, type, extra = {}) => {
+        const event = new Event(type);
+        Object.assign(event, extra);
+        target.dispatchEvent(event);
+        const handler = target['on' + type];
+        if (typeof handler === 'function') handler.call(target, event);
+    };
+
+    // Gemini request starts, to attribute each utterance to the reply it speaks
+    const GEMINI = /generativelanguage\\.googleapis\\.com|:(stream)?[gG]enerateContent/;
+    const requests = [];
+    const realFetch = window.fetch.bind(window);
+    window.fetch = (input, init) => {
+        const url = typeof input === 'string' ? input : (input.url || String(input));
+        if (GEMINI.test(url)) requests.push({ t: performance.now(), streamed: url.includes('streamGenerateContent') });
+        return realFetch(input, init);
+    };
+    const replyRequestAt = before => {
+        const prior = requests.filter(r => r.t <= before);
+        const streamed = prior.filter(r => r.streamed);
+        const pick = (streamed.length ? streamed : prior).pop();
+        return pick ? pick.t : null;
+    };
+
+    // --- speechSynthesis ---
+    class Utterance extends EventTarget {
+        constructor(text = '') {
+            super();
+            Object.assign(this, { text, lang: '', voice: null, rate: 1, pitch: 1, volume: 1 });
+            for (const type of ['start', 'end', 'error', 'pause', 'resume', 'boundary', 'mark']) this['on' + type] = null;
+        }
+    }
+    const voices = cfg.voices.map(v => ({ default: false, localService: true, voiceURI: v.name, ...v }));
+    const queue = [];
+    let current = null;
+    let timer = null;
+    const synth = new EventTarget();
+    synth.onvoiceschanged = null;
+    const durationOf = u => Math.max(cfg.min_utterance_ms, 1000 * u.text.length / (cfg.chars_per_second * (u.rate || 1)));
+    const next = () => {
+        const u = current = queue.shift() || null;
+        if (!u) return;
+        timer = setTimeout(() => {
+            if (current !== u) return;
+            const started = performance.now();
+            const from = replyRequestAt(u.__agRequestedAt);
+            report({ type: 'speak', chars: u.text.length, lang: u.lang, ttfsMs: from === null ? null : started - from });
+            fire(u, 'start', { utterance: u, charIndex: 0, elapsedTime: 0 });
+            timer = setTimeout(() => {
+                if (current !== u) return;
+                current = null;
+                fire(u, 'end', { utterance: u, charIndex: u.text.length, elapsedTime: performance.now() - started });
+                next();
+            }, durationOf(u));
+        }, cfg.start_delay_ms);
+    };
+    Object.assign(synth, {
+        getVoices: () => voices.slice(),
+        speak(u) {
+            u.__agRequestedAt = performance.now();
+            queue.push(u);
+            if (!current) next();
+        },
+        cancel() {
+            clearTimeout(timer);
+            const dropped = [current, ...queue].filter(Boolean);
+            queue.length = 0;
+            current = null;
+            dropped.forEach(u => fire(u, 'error', { utterance: u, error: 'canceled' }));
+        },
+        pause() {},
+        resume() {},
+    });
+    Object.defineProperties(synth, {
+        speaking: { get: () => current !== null },
+        pending: { get: () => queue.length > 0 },
+        paused: { get: () => false },
+    });
+    Object.defineProperty(window, 'speechSynthesis', { value: synth, configurable: true });
+    window.SpeechSynthesisUtterance = Utterance;
+    setTimeout(() => fire(synth, 'voiceschanged'), 0);
+
+    // --- SpeechRecognition ---
+    const active = new Set();
+    const overheard = [];
+    const resultOf = (transcript, isFinal) => Object.assign([{ transcript, confidence: 0.95 }], { isFinal });
+    class Recognition extends EventTarget {
+        constructor() {
+            super();
+            Object.assign(this, { lang: '', continuous: false, interimResults: false, maxAlternatives: 1 });
+            for (const type of ['start', 'end', 'result', 'error', 'nomatch', 'audiostart', 'audioend',
+                                'soundstart', 'soundend', 'speechstart', 'speechend']) this['on' + type] = null;
+            this._active = false;
+            this._results = [];
+        }
+        start() {
+            if (this._active) throw new DOMException('recognition has already started', 'InvalidStateError');
+            this._active = true;
+            this._results = [];
+            active.add(this);
+            fire(this, 'start');
+            fire(this, 'audiostart');
+            if (overheard.length) this._hear(overheard.shift());
+            else report({ type: 'listen', lang: this.lang }).then(text => { if (text) this._hear(text); });
+        }
+        _hear(text) {
+            const words = text.split(' ');
+            const emit = (transcript, isFinal) => {
+                if (!this._active) return;
+                if (!isFinal && !this.interimResults) return;
+                const index = this._results.length;
+                const results = [...this._results, resultOf(transcript, isFinal)];
+                if (isFinal) this._results = results;
+                fire(this, 'result', { resultIndex: index, results });
+                if (isFinal) {
+                    report({ type: 'heard', chars: text.length, lang: this.lang });
+                    if (!this.continuous) this.stop();
+                }
+            };
+            setTimeout(() => emit(words.slice(0, Math.ceil(words.length / 2)).join(' '), false), cfg.transcript_delay_ms / 2);
+            setTimeout(() => emit(text, true), cfg.transcript_delay_ms);
+        }
+        _finish(error) {
+            if (!this._active) return;
+            this._active = false;
+            active.delete(this);
+            if (error) fire(this, 'error', { error, message: '' });
+            fire(this, 'end');
+        }
+        stop() { this._finish(null); }
+        abort() { this._finish('aborted'); }
+    }
+    window.SpeechRecognition = window.webkitSpeechRecognition = Recognition;
+
+    window.__agSpeech = {
+        hear(text) {
+            const [listener] = active;
+            if (listener) listener._hear(text);
+            else overheard.push(text);
+        },
+    };
+})();
+"""
+
+_stacks = weakref.WeakKeyDictionary()
+
+
+class SpeechStack:
+    """The speech stand-in of one browser context and what it observed."""
+
+    def __init__(self, transcripts=(), config=None):
+        self.config = config or SpeechConfig()
+        self.transcripts = list(transcripts)
+        self.events = []
+
+    async def attach(self, context):
+        await context.expose_binding(BINDING, self._on_report)
+        config = {**asdict(self.config), "voices": list(self.config.voices)}
+        await context.add_init_script(SPEECH_JS % {"config": json.dumps(config, ensure_ascii=False),
+                                                   "binding": BINDING})
+
+    def _on_report(self, source, event):
+        self.events.append(event)
+        if event["type"] == "listen" and self.transcripts:
+            return self.transcripts.pop(0)
+        return None
+
+    async def say(self, page, text):
+        """Have the page's active recogniser (or the next one started) hear ``text``."""
+        await page.evaluate("text => window.__agSpeech.hear(text)", text)
+
+    def utterances(self):
+        return [e for e in self.events if e["type"] == "speak"]
+
+    async def wait_for_utterances(self, page, count=1, timeout_ms=5000):
+        """Wait until ``count`` utterances have started (or the timeout); returns how many have."""
+        waited = 0
+        while len(self.utterances()) < count and waited < timeout_ms:
+            await page.wait_for_timeout(50)
+            waited += 50
+        return len(self.utterances())
+
+    def summary(self):
+        spoken = self.utterances()
+        ttfs = [e["ttfsMs"] for e in spoken if e.get("ttfsMs") is not None]
+        rounded = lambda v: None if v is None else round(v, 1)
+        return {
+            "utterances": len(spoken),
+            "recognised": sum(1 for e in self.events if e["type"] == "heard"),
+            "ttfsP50Ms": rounded(percentile(ttfs, 0.5)),
+            "ttfsMaxMs": rounded(max(ttfs) if ttfs else None),
+        }
+
+
+async def install(context, transcripts=(), config=None):
+    """Install the speech stand-in in ``context`` (once); later calls queue more transcripts."""
+    stack = _stacks.get(context)
+    if stack is None:
+        stack = _stacks[context] = SpeechStack(transcripts, config)
+        await stack.attach(context)
+    else:
+        stack.transcripts.extend(transcripts)
+    return stack
+
+
+def for_context(context):
+    """The stack installed in ``context``, or None."""
+    return _stacks.get(context)
@@ -0,0 +1,245 @@
+"""Cold-start benchmark: bundle bytes and time-to-interactive per route.
+
+Every run opens a fresh browser context (empty HTTP cache and storage), loads
+one route and records:
+
+* transfer bytes of the JavaScript and CSS it downloaded (headers + body, from
+  Playwright's ``request.sizes()``) and the number of requests;
+* FCP and LCP;
+* time-to-interactive -- the latest of FCP, the app's render-settled marker
+  (``<html data-app-busy>``, which also covers lazy route screens still
+  downloading) going away, and the end of the last long task before a
+  ``--quiet-ms`` window without long tasks or busy marker.
+
+Measure a production build, where chunking and minification apply:
+
+    npm run build && npm run preview        # http://localhost:4173
+    cd testsprite_tests
+    python -m harness.startup --base-url http://localhost:4173 --label before
+    # ...change the app, rebuild...
+    python -m harness.startup --base-url http://localhost:4173 --label after \\
+        --baseline tmp/startup-before.json
+
+The mock Operator API's simulated latency holds the busy marker for its
+whole (random, in a production build) delay, so it is switched off as in the
+runner (``--latency zero``); pick another profile to measure with it.
+
+``--cpu-throttle 4`` and ``--network slow-4g`` emulate a low-end device
+through the Chrome DevTools Protocol. Results go to ``tmp/startup-<label>.json``
+(medians per route plus every sample); with ``--baseline`` the medians are
+printed next to the baseline's with the change in percent.
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+import statistics
+
+from harness.runner import DEFAULT_LATENCY, LATENCY_PROFILES, latency_init_script
+from harness.state import BASE_URL
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+DEFAULT_ROUTES = ("/", "/sales-lab", "/admin")
+QUIET_MS = 500
+LOAD_TIMEOUT_MS = 60000
+
+# latency (ms), download and upload throughput (bytes/s), as in Lighthouse and DevTools
+NETWORK_PROFILES = {
+    "slow-4g": (150, 1_600_000 / 8, 750_000 / 8),
+    "fast-3g": (563, 1_440_000 / 8, 675_000 / 8),
+}
+
+METRICS = ("ttiMs", "fcpMs", "lcpMs", "jsBytes", "cssBytes", "requests")
+
+STARTUP_JS = """
+(() => {
+    const state = window.__agStartup = { lcp: null, lastLongTaskEnd: 0, lastBusyChange: 0 };
+    try {
+        new PerformanceObserver(list => {
+            const entries = list.getEntries();
+            state.lcp = entries[entries.length - 1].startTime;
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+        new PerformanceObserver(list => {
+            for (const e of list.getEntries()) state.lastLongTaskEnd = Math.max(state.lastLongTaskEnd, e.startTime + e.duration);
+        }).observe({ type: 'longtask', buffered: true });
+    } catch (e) { /* entry type not supported */ }
+    new MutationObserver(() => { state.lastBusyChange = performance.now(); })
+        .observe(document.documentElement, { attributes: true, attributeFilter: ['data-app-busy'] });
+})();
+"""
+
+# Resolves once the app is idle and has been quiet for `quietMs`
+SETTLED_JS = """
+(quietMs) => new Promise(resolve => {
+    const state = window.__agStartup;
+    const fcpOf = () => {
+        const [entry] = performance.getEntriesByName('first-contentful-paint');
+        return entry ? entry.startTime : null;
+    };
+    const check = () => {
+        const now = performance.now();
+        const busy = document.documentElement.hasAttribute('data-app-busy');
+        const mounted = document.getElementById('root')?.childElementCount > 0;
+        const fcp = fcpOf();
+        const quietSince = Math.max(state.lastLongTaskEnd, state.lastBusyChange);
+        if (busy || !mounted || fcp === null || now - quietSince < quietMs) {
+            setTimeout(check, 50);
+            return;
+        }
+        resolve({ fcpMs: fcp, lcpMs: state.lcp, ttiMs: Math.max(fcp, quietSince) });
+    };
+    check();
+})
+"""
+
+
+def median(values):
+    values = [v for v in values if v is not None]
+    return statistics.median(values) if values else None
+
+
+async def emulate(context, page, cpu_throttle, network):
+    if cpu_throttle <= 1 and not network:
+        return
+    cdp = await context.new_cdp_session(page)
+    if cpu_throttle > 1:
+        await cdp.send("Emulation.setCPUThrottlingRate", {"rate": cpu_throttle})
+    if network:
+        latency, download, upload = NETWORK_PROFILES[network]
+        await cdp.send("Network.enable")
+        await cdp.send("Network.emulateNetworkConditions", {
+            "offline": False, "latency": latency, "downloadThroughput": download, "uploadThroughput": upload,
+        })
+
+
+async def measure(browser, url, cpu_throttle=1, network=None, quiet_ms=QUIET_MS, latency=DEFAULT_LATENCY):
+    """Load ``url`` in a cold context and return one sample."""
+    context = await browser.new_context()
+    transfers = []
+    pending = set()
+
+    async def on_finished(request):
+        sizes = await request.sizes()
+        transfers.append((request.resource_type, sizes["responseHeadersSize"] + sizes["responseBodySize"]))
+
+    def track(request):
+        task = asyncio.ensure_future(on_finished(request))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    try:
+        await context.add_init_script(latency_init_script(latency))
+        await context.add_init_script(STARTUP_JS)
+        context.on("requestfinished", track)
+        page = await context.new_page()
+        await emulate(context, page, cpu_throttle, network)
+        await page.goto(url, wait_until="load", timeout=LOAD_TIMEOUT_MS)
+        timings = await asyncio.wait_for(page.evaluate(SETTLED_JS, quiet_ms), LOAD_TIMEOUT_MS / 1000)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    finally:
+        await context.close()
+    return {
+        **{k: None if v is None else round(v, 1) for k, v in timings.items()},
+        "jsBytes": sum(size for kind, size in transfers if kind == "script"),
+        "cssBytes": sum(size for kind, size in transfers if kind == "stylesheet"),
+        "requests": len(transfers),
+    }
+
+
+async def run(base_url, routes, runs, headless=True, cpu_throttle=1, network=None, quiet_ms=QUIET_MS,
+              latency=DEFAULT_LATENCY):
+    from playwright.async_api import async_playwright
+
+    results = {}
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=headless)
+        try:
+            for route in routes:
+                samples = []
+                for _ in range(runs):
+                    samples.append(await measure(browser, base_url.rstrip("/") + route,
+                                                 cpu_throttle, network, quiet_ms, latency))
+                results[route] = {
+                    "median": {m: median([s[m] for s in samples]) for m in METRICS},
+                    "samples": samples,
+                }
+                print(f"{route:<14}" + _row(results[route]["median"]), flush=True)
+        finally:
+            await browser.close()
+    return results
+
+
+def _fmt(metric, value):
+    if value is None:
+        return "-"
+    return f"{value / 1024:.1f}KiB" if metric.endswith("Bytes") else f"{value:.0f}"
+
+
+def _row(values, metrics=METRICS):
+    return "".join(f"{m}={_fmt(m, values[m]):<12}" for m in metrics)
+
+
+def compare(baseline, current, metrics=METRICS):
+    """Rows of (route, metric, before, after, change) for routes measured in both."""
+    rows = []
+    for route, result in current["routes"].items():
+        before = baseline["routes"].get(route)
+        if not before:
+            continue
+        for metric in metrics:
+            old, new = before["median"].get(metric), result["median"].get(metric)
+            change = (new - old) / old if old and new is not None else None
+            rows.append((route, metric, old, new, change))
+    return rows
+
+
+def print_comparison(baseline, current, metrics=METRICS):
+    print(f"\n{baseline['label']} -> {current['label']}")
+    print(f"{'route':<14}{'metric':<15}{'before':>12}{'after':>12}{'change':>9}")
+    for route, metric, old, new, change in compare(baseline, current, metrics):
+        delta = "-" if change is None else f"{change:+.1%}"
+        print(f"{route:<14}{metric:<15}{_fmt(metric, old):>12}{_fmt(metric, new):>12}{delta:>9}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL, help="app origin (a `vite preview` build is recommended)")
+    parser.add_argument("--routes", type=lambda v: v.split(","), default=list(DEFAULT_ROUTES),
+                        help="comma-separated route paths")
+    parser.add_argument("--runs", type=int, default=5, help="cold loads per route")
+    parser.add_argument("--quiet-ms", type=int, default=QUIET_MS, help="quiet window that ends time-to-interactive")
+    parser.add_argument("--cpu-throttle", type=float, default=1, help="CPU slowdown factor (Chromium)")
+    parser.add_argument("--network", choices=NETWORK_PROFILES, help="emulated network (Chromium)")
+    parser.add_argument("--latency", choices=LATENCY_PROFILES, default=DEFAULT_LATENCY,
+                        help="mock Operator API latency profile (as in the runner)")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--label", default="current", help="name of this measurement")
+    parser.add_argument("-o", "--output", type=pathlib.Path, help="default: tmp/startup-<label>.json")
+    parser.add_argument("--baseline", type=pathlib.Path, help="earlier result file to compare with")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    routes = asyncio.run(run(args.base_url, args.routes, args.runs, not args.headed,
+                             args.cpu_throttle, args.network, args.quiet_ms, args.latency))
+    result = {
+        "label": args.label,
+        "baseUrl": args.base_url,
+        "runs": args.runs,
+        "cpuThrottle": args.cpu_throttle,
+        "network": args.network,
+        "latency": args.latency,
+        "routes": routes,
+    }
+    output = args.output or TESTS_DIR / "tmp" / f"startup-{args.label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    if args.baseline:
+        print_comparison(json.loads(args.baseline.read_text()), result)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,283 @@
+"""Seeded browser-state fixtures for the TC scripts.
+
+Rebuilding app state through the UI in every case is slow. A state fixture
+is built once by driving the app, captured as a JSON snapshot of the origin's
+persisted state (every localStorage key plus a full dump of every IndexedDB
+database: schema and records), and restored into fresh contexts in
+milliseconds:
+
+    page = await state.restore(context, "sales_lab_saved_session")
+    await waits.goto(page, "http://localhost:5173/sales-lab")
+
+Snapshots are cached in ``tmp/state/<name>.json`` and reused until deleted or
+refreshed (``python -m harness.runner --refresh-state`` or
+``TC_REFRESH_STATE=1``). Recipes run in a context opened by ``context_opener``,
+which the runner and ``conftest.py`` set so it is prepared like a case's
+(default timeout, latency profile, Gemini fixtures recorded or replayed as
+``state_<name>``); the snapshot is taken once the UI has settled and every
+write the app batches for an idle callback has been committed. State the app keeps only in memory (React state,
+zustand stores other than the chat history) is not captured either: a
+restored page starts from what a reload would see.
+"""
+import asyncio
+import contextlib
+import functools
+import json
+import os
+import pathlib
+import time
+
+from harness import locators, waits
+
+BASE_URL = os.environ.get("TC_BASE_URL", "http://localhost:5173")
+STATE_DIR = pathlib.Path(__file__).resolve().parent.parent / "tmp" / "state"
+# Served by route interception, so restoring never boots the app
+BLANK_PATH = "/__state_fixture__"
+BLANK_HTML = "<!doctype html><meta charset=utf-8><title>state fixture</title>"
+
+# UI settled and no write queued for an idle callback (StorageAdapter, chatHistory; see appActivity.js)
+SAVED_JS = """() => {
+    const root = document.documentElement;
+    return !root.hasAttribute('data-app-busy') && !root.hasAttribute('data-app-saving');
+}"""
+SAVED_TIMEOUT_MS = 30000
+
+REFRESH = os.environ.get("TC_REFRESH_STATE") == "1"
+
+TUTOR_QUESTION = "Hello, can you explain the difference between OLED and QNED?"
+
+
+DUMP_JS = """
+async () => {
+    const toBase64 = (bytes) => {
+        let binary = '';
+        for (let i = 0; i < bytes.length; i += 0x8000) {
+            binary += String.fromCharCode(...bytes.subarray(i, i + 0x8000));
+        }
+        return btoa(binary);
+    };
+    const encode = async (value) => {
+        if (value instanceof Date) return { $date: value.toISOString() };
+        if (value instanceof Blob) {
+            return { $blob: toBase64(new Uint8Array(await value.arrayBuffer())), type: value.type };
+        }
+        if (value instanceof ArrayBuffer) return { $bytes: toBase64(new Uint8Array(value)) };
+        if (ArrayBuffer.isView(value)) {
+            return { $bytes: toBase64(new Uint8Array(value.buffer, value.byteOffset, value.byteLength)) };
+        }
+        if (Array.isArray(value)) return Promise.all(value.map(encode));
+        if (value && typeof value === 'object') {
+            const out = {};
+            for (const [k, v] of Object.entries(value)) out[k] = await encode(v);
+            return out;
+        }
+        return value;
+    };
+    const request = (req) => new Promise((resolve, reject) => {
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+    });
+
+    const localStorageDump = Object.fromEntries(
+        Array.from({ length: localStorage.length }, (_, i) => localStorage.key(i))
+            .map(key => [key, localStorage.getItem(key)])
+    );
+
+    const databases = [];
+    for (const { name, version } of await indexedDB.databases()) {
+        const db = await request(indexedDB.open(name));
+        const stores = [];
+        for (const storeName of db.objectStoreNames) {
+            const store = db.transaction(storeName, 'readonly').objectStore(storeName);
+            const indexes = Array.from(store.indexNames, indexName => {
+                const index = store.index(indexName);
+                return { name: indexName, keyPath: index.keyPath, unique: index.unique, multiEntry: index.multiEntry };
+            });
+            const [keys, values] = await Promise.all([request(store.getAllKeys()), request(store.getAll())]);
+            stores.push({
+                name: storeName,
+                keyPath: store.keyPath,
+                autoIncrement: store.autoIncrement,
+                indexes,
+                records: await Promise.all(values.map(async (value, i) => ({
+                    key: store.keyPath === null ? await encode(keys[i]) : undefined,
+                    value: await encode(value)
+                })))
+            });
+        }
+        db.close();
+        databases.push({ name, version, stores });
+    }
+    return { origin: location.origin, localStorage: localStorageDump, indexedDB: databases };
+}
+"""
+
+RESTORE_JS = """
+async (snapshot) => {
+    const decode = (value) => {
+        if (Array.isArray(value)) return value.map(decode);
+        if (value && typeof value === 'object') {
+            const bytes = (b64) => Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+            if ('$date' in value) return new Date(value.$date);
+            if ('$blob' in value) return new Blob([bytes(value.$blob)], { type: value.type });
+            if ('$bytes' in value) return bytes(value.$bytes).buffer;
+            return Object.fromEntries(Object.entries(value).map(([k, v]) => [k, decode(v)]));
+        }
+        return value;
+    };
+    const request = (req) => new Promise((resolve, reject) => {
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+        req.onblocked = () => reject(new Error(`IndexedDB ${req} blocked`));
+    });
+
+    localStorage.clear();
+    for (const [key, value] of Object.entries(snapshot.localStorage)) localStorage.setItem(key, value);
+
+    for (const { name } of await indexedDB.databases()) await request(indexedDB.deleteDatabase(name));
+    for (const database of snapshot.indexedDB) {
+        const open = indexedDB.open(database.name, database.version);
+        open.onupgradeneeded = () => {
+            for (const spec of database.stores) {
+                const store = open.result.createObjectStore(spec.name, {
+                    keyPath: spec.keyPath, autoIncrement: spec.autoIncrement
+                });
+                for (const index of spec.indexes) {
+                    store.createIndex(index.name, index.keyPath, { unique: index.unique, multiEntry: index.multiEntry });
+                }
+            }
+        };
+        const db = await request(open);
+        const names = database.stores.map(s => s.name);
+        if (names.length) {
+            const tx = db.transaction(names, 'readwrite');
+            for (const spec of database.stores) {
+                const store = tx.objectStore(spec.name);
+                for (const record of spec.records) {
+                    if (spec.keyPath === null) store.put(decode(record.value), decode(record.key));
+                    else store.put(decode(record.value));
+                }
+            }
+            await new Promise((resolve, reject) => {
+                tx.oncomplete = resolve;
+                tx.onerror = () => reject(tx.error);
+            });
+        }
+        db.close();
+    }
+}
+"""
+
+# ``opener(name)`` -> async context manager yielding the context a snapshot is built in
+context_opener = None
+
+_builders = {}
+_locks = {}
+_built_this_run = set()
+
+
+def fixture(name):
+    """Register ``async def recipe(page, base_url)`` as the builder of snapshot ``name``."""
+    def register(build):
+        _builders[name] = build
+        return build
+    return register
+
+
+def snapshot_path(name):
+    return STATE_DIR / f"{name}.json"
+
+
+async def _blank_page(context, base_url):
+    """A page on the app's origin that does not load the app."""
+    async def serve(route):
+        await route.fulfill(status=200, content_type="text/html", body=BLANK_HTML)
+
+    await context.route(f"{base_url}{BLANK_PATH}", serve)
+    page = await context.new_page()
+    await page.goto(f"{base_url}{BLANK_PATH}")
+    await context.unroute(f"{base_url}{BLANK_PATH}", serve)
+    return page
+
+
+async def capture(page):
+    """Dump the persisted state of ``page``'s origin."""
+    return await page.evaluate(DUMP_JS)
+
+
+@contextlib.asynccontextmanager
+async def _bare_context(browser, name):
+    context = await browser.new_context()
+    try:
+        yield context
+    finally:
+        await context.close()
+
+
+async def build(browser, name, base_url=BASE_URL):
+    """Run the recipe for ``name`` in a throwaway context and write its snapshot."""
+    if name not in _builders:
+        raise KeyError(f"unknown state fixture {name!r} (known: {', '.join(sorted(_builders))})")
+    started = time.perf_counter()
+    opener = context_opener or functools.partial(_bare_context, browser)
+    async with opener(name) as context:
+        page = await context.new_page()
+        await _builders[name](page, base_url)
+        await page.wait_for_function(SAVED_JS, timeout=SAVED_TIMEOUT_MS)
+        snapshot = await capture(page)
+    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    snapshot_path(name).write_text(json.dumps(snapshot, ensure_ascii=False))
+    print(f"[state] built {name} in {time.perf_counter() - started:.2f}s", flush=True)
+    return snapshot
+
+
+async def ensure(browser, name, base_url=BASE_URL):
+    """Return the snapshot for ``name``, building it once per run if missing or refreshed."""
+    lock = _locks.setdefault(name, asyncio.Lock())
+    async with lock:
+        path = snapshot_path(name)
+        if path.exists() and not (REFRESH and name not in _built_this_run):
+            return json.loads(path.read_text())
+        _built_this_run.add(name)
+        return await build(browser, name, base_url)
+
+
+async def restore(context, name, base_url=BASE_URL):
+    """Load snapshot ``name`` into ``context``; returns a page on the app origin, ready for goto."""
+    snapshot = await ensure(context.browser, name, base_url)
+    page = await _blank_page(context, base_url)
+    await page.evaluate(RESTORE_JS, snapshot)
+    return page
+
+
+# --- Recipes ---------------------------------------------------------------
+
+@fixture("app_ready")
+async def _app_ready(page, base_url):
+    """First-run state: IndexedDB schema created and the Sales Lab bootstrap loaded once."""
+    await waits.goto(page, base_url)
+    await waits.goto(page, f"{base_url}/sales-lab")
+    await locators.on(page)("setup.start").wait_for()
+
+
+@fixture("sales_lab_saved_session")
+async def _sales_lab_saved_session(page, base_url):
+    """A Sales Lab roleplay with one exchange, saved via Save & Exit (Resume is offered)."""
+    ui = locators.on(page)
+    await _app_ready(page, base_url)
+    await waits.click(page, ui("setup.start"))
+    await waits.fill(page, ui("chat.input"), "Hello, I would like to know more about the AI Processor Alpha 11.")
+    await waits.click(page, ui("chat.send"))
+    await waits.click(page, ui("chat.exit"))
+    await waits.click(page, ui("exit.save"))
+    await page.wait_for_function("() => localStorage.getItem('salesLab_savedSession') !== null")
+
+
+@fixture("tutor_chat_history")
+async def _tutor_chat_history(page, base_url):
+    """The saved Sales Lab session plus an AI Tutor question and its reply, in IndexedDB."""
+    ui = locators.on(page)
+    await _sales_lab_saved_session(page, base_url)
+    await waits.goto(page, f"{base_url}/ai-trainer")
+    await waits.fill(page, ui("tutor.input"), TUTOR_QUESTION)
+    await waits.click(page, ui("tutor.send"))
@@ -0,0 +1,224 @@
+"""Streaming-render benchmark: frames dropped and CPU time per long tutor reply.
+
+Asks the AI Tutor (``/ai-trainer``) one question while the Gemini stand-in
+streams back a markdown reply of ``--tokens`` tokens (about four characters
+each: headings, bold bullet lists, tables and numbered scripts, like the
+tutor's real answers) in ``--chunk-chars`` pieces every
+``--chunk-interval-ms``. From the click on send until the reply has settled,
+it records:
+
+* frames -- ``requestAnimationFrame`` timestamps in the page; every gap is
+  counted as ``round(gap / 16.7 ms) - 1`` dropped frames, plus the longest
+  frame;
+* long tasks -- count and total duration;
+* CPU time -- the renderer's ``TaskDuration`` (and its script, layout and
+  style-recalc parts) from the DevTools ``Performance`` domain.
+
+The dev server must use the stand-in, which the benchmark starts itself:
+
+    VITE_GEMINI_API_KEY=offline VITE_GEMINI_BASE_URL=http://127.0.0.1:8787 npm run dev
+    cd testsprite_tests
+    python -m harness.streaming --label after --baseline tmp/streaming-before.json
+
+Results go to ``tmp/streaming-<label>.json`` (medians plus every sample);
+``--baseline`` prints the medians next to an earlier result's. Demo mode must
+be off, or the app streams its canned reply instead.
+"""
+import argparse
+import asyncio
+import json
+import pathlib
+
+from harness import locators, waits
+from harness.gemini_stub import GeminiStub, StubConfig, scripted_reply
+from harness.startup import emulate, median, print_comparison
+from harness.state import BASE_URL
+
+TESTS_DIR = pathlib.Path(__file__).resolve().parent.parent
+ROUTE = "/ai-trainer"
+QUESTION = "Walk me through selling a premium OLED TV, from greeting to closing."
+CHARS_PER_TOKEN = 4
+FRAME_MS = 1000 / 60
+
+METRICS = ("droppedFrames", "longestFrameMs", "longTasks", "longTaskMs", "cpuMs", "scriptMs",
+           "layoutMs", "styleMs", "wallMs")
+
+TOPICS = ("Greeting and first impression", "Needs discovery", "Picture quality", "Gaming features",
+          "Sound and connectivity", "Handling price objections", "Warranty and services", "Closing the sale")
+
+POINTS = (
+    ("Ask before you pitch", "find out the room, the viewing distance and who watches what."),
+    ("Demonstrate, don't describe", "switch the demo unit to a dark scene and let the contrast speak."),
+    ("Tie features to benefits", "self-lit pixels mean perfect blacks for movie nights, not just a spec."),
+    ("Check understanding", "pause and ask which of these matters most to them."),
+)
+
+TABLE = """| Model | Panel | Refresh rate | Best for |
+|---|---|---|---|
+| OLED evo C4 | Self-lit OLED | 144Hz | Movies and gaming |
+| QNED 85 | Mini LED | 120Hz | Bright living rooms |
+| UHD UT80 | LED | 60Hz | Everyday viewing |
+"""
+
+SPEECH = "Start with the customer's needs, demonstrate the picture, and close with the warranty and delivery offer."
+
+
+def tutor_markdown(tokens=2000):
+    """A deterministic tutor reply of about ``tokens`` tokens, in the tutor's ---SPEECH--- format."""
+    parts = ["Great question! Here is a complete walkthrough you can use on the floor today.\n"]
+    section = 0
+    while sum(len(p) + 1 for p in parts) < tokens * CHARS_PER_TOKEN:
+        topic = TOPICS[section % len(TOPICS)]
+        section += 1
+        parts.append(f"### {section}. {topic}\n")
+        parts.append(f"When the conversation turns to **{topic.lower()}**, keep it about the customer. "
+                     "Listen first, then connect what they said to one concrete feature on the wall.\n")
+        parts.append("\n".join(f"- **{label}**: {detail}" for label, detail in POINTS) + "\n")
+        if section % 2 == 0:
+            parts.append(TABLE)
+        if section % 3 == 0:
+            parts.append("1. \"What do you mostly watch?\"\n2. \"Let me show you the difference.\"\n"
+                         "3. \"Shall I check delivery for this weekend?\"\n")
+    return "\n".join(parts) + "\n---SPEECH---\n" + SPEECH
+
+
+def reply_with(text):
+    """Stand-in replies: ``text`` for AI Tutor requests, the scripted ones otherwise."""
+    def reply(body):
+        system = body.get("systemInstruction") or {}
+        if "---SPEECH---" in "".join(part.get("text", "") for part in system.get("parts", [])):
+            return text
+        return scripted_reply(body)
+    return reply
+
+
+FRAMES_JS = """
+(() => {
+    const state = window.__agFrames = { running: false, stamps: [], longTasks: [] };
+    try {
+        new PerformanceObserver(list => {
+            if (state.running) for (const e of list.getEntries()) state.longTasks.push(e.duration);
+        }).observe({ type: 'longtask' });
+    } catch (e) { /* entry type not supported */ }
+    state.start = () => {
+        Object.assign(state, { running: true, stamps: [], longTasks: [] });
+        const tick = t => {
+            if (!state.running) return;
+            state.stamps.push(t);
+            requestAnimationFrame(tick);
+        };
+        requestAnimationFrame(tick);
+    };
+    state.stop = () => {
+        state.running = false;
+        return { stamps: state.stamps, longTasks: state.longTasks };
+    };
+})();
+"""
+
+
+def frame_stats(stamps):
+    gaps = [b - a for a, b in zip(stamps, stamps[1:])]
+    return {
+        "frames": len(stamps),
+        "droppedFrames": sum(max(0, round(gap / FRAME_MS) - 1) for gap in gaps),
+        "longestFrameMs": round(max(gaps), 1) if gaps else None,
+    }
+
+
+async def cpu_metrics(cdp):
+    metrics = {m["name"]: m["value"] for m in (await cdp.send("Performance.getMetrics"))["metrics"]}
+    return {key: metrics.get(name, 0.0) * 1000 for key, name in (
+        ("cpuMs", "TaskDuration"), ("scriptMs", "ScriptDuration"),
+        ("layoutMs", "LayoutDuration"), ("styleMs", "RecalcStyleDuration"))}
+
+
+async def measure(browser, base_url, cpu_throttle=1):
+    """Ask the tutor once in a fresh context and return one sample."""
+    context = await browser.new_context()
+    try:
+        await context.add_init_script(FRAMES_JS)
+        page = await context.new_page()
+        await emulate(context, page, cpu_throttle, None)
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Performance.enable")
+        ui = locators.on(page)
+        await waits.goto(page, base_url.rstrip("/") + ROUTE)
+        await waits.fill(page, ui("tutor.input"), QUESTION)
+
+        before = await cpu_metrics(cdp)
+        await page.evaluate("() => window.__agFrames.start()")
+        started = asyncio.get_running_loop().time()
+        await waits.click(page, ui("tutor.send"))
+        wall_ms = (asyncio.get_running_loop().time() - started) * 1000
+        frames = await page.evaluate("() => window.__agFrames.stop()")
+        after = await cpu_metrics(cdp)
+    finally:
+        await context.close()
+    return {
+        **frame_stats(frames["stamps"]),
+        "longTasks": len(frames["longTasks"]),
+        "longTaskMs": round(sum(frames["longTasks"]), 1),
+        **{key: round(after[key] - before[key], 1) for key in after},
+        "wallMs": round(wall_ms, 1),
+    }
+
+
+async def run(args):
+    from playwright.async_api import async_playwright
+
+    text = tutor_markdown(args.tokens)
+    config = StubConfig(port=args.stub_port, latency_ms=args.latency_ms, chunk_chars=args.chunk_chars,
+                        chunk_interval_ms=args.chunk_interval_ms)
+    samples = []
+    async with GeminiStub(config, reply=reply_with(text)) as stub, async_playwright() as pw:
+        print(f"Gemini stand-in on {stub.base_url} (dev server needs VITE_GEMINI_BASE_URL={stub.base_url})")
+        print(f"reply: {len(text)} chars, ~{len(text) // CHARS_PER_TOKEN} tokens, "
+              f"{-(-len(text) // args.chunk_chars)} chunks", flush=True)
+        browser = await pw.chromium.launch(headless=not args.headed)
+        try:
+            for i in range(args.runs):
+                sample = await measure(browser, args.base_url, args.cpu_throttle)
+                samples.append(sample)
+                print(f"run {i + 1}: " + "  ".join(f"{m}={sample[m]}" for m in METRICS), flush=True)
+        finally:
+            await browser.close()
+    return {
+        "replyChars": len(text),
+        "chunks": -(-len(text) // args.chunk_chars),
+        "routes": {ROUTE: {"median": {m: median([s[m] for s in samples]) for m in METRICS}, "samples": samples}},
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--tokens", type=int, default=2000, help="length of the streamed reply")
+    parser.add_argument("--chunk-chars", type=int, default=8, help="characters per streamed chunk")
+    parser.add_argument("--chunk-interval-ms", type=int, default=5, help="gap between chunks")
+    parser.add_argument("--latency-ms", type=int, default=50, help="stand-in delay before the first chunk")
+    parser.add_argument("--stub-port", type=int, default=StubConfig().port)
+    parser.add_argument("--cpu-throttle", type=float, default=1, help="CPU slowdown factor (Chromium)")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--label", default="current", help="name of this measurement")
+    parser.add_argument("-o", "--output", type=pathlib.Path, help="default: tmp/streaming-<label>.json")
+    parser.add_argument("--baseline", type=pathlib.Path, help="earlier result file to compare with")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    result = {"label": args.label, "tokens": args.tokens, "chunkChars": args.chunk_chars,
+              "chunkIntervalMs": args.chunk_interval_ms, "cpuThrottle": args.cpu_throttle,
+              **asyncio.run(run(args))}
+    output = args.output or TESTS_DIR / "tmp" / f"streaming-{args.label}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    if args.baseline:
+        print_comparison(json.loads(args.baseline.read_text()), result, METRICS)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
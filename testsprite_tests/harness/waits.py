@@ -0,0 +1,109 @@
+"""Event-driven readiness waits for the TC scripts.
+
+The generated scripts used to sleep ``wait_for_timeout(3000)`` before every
+action. These helpers wait on real signals instead:
+
+* locator actionability -- Playwright's own auto-wait inside ``click``/``fill``;
+* Gemini network idle -- no ``generateContent``/``streamGenerateContent``
+  request in flight for the page's context;
+* the app's render-settled marker -- ``<html data-app-busy>`` is removed by
+  ``src/lib/appActivity.js`` one frame after the last AI/operator call commits;
+* a short DOM quiet window so enter/exit animations have swapped their nodes.
+
+Every action settles *after* it runs, so the next step always starts from a
+settled page.
+"""
+import asyncio
+import re
+import weakref
+
+GEMINI_URL = re.compile(r"generativelanguage\.googleapis\.com|:(stream)?[gG]enerateContent")
+
+ACTION_TIMEOUT_MS = 5000
+SETTLE_TIMEOUT_MS = 30000
+DOM_QUIET_MS = 50
+
+_APP_IDLE_JS = "() => !document.documentElement.hasAttribute('data-app-busy')"
+
+# Resolves once no node has been added/removed/retexted for `quietMs`.
+_DOM_QUIET_JS = """([quietMs, maxMs]) => new Promise(resolve => {
+    if (!document.body) return resolve();
+    let timer;
+    const done = () => { observer.disconnect(); clearTimeout(timer); clearTimeout(cap); resolve(); };
+    const observer = new MutationObserver(() => { clearTimeout(timer); timer = setTimeout(done, quietMs); });
+    observer.observe(document.body, { childList: true, subtree: true, characterData: true });
+    timer = setTimeout(done, quietMs);
+    const cap = setTimeout(done, maxMs);
+})"""
+
+_trackers = weakref.WeakKeyDictionary()
+
+
+class NetworkTracker:
+    """Counts in-flight Gemini requests for one browser context."""
+
+    def __init__(self, context, pattern=GEMINI_URL):
+        self.pattern = pattern
+        self.in_flight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        context.on("request", self._on_start)
+        context.on("requestfinished", self._on_end)
+        context.on("requestfailed", self._on_end)
+
+    def _matches(self, request):
+        return bool(self.pattern.search(request.url))
+
+    def _on_start(self, request):
+        if self._matches(request):
+            self.in_flight += 1
+            self._idle.clear()
+
+    def _on_end(self, request):
+        if self._matches(request):
+            self.in_flight = max(0, self.in_flight - 1)
+            if self.in_flight == 0:
+                self._idle.set()
+
+    async def idle(self, timeout_ms=SETTLE_TIMEOUT_MS):
+        await asyncio.wait_for(self._idle.wait(), timeout_ms / 1000)
+
+
+def track_network(context):
+    """Return the context's tracker, installing it on first use."""
+    tracker = _trackers.get(context)
+    if tracker is None:
+        tracker = _trackers[context] = NetworkTracker(context)
+    return tracker
+
+
+async def settled(page, timeout_ms=SETTLE_TIMEOUT_MS):
+    """Wait until the app marker is clear, Gemini traffic is idle and the DOM is quiet."""
+    if page.url.startswith("about:"):
+        return
+    await page.wait_for_function(_APP_IDLE_JS, timeout=timeout_ms)
+    await track_network(page.context).idle(timeout_ms)
+    await page.evaluate(_DOM_QUIET_JS, [DOM_QUIET_MS, timeout_ms])
+    # The network may have been idle only because the call had not started yet.
+    await page.wait_for_function(_APP_IDLE_JS, timeout=timeout_ms)
+
+
+async def goto(page, url, timeout_ms=10000):
+    track_network(page.context)
+    await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+    await settled(page)
+
+
+async def click(page, locator, timeout_ms=ACTION_TIMEOUT_MS):
+    await locator.click(timeout=timeout_ms)
+    await settled(page)
+
+
+async def fill(page, locator, text, timeout_ms=ACTION_TIMEOUT_MS):
+    await locator.fill(text, timeout=timeout_ms)
+    await settled(page)
+
+
+async def scroll(page, dx=0, dy=200):
+    await page.mouse.wheel(dx, dy)
+    await settled(page)
@@ -0,0 +1,19 @@
+"""One pytest test per TC script, on the session browsers from ``conftest.py``."""
+import pytest
+
+from harness.runner import discover
+
+# Admin and navigation flows: no Gemini traffic, a few seconds each
+SMOKE = {"TC007", "TC008", "TC010", "TC011", "TC013"}
+
+
+def _params():
+    for case in discover():
+        marks = [pytest.mark.full] + ([pytest.mark.smoke] if case.case_id in SMOKE else [])
+        yield pytest.param(case, id=case.case_id, marks=marks)
+
+
+@pytest.mark.parametrize("case", list(_params()))
+async def test_case(case, tc_session):
+    await case.load().run_case(tc_session.context)
+    tc_session.check()
@@ -12,6 +12,25 @@ const dirname = typeof __dirname !== 'undefined' ? __dirname : path.dirname(file
 // More info at: https://storybook.js.org/docs/next/writing-tests/integrations/vitest-addon
 export default defineConfig({
   plugins: [react()],
+  // pdf.js (bundled into the PDF text worker) loads code dynamically, which needs ES module workers
+  worker: {
+    format: 'es'
+  },
+  build: {
+    rollupOptions: {
+      output: {
+        // Vendor code changes less often than the app: own chunks stay cached across deploys,
+        // and heavy libraries load only with the lazy route screens that use them
+        manualChunks: {
+          react: ['react', 'react-dom', 'react-router-dom'],
+          motion: ['framer-motion'],
+          charts: ['recharts'],
+          markdown: ['react-markdown', 'remark-gfm'],
+          gemini: ['@google/generative-ai']
+        }
+      }
+    }
+  },
   test: {
     projects: [{
       extends: true,